@@ -1,100 +1,453 @@
 """Pytest configuration for OrangeHRM test automation.
 
-Contains fixtures for WebDriver setup/teardown and test assets.
+Contains fixtures for WebDriver setup/teardown (via a session browser pool)
+and test assets.
 """
+import functools
+import json
 import os
-import base64
 
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import pytest_html
+except ImportError:  # pytest-html is optional for plain console runs
+    pytest_html = None
 
-@pytest.fixture(scope="session", autouse=True)
-def ensure_test_assets():
-    """Ensure required test assets exist before running tests.
+from support.animations import AnimationSwitch, animations_disabled
+from support.api import DataSeeder, OrangeHRMApi
+from support.assets import AssetFactory, format_size, upload_sizes
+from support.browser import launch_chrome, quit_chrome
+from support.browser_pool import BrowserPool
+from support.downloads import DownloadError, DownloadManager
+from support.driver_resolver import Resolution, resolve_chromedriver
+from support.har import HarCapture, har_enabled
+from support.http_cache import CachingProxy, HttpCache, cache_mode
+from support.launch_profile import launch_profile
+from support.page_metrics import MetricsCollector, PageMetricsAggregate, metrics_enabled
+from support.profiler import CommandProfiler, profiling_enabled
+from support.request_blocking import BlockingPolicy, RequestBlocker, blocking_enabled
+from support.session_cache import SessionCache, login_with_cache
+from support.transfer_benchmark import TransferBenchmark
+from support.unique import worker_name
+from support.xhr_tracker import XhrTracker
+from standin import StandinServer, standin_enabled
 
-    - Creates tests/test_data directory
-    - Ensures profile_image.png exists (writes a tiny 1x1 PNG if missing)
-    - Ensures sample_attachment.txt exists (writes placeholder if missing)
+browser_pool_key = pytest.StashKey[BrowserPool]()
+chromedriver_key = pytest.StashKey[Resolution]()
+session_cache_key = pytest.StashKey[SessionCache]()
+profiler_key = pytest.StashKey[CommandProfiler]()
+standin_key = pytest.StashKey[StandinServer]()
+http_cache_key = pytest.StashKey[CachingProxy]()
+request_blocker_key = pytest.StashKey[RequestBlocker]()
+assets_key = pytest.StashKey[AssetFactory]()
+transfer_benchmark_key = pytest.StashKey[TransferBenchmark]()
+page_metrics_key = pytest.StashKey[PageMetricsAggregate]()
+har_capture_key = pytest.StashKey[HarCapture]()
+
+pytest_plugins = ["support.duration_plugin", "support.steps", "support.sleep_guard", "support.wait_report"]
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "network(allow=(), deny=(), blocking=True): adjust the request-blocking policy for one test",
+    )
+    config.addinivalue_line(
+        "markers",
+        "animations: keep CSS animations, transitions and the normal toast timeout for one test",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "upload_size" in metafunc.fixturenames:
+        sizes = upload_sizes()
+        metafunc.parametrize("upload_size", sizes, ids=[format_size(size) for size in sizes])
+
+
+@pytest.fixture(scope="session")
+def assets(request):
+    """Deterministic upload files of a given type and size, cached under tests/.cache/assets.
+
+    Tests taking ``upload_size`` run once per size in UPLOAD_SIZES
+    (comma-separated, e.g. ``64KB,1MB,5MB``; default 64KB).
     """
     base_dir = os.path.dirname(__file__)
-    data_dir = os.path.join(base_dir, "test_data")
-    os.makedirs(data_dir, exist_ok=True)
+    factory = AssetFactory(os.path.join(base_dir, ".cache", "assets"))
+    request.config.stash[assets_key] = factory
+    return factory
+
+
+@pytest.fixture(scope="session")
+def transfer_benchmark(request):
+    """Per-phase upload/download timings; appended to tests/.cache/transfer_benchmark.jsonl at session end."""
+    benchmark = TransferBenchmark()
+    request.config.stash[transfer_benchmark_key] = benchmark
+    yield benchmark
+    # Imported here: importing the plugin module before pytest loads it defeats its assertion rewriting.
+    from support.duration_plugin import run_id_key
+    from support.durations import new_run_id
+    benchmark.append(request.config.stash.get(run_id_key, None) or new_run_id())
 
-    # Write a tiny transparent 1x1 PNG if missing
-    png_path = os.path.join(data_dir, "profile_image.png")
-    if not os.path.exists(png_path):
-        tiny_png_b64 = (
-            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAASUVORK5CYII="
-        )
-        with open(png_path, "wb") as f:
-            f.write(base64.b64decode(tiny_png_b64))
 
-    txt_path = os.path.join(data_dir, "sample_attachment.txt")
-    if not os.path.exists(txt_path):
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write("Sample attachment content for OrangeHRM personal details attachment test.\n")
+@pytest.fixture(scope="session")
+def chromedriver(request):
+    """The chromedriver binary for the installed Chrome, resolved once per session.
+
+    Served from tests/.cache/chromedriver without any network call once
+    cached; CHROMEDRIVER_OFFLINE=1 turns a cache miss into an error instead
+    of a download.
+    """
+    resolution = resolve_chromedriver()
+    request.config.stash[chromedriver_key] = resolution
+    return resolution
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, chromedriver):
+    """Session-wide pool of warm Chrome instances.
+
+    BROWSER_POOL_SIZE browsers (default 1) are launched in parallel when the
+    fixture is created and kept warm between leases; each browser is recycled after BROWSER_POOL_MAX_USES leases (default 25).
+    Launches slower than BROWSER_STARTUP_BUDGET seconds (default 10) raise a
+    StartupBudgetWarning. BROWSER_PROFILE=fast launches every browser with
+    the fast profile (support.launch_profile). Download directories live under
+    tests/downloads/<worker>/ (support.unique.worker_name).
+    """
+    base_dir = os.path.dirname(__file__)
+    pool = BrowserPool(
+        functools.partial(launch_chrome, driver_path=chromedriver.path),
+        download_root=os.path.join(base_dir, "downloads", worker_name() or "main"),
+        size=int(os.getenv("BROWSER_POOL_SIZE", "1")),
+        max_uses=int(os.getenv("BROWSER_POOL_MAX_USES", "25")),
+        quit_fn=quit_chrome,
+        startup_budget=float(os.getenv("BROWSER_STARTUP_BUDGET", "10")),
+    )
+    request.config.stash[browser_pool_key] = pool
+    pool.warm()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def command_profiler(request):
+    """WebDriver command profiler, enabled with PROFILE_WEBDRIVER=1 (None otherwise)."""
+    if not profiling_enabled():
+        yield None
+        return
+    profiler = CommandProfiler()
+    request.config.stash[profiler_key] = profiler
+    yield profiler
+    base_dir = os.path.dirname(__file__)
+    worker = worker_name()
+    name = f"webdriver_profile-{worker}.json" if worker else "webdriver_profile.json"
+    profiler.dump(os.path.join(base_dir, ".cache", name))
+
+
+@pytest.fixture(scope="session")
+def request_blocker(request):
+    """Blocks analytics, web fonts and decorative images (REQUEST_BLOCKING=0 to disable)."""
+    if not blocking_enabled():
+        yield None
+        return
+    base_dir = os.path.dirname(__file__)
+    blocker = RequestBlocker(BlockingPolicy.from_env(), os.path.join(base_dir, ".cache", "request_sizes.json"))
+    request.config.stash[request_blocker_key] = blocker
+    yield blocker
+    blocker.save()
 
 
 @pytest.fixture(scope="function")
-def driver():
+def browser(request, browser_pool, command_profiler, request_blocker):
     """
-    WebDriver fixture that sets up and tears down the browser for each test.
-    Uses Chrome browser with automatic driver management.
+    A warm browser leased from the session pool for one test.
+    The browser is reset (cookies, storage, tabs, downloads) when returned.
+    Animations are off (support.animations) unless the test is marked
+    ``@pytest.mark.animations`` or DISABLE_ANIMATIONS=0 is set. Every page
+    logs its XHR/fetch calls for ``BasePage.wait_for_api`` (support.xhr_tracker).
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option("useAutomationExtension", False)
-    chrome_options.add_argument("--window-size=1920,1080")
-    # Configure downloads directory
+    browser = browser_pool.acquire()
+    still = animations_disabled() or launch_profile() == "fast"
+    AnimationSwitch.of(browser.driver).apply(still and request.node.get_closest_marker("animations") is None)
+    XhrTracker.of(browser.driver)
+    if command_profiler is not None:
+        command_profiler.attach(browser.driver)
+    if request_blocker is not None:
+        request_blocker.apply(browser.driver, request.node.get_closest_marker("network"))
+    print("(Browser system messages suppressed)")
+    yield browser
+    if request_blocker is not None:
+        try:
+            request_blocker.collect(browser.driver)
+        except Exception as exc:
+            print(f"Warning: request counters not collected ({exc})")
+    browser_pool.release(browser)
+
+
+@pytest.fixture(scope="session")
+def page_metrics_aggregate(request):
+    """Per-page browser metrics of the session, enabled with PAGE_METRICS=1 (None otherwise)."""
+    if not metrics_enabled():
+        yield None
+        return
+    aggregate = PageMetricsAggregate()
+    request.config.stash[page_metrics_key] = aggregate
+    yield aggregate
     base_dir = os.path.dirname(__file__)
-    downloads_dir = os.path.join(base_dir, "downloads")
-    os.makedirs(downloads_dir, exist_ok=True)
-    prefs = {
-        "download.default_directory": downloads_dir,
-        "download.prompt_for_download": False,
-        "download.directory_upgrade": True,
-        "safebrowsing.enabled": True,
-        "profile.default_content_settings.popups": 0,
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
-    os.environ["DOWNLOAD_DIR"] = downloads_dir
-    if os.getenv("HEADLESS", "0").lower() in ("1", "true", "yes"):
-        chrome_options.add_argument("--headless=new")
-
-    # Suppress ChromeDriver/system error logs for cleaner output
-    chrome_options.add_argument("--log-level=3")  # Suppress most Chrome logs
-    service = Service(ChromeDriverManager().install())
-    service.log_output = os.devnull  # Suppress driver logs to console
+    worker = worker_name()
+    aggregate.dump(os.path.join(base_dir, ".cache", f"page_metrics-{worker}.json" if worker else "page_metrics.json"))
+
+
+@pytest.fixture(scope="function", autouse=True)
+def page_metrics(request, page_metrics_aggregate):
+    """CDP Performance/Network metrics snapshotted at every navigation and step boundary.
 
+    Only active for tests that use a browser; the snapshots are attached to
+    the test report as the ``page_metrics`` user property.
+    """
+    if page_metrics_aggregate is None or "browser" not in request.fixturenames:
+        yield None
+        return
+    browser = request.getfixturevalue("browser")
+    collector = MetricsCollector.attach(browser.driver, page_metrics_aggregate)
+    collector.begin()
+    yield collector
+    collector.snapshot("teardown")
+    request.node.user_properties.append(("page_metrics", json.dumps(collector.end())))
+
+
+@pytest.fixture(scope="session")
+def har_capture(request):
+    """HAR export for slow or failed steps, enabled with HAR_CAPTURE=1 (None otherwise).
+
+    HAR_STEP_THRESHOLD (seconds, default 5) is the step duration above which
+    a HAR file is written; HAR_BUFFER (default 500) bounds the requests kept
+    per browser. Files go to tests/reports/har/.
+    """
+    if not har_enabled():
+        return None
+    capture = HarCapture.from_env(os.path.join(os.path.dirname(__file__), "reports", "har"))
+    request.config.stash[har_capture_key] = capture
+    return capture
+
+
+@pytest.fixture(scope="function", autouse=True)
+def har_recorder(request, har_capture):
+    """Follows the leased browser's network requests while the test runs."""
+    if har_capture is None or "browser" not in request.fixturenames:
+        yield None
+        return
+    recorder = har_capture.recorder(request.getfixturevalue("browser").driver)
+    recorder.begin(request.node)
+    yield recorder
+    recorder.end()
+
+
+@pytest.fixture(scope="function")
+def driver(browser):
+    """WebDriver of the leased browser."""
+    return browser.driver
+
+
+@pytest.fixture(scope="function")
+def download_dir(browser):
+    """Where the leased browser saves downloads; private to this test and emptied afterwards."""
+    return browser.download_dir
+
+
+@pytest.fixture(scope="function")
+def downloads(browser):
+    """Download manager for the leased browser: ``downloads.wait()`` returns the next finished download.
+
+    Downloads are best effort: when the CDP event listener cannot connect, the
+    test still runs and ``downloads.wait()`` raises DownloadError.
+    """
+    manager = DownloadManager(browser.driver, browser.download_dir)
     try:
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-    except Exception:
-        driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)
+        manager.start()
+    except DownloadError as exc:
+        print(f"Warning: {exc}")
+    yield manager
+    manager.stop()
 
-    print("(Browser system messages suppressed)")
-    yield driver
 
+@pytest.fixture(scope="session")
+def session_cache(request, origin_url):
+    """Cookie cache for the authenticated session (TTL from SESSION_CACHE_TTL seconds), keyed on ``origin_url``."""
+    base_dir = os.path.dirname(__file__)
+    cache = SessionCache(
+        os.path.join(base_dir, ".cache", "session.json"),
+        ttl=int(os.getenv("SESSION_CACHE_TTL", "1200")),
+        origin=origin_url,
+    )
+    request.config.stash[session_cache_key] = cache
+    return cache
+
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, base_url, login_credentials, session_cache):
+    """
+    Browser already logged in as ``login_credentials`` and parked on the Dashboard.
+    Cached session cookies are injected; the UI login only runs when they are rejected.
+    """
+    login_with_cache(driver, base_url, login_credentials, session_cache)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def api(base_url, login_credentials, session_cache):
+    """REST client for test data; shares the cached session cookies with the browsers."""
+    return OrangeHRMApi.connect(base_url, login_credentials, session_cache)
+
+
+@pytest.fixture(scope="function")
+def seed(api):
+    """
+    Factory for API-created employees, supervisors, vacancies and candidates.
+    Everything it created is deleted when the test ends.
+    """
+    seeder = DataSeeder(api)
+    yield seeder
+    for error in seeder.cleanup():
+        print(f"Warning: seeded data not deleted ({error})")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the test's blocked/loaded request counts to its pytest-html result."""
+    outcome = yield
+    report = outcome.get_result()
+    blocker = item.config.stash.get(request_blocker_key, None)
+    browser = getattr(item, "funcargs", {}).get("browser")
+    if report.when != "call" or pytest_html is None or blocker is None or browser is None:
+        return
     try:
-        driver.quit()
+        stats = blocker.collect(browser.driver)
     except Exception:
-        try:
-            driver.service.stop()
-        except Exception:
-            pass
+        return
+    extras = getattr(report, "extras", [])
+    extras.append(pytest_html.extras.html(stats.render_html()))
+    report.extras = extras
+
+
+if pytest_html is not None:
+    def pytest_html_results_summary(prefix, summary, postfix, session):
+        blocker = session.config.stash.get(request_blocker_key, None)
+        if blocker is not None:
+            prefix.append(blocker.stats.render_html("Request blocking (session)"))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    resolution = config.stash.get(chromedriver_key, None)
+    if resolution is not None:
+        terminalreporter.section("chromedriver")
+        terminalreporter.write_line(resolution.summary_line())
+    pool = config.stash.get(browser_pool_key, None)
+    if pool is not None:
+        terminalreporter.section("browser pool")
+        for line in pool.stats.summary_lines():
+            terminalreporter.write_line(line)
+    cache = config.stash.get(session_cache_key, None)
+    if cache is not None:
+        terminalreporter.section("session cache")
+        terminalreporter.write_line(f"sessions reused: {cache.reused}, UI logins: {cache.logins}")
+    aggregate = config.stash.get(page_metrics_key, None)
+    if aggregate is not None and aggregate.pages:
+        terminalreporter.section("page metrics")
+        for line in aggregate.summary_lines(int(os.getenv("PAGE_METRICS_TOP", "15"))):
+            terminalreporter.write_line(line)
+    capture = config.stash.get(har_capture_key, None)
+    if capture is not None and capture.written:
+        terminalreporter.section("network waterfalls")
+        terminalreporter.write_line(f"{len(capture.written)} HAR files for steps over {capture.threshold:g}s or failed:")
+        for path in capture.written:
+            terminalreporter.write_line(f"  {os.path.relpath(path)}")
+    profiler = config.stash.get(profiler_key, None)
+    if profiler is not None:
+        terminalreporter.section("webdriver profile")
+        for line in profiler.summary_lines(int(os.getenv("PROFILE_WEBDRIVER_TOP", "15"))):
+            terminalreporter.write_line(line)
+    server = config.stash.get(standin_key, None)
+    if server is not None:
+        terminalreporter.section("orangehrm stand-in")
+        terminalreporter.write_line(f"{server.url}: {server.requests} requests served, {server.latency * 1000:.0f} ms injected latency each")
+    blocker = config.stash.get(request_blocker_key, None)
+    if blocker is not None:
+        terminalreporter.section("request blocking")
+        for line in blocker.stats.summary_lines():
+            terminalreporter.write_line(line)
+    proxy = config.stash.get(http_cache_key, None)
+    if proxy is not None:
+        terminalreporter.section(f"http cache ({proxy.mode})")
+        for line in proxy.stats.summary_lines():
+            terminalreporter.write_line(line)
+    factory = config.stash.get(assets_key, None)
+    if factory is not None:
+        terminalreporter.section("upload assets")
+        terminalreporter.write_line(f"generated: {factory.generated}, reused from cache: {factory.reused}")
+    benchmark = config.stash.get(transfer_benchmark_key, None)
+    if benchmark is not None and benchmark.samples:
+        terminalreporter.section("file transfer benchmark")
+        for line in benchmark.summary_lines():
+            terminalreporter.write_line(line)
 
 
 @pytest.fixture(scope="session")
-def base_url():
+def standin(request):
+    """Local OrangeHRM stand-in on a random port, enabled with STANDIN=1 (None otherwise).
+
+    STANDIN_LATENCY_MS adds a fixed delay to every response, so the framework's
+    own overhead can be benchmarked apart from the server's.
+    """
+    if not standin_enabled():
+        yield None
+        return
+    server = StandinServer(latency=int(os.getenv("STANDIN_LATENCY_MS", "0")) / 1000)
+    request.config.stash[standin_key] = server
+    with server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def origin_url(standin):
+    """The OrangeHRM server itself: the stand-in when enabled, otherwise the public demo."""
+    if standin is not None:
+        return standin.url
     return "https://opensource-demo.orangehrmlive.com"
 
 
+@pytest.fixture(scope="session")
+def http_cache(request, origin_url):
+    """Record/replay caching proxy in front of ``origin_url``, enabled with HTTP_CACHE=record|replay.
+
+    HTTP_CACHE_TTL (seconds, default one week) and HTTP_CACHE_MAX_MB (default
+    200) bound the store; HTTP_CACHE_API lists comma-separated ``api/v2`` path
+    prefixes whose GET responses may be cached as well.
+    """
+    mode = cache_mode()
+    if mode is None:
+        yield None
+        return
+    base_dir = os.path.dirname(__file__)
+    cache = HttpCache(
+        os.path.join(base_dir, ".cache", "http"),
+        ttl=int(os.getenv("HTTP_CACHE_TTL", str(7 * 24 * 3600))),
+        max_bytes=int(os.getenv("HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024,
+    )
+    cache.prune()
+    proxy = CachingProxy(origin_url, cache, mode, api_paths=os.getenv("HTTP_CACHE_API", "").split(","))
+    request.config.stash[http_cache_key] = proxy
+    with proxy:
+        yield proxy
+
+
+@pytest.fixture(scope="session")
+def base_url(origin_url, http_cache):
+    if http_cache is not None:
+        return http_cache.url
+    return origin_url
+
+
 @pytest.fixture(scope="session")
 def login_credentials():
     return {"username": "Admin", "password": "admin123"}
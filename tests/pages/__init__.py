@@ -0,0 +1,38 @@
+"""Page Objects for the OrangeHRM screens the suite drives.
+
+Locators are declared once per module through :mod:`pages.locators`; pages
+scope their lookups to a root element and resolve labelled form fields in a
+single script call (see :class:`pages.base.BasePage`).
+"""
+from .base import BasePage
+from .buzz import BuzzPage, CommentCard, PostCard
+from .login import DashboardPage, LoginPage
+from .pim import (
+    AddEmployeePage,
+    AttachmentsSection,
+    EmployeeListPage,
+    JobPage,
+    PersonalDetailsPage,
+    ReportToPage,
+)
+from .recruitment import AddCandidatePage, CandidatePage, RecruitmentPage
+from .reports import DefineReportPage
+
+__all__ = [
+    "AddCandidatePage",
+    "AddEmployeePage",
+    "AttachmentsSection",
+    "BasePage",
+    "BuzzPage",
+    "CandidatePage",
+    "CommentCard",
+    "DashboardPage",
+    "DefineReportPage",
+    "EmployeeListPage",
+    "JobPage",
+    "LoginPage",
+    "PersonalDetailsPage",
+    "PostCard",
+    "RecruitmentPage",
+    "ReportToPage",
+]
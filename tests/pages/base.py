@@ -0,0 +1,357 @@
+"""Base class shared by the OrangeHRM page objects.
+
+A page has a root element (``ROOT``, the main layout container by default)
+and scoped locators are evaluated inside it rather than against the whole
+document. Form fields are looked up by their visible label through
+:meth:`BasePage.fields`, which collects the label→control map of every OXD
+input group under the root in a single script execution instead of one
+label-relative XPath query per field.
+"""
+import time
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support import waits
+from support.xhr_tracker import XhrTracker
+
+from .locators import Locator, locator
+
+LAYOUT = locator("common.layout", By.CSS_SELECTOR, ".oxd-layout-context")
+MENU_ITEM = locator("common.menu_item", By.XPATH, "//span[text()={name}]")
+LINK = locator("common.link", By.XPATH, "//a[text()={text}]")
+OPTION = locator("common.option", By.XPATH, "//div[@role='option']//span[contains(text(),{text})]")
+LISTBOX_ITEM = locator("common.listbox_item", By.XPATH, "//div[@role='listbox']//span")
+LISTBOX_ITEM_NAMED = locator("common.listbox_item_named", By.XPATH, "//div[@role='listbox']//span[normalize-space(text())={text}]")
+SUBMIT = locator("common.submit", By.CSS_SELECTOR, "button[type='submit']")
+FILE_INPUT = locator("common.file_input", By.CSS_SELECTOR, "input[type='file']")
+FIELD_ERROR = locator("common.field_error", By.CSS_SELECTOR, "span.oxd-input-field-error-message")
+CONFIRM_DELETE = locator("common.confirm_delete", By.XPATH, "//button[@type='button' and contains(.,'Yes, Delete')]")
+
+# OXD renders every form field as .oxd-input-group > label-wrapper + control.
+# Builds ``labelled`` = {label text: first control} under ``root``; the first
+# group wins on duplicates.
+_LABELLED_JS = """
+const labelled = {};
+for (const group of root.querySelectorAll('.oxd-input-group')) {
+    const label = group.querySelector('label');
+    if (!label) continue;
+    const name = label.textContent.replace(/\\s+/g, ' ').trim();
+    const control = group.querySelector('input:not([type=hidden]), textarea, .oxd-select-text-input');
+    if (control && !(name in labelled)) labelled[name] = control;
+}
+"""
+
+_FIELDS_JS = "const root = arguments[0] || document;" + _LABELLED_JS + "return labelled;"
+
+# Sets every field of a form in one round-trip. Entries are [kind, key, value]
+# with kind "label" (OXD input group label) or "css". Values go through the
+# native value setter followed by input/change/blur events, which is what the
+# Vue v-model bindings of the OXD inputs listen to. After a task turn (Vue has
+# re-rendered) each field is read back; a field that did not keep its value is
+# reported "rejected" so the caller can type into it instead. OXD selects are
+# not inputs and are reported as "select".
+_FILL_JS = """
+const root = arguments[0] || document, entries = arguments[1], done = arguments[arguments.length - 1];
+""" + _LABELLED_JS + """
+const setters = {
+    input: Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set,
+    textarea: Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set,
+};
+const results = [], written = [];
+entries.forEach(([kind, key, value], i) => {
+    const el = kind === 'label' ? labelled[key] : root.querySelector(key);
+    if (!el) { results[i] = {status: 'missing'}; return; }
+    if (el.classList.contains('oxd-select-text-input')) { results[i] = {status: 'select'}; return; }
+    const tag = el.tagName.toLowerCase();
+    if (tag === 'input' && (el.type === 'checkbox' || el.type === 'radio')) {
+        const previous = el.checked;
+        if (previous !== Boolean(value)) el.click();
+        results[i] = {status: 'ok', previous: previous};
+        return;
+    }
+    if (!(tag in setters) || el.readOnly || el.disabled || el.type === 'file') {
+        results[i] = {status: 'rejected'};
+        return;
+    }
+    const previous = el.value;
+    el.focus();
+    setters[tag].call(el, String(value));
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+    results[i] = {status: 'ok', previous: previous};
+    written.push([i, el, String(value)]);
+});
+setTimeout(() => {
+    for (const [i, el, value] of written) {
+        if (!el.isConnected || el.value !== value) results[i].status = 'rejected';
+    }
+    done(results);
+}, 0);
+"""
+
+# The cell texts of every OXD list row under ``root``, in one round-trip.
+_TABLE_ROWS_JS = """
+const root = arguments[0] || document;
+return Array.from(root.querySelectorAll('.oxd-table-body .oxd-table-card'), card =>
+    Array.from(card.querySelectorAll('.oxd-table-cell'), cell => cell.innerText.replace(/\\s+/g, ' ').trim()));
+"""
+
+
+class BasePage:
+    ROOT = LAYOUT
+    READY = None
+
+    def __init__(self, driver, timeout=30, root=None):
+        self.driver = driver
+        self.timeout = timeout
+        self.wait = WebDriverWait(driver, timeout, poll_frequency=waits.POLL)
+        self._given_root = root
+        self._root = root
+        self._fields = None
+
+    @property
+    def root(self):
+        """The element scoped lookups run in; the document when ``ROOT`` never shows up."""
+        if self._root is None:
+            if self.ROOT is None:
+                self._root = self.driver
+            else:
+                try:
+                    self._root = self.wait.until(EC.presence_of_element_located(self.ROOT))
+                except TimeoutException:
+                    self._root = self.driver
+        return self._root
+
+    def invalidate(self):
+        """Forget the cached root and field map (after a navigation or re-render)."""
+        self._root = self._given_root
+        self._fields = None
+
+    def wait_ready(self):
+        if self.READY is not None:
+            self.find(self.READY)
+        return self
+
+    def _scoped(self, fn):
+        try:
+            return fn(self.root)
+        except StaleElementReferenceException:
+            if self._given_root is not None:
+                raise
+            self.invalidate()
+            return fn(self.root)
+
+    def find(self, loc, condition=EC.presence_of_element_located, timeout=None):
+        """Wait until ``condition(loc)`` holds and return its value."""
+        timeout = self.timeout if timeout is None else timeout
+        if loc.is_global:
+            return WebDriverWait(self.driver, timeout, poll_frequency=waits.POLL).until(condition(loc))
+        return self._scoped(lambda root: WebDriverWait(root, timeout, poll_frequency=waits.POLL).until(condition(loc)))
+
+    def find_all(self, loc):
+        if loc.is_global:
+            return self.driver.find_elements(*loc)
+        return self._scoped(lambda root: root.find_elements(*loc))
+
+    def probe(self, loc, timeout=0.0):
+        """Like :func:`support.waits.probe`: the element, or None when it is absent."""
+        if loc.is_global:
+            return waits.probe(self.driver, *loc, timeout=timeout)
+        return self._scoped(lambda root: waits.probe(root, *loc, timeout=timeout))
+
+    def click(self, target):
+        """Click an element or locator, falling back to a JS click when something overlays it."""
+        element = target if isinstance(target, WebElement) else self.find(target, EC.element_to_be_clickable)
+        try:
+            element.click()
+        except ElementClickInterceptedException:
+            self.driver.execute_script("arguments[0].click();", element)
+        return element
+
+    def open_menu(self, name):
+        self.click(MENU_ITEM(name=name))
+
+    def open_link(self, text):
+        self.click(LINK(text=text))
+
+    def wait_toast(self, timeout=None):
+        """True when a toast appeared within ``timeout`` seconds."""
+        try:
+            WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=waits.POLL).until(waits.toast_shown())
+            return True
+        except TimeoutException:
+            return False
+
+    # API calls (support.xhr_tracker)
+
+    def api_mark(self):
+        """Mark the request log before an action; pass it to :meth:`wait_for_api` as ``since``."""
+        return XhrTracker.of(self.driver).mark()
+
+    def wait_for_api(self, path, method=None, since=None, timeout=None):
+        """Wait for a request to the API ``path`` (e.g. ``pim/employees``) and return its ApiResponse.
+
+        Raises TimeoutException when no such request completed in time.
+        """
+        XhrTracker.of(self.driver)
+        timeout = self.timeout if timeout is None else timeout
+        # One check never runs past the timeout, nor past 20s (under Selenium's 30s script timeout).
+        condition = waits.api_response(path, method, since, cap_ms=int(min(timeout, 20) * 1000), deadline=time.monotonic() + timeout)
+        return WebDriverWait(self.driver, timeout, poll_frequency=waits.POLL).until(condition)
+
+    def api_saved(self, path, method, since):
+        """True when the save request to ``path`` completed with a 2xx status (the toast's API-level twin)."""
+        try:
+            return self.wait_for_api(path, method, since=since).ok
+        except TimeoutException:
+            return False
+
+    def table_rows(self):
+        """Cell texts of the rows of the list table under the root (one script execution)."""
+        root = self.root
+        return self.driver.execute_script(_TABLE_ROWS_JS, None if root is self.driver else root) or []
+
+    # Label-addressed form fields
+
+    def fields(self, refresh=False):
+        if self._fields is None or refresh:
+            root = self.root
+            self._fields = self.driver.execute_script(_FIELDS_JS, None if root is self.driver else root) or {}
+        return self._fields
+
+    def field(self, label, refresh=False):
+        """The control of the input group labelled ``label``, or None."""
+        start = time.monotonic()
+        control = self.fields(refresh).get(label)
+        if control is None and not refresh:
+            control = self.fields(refresh=True).get(label)
+        if control is None:
+            waits.ledger.record("probe", f"label={label}", time.monotonic() - start)
+        return control
+
+    def set_text(self, label, value, tab=False):
+        """Type ``value`` into the field labelled ``label``; False when there is no such field."""
+        for attempt in range(2):
+            control = self.field(label, refresh=attempt > 0)
+            if control is None:
+                return False
+            try:
+                control.clear()
+                control.send_keys(value)
+                if tab:
+                    control.send_keys(Keys.TAB)
+                return True
+            except StaleElementReferenceException:
+                continue
+        return False
+
+    def fill_form(self, values):
+        """Fill several fields with one script execution.
+
+        ``values`` maps a field label, or a ``By.NAME`` / CSS locator, to its
+        value (a bool for checkboxes and radios). OXD selects get the option
+        containing the value picked, and fields that do not keep a programmatic
+        value are typed into one by one. Returns ``{key: previous value}`` for
+        every field found; keys with no field on the page are left out.
+        """
+        keys = list(values)
+        entries = [self._fill_entry(key, values[key]) for key in keys]
+        root = self.root
+        results = self.driver.execute_async_script(_FILL_JS, None if root is self.driver else root, entries)
+        previous = {}
+        for key, result in zip(keys, results):
+            status = result["status"]
+            if status == "missing":
+                waits.ledger.record("probe", f"label={key}", 0.0)
+                continue
+            if status == "select":
+                self.select_option(key, values[key])
+            elif status == "rejected":
+                self._type(key, values[key])
+            previous[key] = result.get("previous")
+        return previous
+
+    @staticmethod
+    def _fill_entry(key, value):
+        if not isinstance(key, Locator):
+            return ["label", key, value]
+        if key.by == By.NAME:
+            return ["css", f'[name="{key.value}"]', value]
+        if key.by == By.CSS_SELECTOR:
+            return ["css", key.value, value]
+        raise ValueError(f"fill_form takes labels, By.NAME or CSS locators, not {key}")
+
+    def _type(self, key, value):
+        if isinstance(key, Locator):
+            control = self.find(key)
+            control.clear()
+            control.send_keys(value)
+        else:
+            self.set_text(key, value, tab=True)
+
+    def select_first(self, label):
+        """Pick the first option of the OXD select labelled ``label``."""
+        box = self.field(label)
+        if box is None:
+            return False
+        try:
+            self.click(box)
+            self.wait.until(waits.listbox_open())
+            box.send_keys(Keys.ARROW_DOWN)
+            box.send_keys(Keys.ENTER)
+            return True
+        except (TimeoutException, StaleElementReferenceException):
+            return False
+
+    def select_option(self, target, text):
+        """Pick the option containing ``text`` in the select labelled ``target`` (or at a Locator).
+
+        Raises TimeoutException when the select or the option is not there.
+        """
+        box = self.find(target) if isinstance(target, Locator) else self.field(target)
+        if box is None:
+            raise TimeoutException(f"No field labelled {target!r}")
+        self.click(box)
+        self.wait.until(waits.listbox_open())
+        self.click(OPTION(text=text))
+
+    def autocomplete(self, control, hint, pick=None):
+        """Type ``hint`` into an autocomplete and choose ``pick`` (or the first suggestion).
+
+        Returns the chosen suggestion's text, or None when nothing matched in time.
+        """
+        control.clear()
+        control.send_keys(hint)
+        try:
+            option = self.find(LISTBOX_ITEM_NAMED(text=pick) if pick else LISTBOX_ITEM, EC.element_to_be_clickable)
+        except TimeoutException:
+            return None
+        text = option.text.strip()
+        option.click()
+        return text
+
+    def confirm_delete(self, timeout=5):
+        try:
+            self.click(self.find(CONFIRM_DELETE, EC.element_to_be_clickable, timeout=timeout))
+            return True
+        except TimeoutException:
+            return False
+
+    def validation_errors(self):
+        texts = []
+        for error in self.find_all(FIELD_ERROR):
+            try:
+                texts.append(error.text)
+            except StaleElementReferenceException:
+                pass
+        return texts
@@ -0,0 +1,155 @@
+"""Buzz feed, with post and comment cards scoped to their own element."""
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support import waits
+
+from .base import FILE_INPUT, BasePage
+from .locators import locator
+
+BUZZ_HEADER = locator("buzz.header", By.XPATH, "//h6[text()='Buzz']")
+POST_INPUT = locator("buzz.post_input", By.XPATH, "//textarea | //form//p[contains(@class,'oxd-buzz-post-input')]/ancestor::form//textarea")
+POST_INPUT_EDITABLE = locator("buzz.post_input_editable", By.XPATH, "//div[@contenteditable='true' and contains(@class,'oxd-buzz-post-input')]")
+IMAGE_BUTTON = locator("buzz.image_button", By.XPATH, "//button[contains(@class,'oxd-buzz-post-img-button') or @type='button'][.//i or .//span]")
+POST_SUBMIT = locator("buzz.post_submit", By.XPATH, "//button[@type='submit' and (contains(.,'Post') or contains(.,'Share'))]")
+POST_SUBMIT_FALLBACK = locator("buzz.post_submit_fallback", By.XPATH, "//form//button[contains(@class,'oxd-button') and (contains(.,'Post') or contains(.,'Share'))]")
+POST_WITH_TEXT = locator("buzz.post_with_text", By.XPATH, "(//div[contains(@class,'orangehrm-buzz-post')][.//*[contains(normalize-space(text()), {text})]])[1]")
+COMMENT_INPUT = locator("buzz.card.comment_input", By.XPATH, ".//input[@placeholder='Write your comment...'] | .//textarea[@placeholder='Write your comment...']")
+COMMENT_BUTTON = locator("buzz.card.comment_button", By.XPATH, ".//button[contains(.,'Comment')]")
+COMMENT_AREA = locator("buzz.card.comment_area", By.XPATH, ".//div[contains(@class,'orangehrm-buzz-comment')]//textarea")
+COMMENT_EDIT_AREA = locator("buzz.comment.edit_area", By.XPATH, ".//textarea")
+COMMENT_WITH_TEXT = locator("buzz.comment_with_text", By.XPATH, "//div[contains(@class,'orangehrm-buzz-comment')][.//*[contains(normalize-space(), {text})]]")
+EDIT_MODAL = locator("buzz.edit_modal", By.XPATH, "//div[contains(@class,'orangehrm-buzz-post-modal')]")
+EDIT_MODAL_INPUT = locator("buzz.edit_modal_input", By.XPATH, "//div[contains(@class,'orangehrm-buzz-post-modal')]//textarea | //div[contains(@class,'orangehrm-buzz-post-modal')]//div[@contenteditable='true']")
+EDIT_MODAL_SAVE = locator("buzz.edit_modal_save", By.XPATH, "//div[contains(@class,'orangehrm-buzz-post-modal')]//button[@type='submit' and (contains(.,'Save') or contains(.,'Update'))]")
+
+LIKE_BUTTON = locator("buzz.card.like", By.XPATH, ".//button[contains(.,'Like') or contains(.,'Unlike')]")
+MORE_BUTTON = locator("buzz.card.more", By.XPATH, ".//button[contains(@class,'oxd-icon-button') or contains(@class,'more')]")
+MENU_ENTRY = locator("buzz.menu_entry", By.XPATH, "//div[contains(@class,'oxd-dropdown-menu')]//p[contains(normalize-space(),{text})]")
+
+
+def _replace_text(element, text):
+    try:
+        element.clear()
+    except Exception:
+        element.send_keys(Keys.CONTROL, "a")
+        element.send_keys(Keys.BACKSPACE)
+    element.send_keys(text)
+
+
+class BuzzPage(BasePage):
+    READY = BUZZ_HEADER
+
+    def navigate(self):
+        self.open_menu("Buzz")
+        self.invalidate()
+        return self.wait_ready()
+
+    def compose(self, message):
+        try:
+            post_input = self.find(POST_INPUT)
+        except TimeoutException:
+            post_input = self.find(POST_INPUT_EDITABLE)
+        try:
+            post_input.clear()
+        except Exception:
+            pass
+        post_input.send_keys(message)
+
+    def attach_image(self, path):
+        try:
+            self.click(self.probe(IMAGE_BUTTON))
+            self.find(FILE_INPUT).send_keys(path)
+            return True
+        except Exception:
+            return False
+
+    def publish(self, message):
+        """Submit the composed post and return its card once the feed shows ``message``.
+
+        Posts are found by their (unique) text rather than by position: other
+        workers post to the same feed concurrently.
+        """
+        self.submit()
+        return self.post(message)
+
+    def submit(self):
+        self.click(self.probe(POST_SUBMIT) or self.find(POST_SUBMIT_FALLBACK, EC.element_to_be_clickable))
+
+    def post(self, text):
+        return PostCard(self.driver, self.timeout, root=self.find(POST_WITH_TEXT(text=text)))
+
+    def comment(self, text):
+        """The comment whose text contains ``text``, or None."""
+        try:
+            return CommentCard(self.driver, self.timeout, root=self.find(COMMENT_WITH_TEXT(text=text)))
+        except TimeoutException:
+            return None
+
+
+class _Card(BasePage):
+    """A post or comment; scoped locators run inside the card element."""
+
+    def like(self):
+        button = self.probe(LIKE_BUTTON)
+        if button is None:
+            return False
+        self.click(button)
+        return True
+
+    def menu(self, entry):
+        self.click(MORE_BUTTON)
+        self.wait.until(waits.dropdown_menu_open())
+        self.click(MENU_ENTRY(text=entry))
+
+    def delete(self):
+        self.menu("Delete")
+        self.confirm_delete()
+        try:
+            WebDriverWait(self.driver, 10, poll_frequency=waits.POLL).until(EC.staleness_of(self.root))
+        except TimeoutException:
+            pass
+
+
+class PostCard(_Card):
+    def edit(self, text):
+        """Edit the post text in the modal and return the refreshed card showing ``text``."""
+        self.menu("Edit")
+        _replace_text(self.find(EDIT_MODAL_INPUT), text)
+        self.click(EDIT_MODAL_SAVE)
+        self.wait.until(EC.invisibility_of_element_located(EDIT_MODAL))
+        self.wait.until(waits.dom_quiet())
+        return BuzzPage(self.driver, self.timeout).post(text)
+
+    def add_comment(self, text):
+        """Comment on this post; returns "inline", "fallback" or None."""
+        try:
+            comment_input = self.find(COMMENT_INPUT, EC.element_to_be_clickable)
+            comment_input.clear()
+            comment_input.send_keys(text)
+            comment_input.send_keys(Keys.ENTER)
+            return "inline"
+        except Exception:
+            pass
+        try:
+            self.click(self.probe(COMMENT_BUTTON))
+            area = self.find(COMMENT_AREA)
+            area.clear()
+            area.send_keys(text)
+            area.send_keys(Keys.ENTER)
+            return "fallback"
+        except Exception:
+            return None
+
+
+class CommentCard(_Card):
+    def edit(self, text, find_by):
+        """Edit the comment inline; returns the re-rendered comment containing ``find_by``."""
+        self.menu("Edit")
+        area = self.find(COMMENT_EDIT_AREA)
+        _replace_text(area, text)
+        area.send_keys(Keys.ENTER)
+        return BuzzPage(self.driver, self.timeout).comment(find_by)
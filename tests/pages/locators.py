@@ -0,0 +1,52 @@
+"""Locator registry for the page objects.
+
+Every locator is declared once, at import time, with :func:`locator`, so the
+strings are built a single time instead of on every helper call. Templates
+take keyword parameters (``MENU_ITEM(name="PIM")``); the formatted locator is
+cached, and XPath parameters are quoted with :func:`xpath_literal` so labels
+such as "Driver's License Number" produce a valid expression.
+
+A locator is a plain ``(by, value)`` tuple and can be passed anywhere
+selenium expects one. ``REGISTRY`` maps dotted names to locators, which makes
+the entries in the WebDriver profile easy to trace back to a page.
+"""
+from functools import lru_cache
+from typing import NamedTuple
+
+from selenium.webdriver.common.by import By
+
+REGISTRY = {}
+
+
+class Locator(NamedTuple):
+    by: str
+    value: str
+
+    def __call__(self, **params):
+        return _formatted(self, tuple(sorted(params.items())))
+
+    @property
+    def is_global(self):
+        """Absolute XPaths search the whole document; CSS and ``.//`` XPaths are scoped to a page root."""
+        return self.by == By.XPATH and self.value.lstrip("(").startswith("//")
+
+
+def xpath_literal(text):
+    text = str(text)
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+@lru_cache(maxsize=1024)
+def _formatted(template, params):
+    quote = xpath_literal if template.by == By.XPATH else str
+    return Locator(template.by, template.value.format(**{k: quote(v) if isinstance(v, str) else v for k, v in params}))
+
+
+def locator(name, by, value):
+    loc = Locator(by, value)
+    REGISTRY[name] = loc
+    return loc
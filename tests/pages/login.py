@@ -0,0 +1,36 @@
+"""Login form and the Dashboard it lands on."""
+from selenium.webdriver.common.by import By
+
+from support import session_cache
+
+from .base import BasePage, SUBMIT
+from .locators import locator
+
+USERNAME = locator("login.username", *session_cache.USERNAME_INPUT)
+PASSWORD = locator("login.password", By.NAME, "password")
+DASHBOARD_HEADER = locator("dashboard.header", *session_cache.DASHBOARD_HEADER)
+
+
+class LoginPage(BasePage):
+    ROOT = locator("login.root", By.CSS_SELECTOR, ".orangehrm-login-container")
+    READY = USERNAME
+
+    def open(self, base_url):
+        self.driver.get(base_url + session_cache.LOGIN_PATH)
+        self.invalidate()
+        return self.wait_ready()
+
+    def login(self, username, password):
+        self.find(USERNAME).send_keys(username)
+        self.find(PASSWORD).send_keys(password)
+        self.click(SUBMIT)
+        return DashboardPage(self.driver, self.timeout).wait_ready()
+
+
+class DashboardPage(BasePage):
+    READY = DASHBOARD_HEADER
+
+    def open(self, base_url):
+        self.driver.get(base_url + session_cache.DASHBOARD_PATH)
+        self.invalidate()
+        return self.wait_ready()
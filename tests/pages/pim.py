@@ -0,0 +1,268 @@
+"""PIM screens: Add Employee, the employee Job / Report-to / Personal Details tabs and the Employee List."""
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from support import waits
+
+from .base import FILE_INPUT, LINK, SUBMIT, BasePage
+from .locators import locator
+
+PERSONAL_DETAILS_PATH = "/web/index.php/pim/viewPersonalDetails/empNumber/{emp_number}"
+
+FIRST_NAME = locator("pim.add.first_name", By.NAME, "firstName")
+MIDDLE_NAME = locator("pim.add.middle_name", By.NAME, "middleName")
+LAST_NAME = locator("pim.add.last_name", By.NAME, "lastName")
+LOGIN_SWITCH = locator("pim.add.login_switch", By.CSS_SELECTOR, ".oxd-switch-input")
+JOB_TAB = LINK(text="Job")
+LABELLED_INPUT = locator("pim.labelled_input", By.XPATH, ".//label[text()={label}]/../..//input")
+
+REPORT_TO_HEADER = locator("pim.report_to.header", By.XPATH, "//h6[text()='Report to']")
+ADD_SUPERVISOR = locator("pim.report_to.add_supervisor", By.XPATH, "//h6[text()='Assigned Supervisors']/following::button[1]")
+SUPERVISOR_INPUT = locator("pim.report_to.supervisor_input", By.CSS_SELECTOR, "input[placeholder='Type for hints...']")
+
+EMPLOYEE_LIST_HEADER = locator("pim.list.header", By.XPATH, "//h5[text()='Employee Information']")
+
+GENDER_RADIO = locator("pim.personal.gender", By.XPATH, ".//label[normalize-space()={gender}]/preceding-sibling::input | .//label[normalize-space()={gender}]/../input")
+SMOKER = locator("pim.personal.smoker", By.XPATH, ".//label[text()='Smoker']/../following-sibling::div//input")
+NATIONALITY = locator("pim.personal.nationality", By.CSS_SELECTOR, ".oxd-select-text-input")  # the form's first select
+FIRST_SUBMIT = locator("pim.personal.first_submit", By.XPATH, "(.//button[@type='submit'])[1]")
+
+ATTACHMENTS = locator("pim.attachments.root", By.CSS_SELECTOR, "div.orangehrm-attachment")
+ATTACHMENTS_HEADER = locator("pim.attachments.header", By.XPATH, "//h6[text()='Attachments']")
+ADD_ATTACHMENT = locator("pim.attachments.add", By.XPATH, "//h6[text()='Attachments']/following::button[1]")
+ATTACHMENT_COMMENT = locator("pim.attachments.comment", By.CSS_SELECTOR, "textarea")
+ATTACHMENT_TABLE = locator("pim.attachments.table_body", By.CSS_SELECTOR, "div.oxd-table-body")
+ATTACHMENT_ROW = locator("pim.attachments.row", By.XPATH, ".//div[contains(@class,'oxd-table-card')]")
+ATTACHMENT_LINK = locator("pim.attachments.link", By.XPATH, "(.//div[@class='oxd-table-body']//div[contains(@class,'oxd-table-card')])[{index}]//a")
+
+
+class AddEmployeePage(BasePage):
+    READY = FIRST_NAME
+
+    def navigate(self):
+        """PIM → Add Employee; the top bar re-renders once, so a stale link is retried."""
+        self.open_menu("PIM")
+        for _ in range(3):
+            try:
+                self.open_link("Add Employee")
+                break
+            except StaleElementReferenceException:
+                self.wait.until(waits.dom_quiet())
+        self.invalidate()
+        return self.wait_ready()
+
+    def fill_details(self, first_name, last_name, employee_id=None, middle_name=None):
+        """Fill the name fields (and override the generated Employee Id) in one script call.
+
+        Returns the Employee Id the form had generated.
+        """
+        values = {FIRST_NAME: first_name, LAST_NAME: last_name}
+        if middle_name is not None:
+            values[MIDDLE_NAME] = middle_name
+        if employee_id is not None:
+            values["Employee Id"] = employee_id
+        return self.fill_form(values).get("Employee Id")
+
+    def upload_photo(self, path):
+        file_input = self.probe(FILE_INPUT)
+        if file_input is None:
+            return False
+        file_input.send_keys(path)
+        self.wait.until(waits.dom_quiet())
+        return True
+
+    def create_login(self, username, password):
+        self.click(LOGIN_SWITCH)
+        self.find(LABELLED_INPUT(label="Username"), EC.element_to_be_clickable)
+        self.fill_form({"Username": username, "Password": password, "Confirm Password": password})
+
+    def submit(self):
+        self.click(SUBMIT)
+
+    def wait_saved(self):
+        """Wait for the employee's tabs; False when the form did not submit."""
+        try:
+            return self.find(JOB_TAB).is_displayed()
+        except TimeoutException:
+            return False
+
+    def save(self):
+        """Save and wait for the employee's tabs; False when the form did not submit."""
+        self.submit()
+        return self.wait_saved()
+
+
+class JobPage(BasePage):
+    READY = LABELLED_INPUT(label="Joined Date")
+
+    def navigate(self):
+        self.click(JOB_TAB)
+        self.invalidate()
+        return self.wait_ready()
+
+    def set_joined_date(self, date):
+        self.set_text("Joined Date", date, tab=True)
+        try:
+            self.wait.until(waits.form_loader_gone())
+        except TimeoutException:
+            pass
+        self.fields(refresh=True)
+
+    def save(self):
+        since = self.api_mark()
+        self.click(SUBMIT)
+        return self.api_saved("pim/employees/{id}/job-details", "PUT", since)
+
+
+class ReportToPage(BasePage):
+    READY = REPORT_TO_HEADER
+
+    def navigate(self):
+        self.open_link("Report-to")
+        self.invalidate()
+        return self.wait_ready()
+
+    def add_supervisor(self, hint="a", name=None):
+        """Open the supervisor form and pick ``name`` (or the first suggestion for ``hint``)."""
+        self.click(ADD_SUPERVISOR)
+        return self.autocomplete(self.find(SUPERVISOR_INPUT), hint, pick=name)
+
+    def set_first_reporting_method(self):
+        self.fields(refresh=True)
+        if not self.select_first("Reporting Method"):
+            return None
+        return self.field("Reporting Method").text
+
+    def save(self):
+        """Add the supervisor and wait until the list has been reloaded."""
+        since = self.api_mark()
+        self.click(SUBMIT)
+        saved = self.api_saved("pim/employees/{id}/supervisors", "POST", since)
+        if saved:
+            self.api_saved("pim/employees/{id}/supervisors", "GET", since)
+        return saved
+
+
+class EmployeeListPage(BasePage):
+    READY = EMPLOYEE_LIST_HEADER
+
+    def navigate(self):
+        self.open_menu("PIM")
+        self.invalidate()
+        return self.wait_ready()
+
+    def filter_supervisor(self, hint, name):
+        control = self.find(LABELLED_INPUT(label="Supervisor Name"))
+        return self.autocomplete(control, hint, pick=name)
+
+    def search(self):
+        """Submit the filters; returns the ApiResponse of the employee search, or None when it did not complete."""
+        since = self.api_mark()
+        self.click(SUBMIT)
+        try:
+            return self.wait_for_api("pim/employees", "GET", since=since)
+        except TimeoutException:
+            return None
+
+
+class PersonalDetailsPage(BasePage):
+    READY = LABELLED_INPUT(label="Nick Name")
+
+    def open(self, base_url, emp_number):
+        self.driver.get(base_url + PERSONAL_DETAILS_PATH.format(emp_number=emp_number))
+        self.invalidate()
+        return self.wait_ready()
+
+    def wait_ready(self):
+        # The inputs render after the header and the form loader covers them until the data is in.
+        super().wait_ready()
+        self.wait.until(waits.form_loader_gone())
+        return self
+
+    def set_gender(self, gender):
+        radio = self.probe(GENDER_RADIO(gender=gender))
+        if radio is not None:
+            self.click(radio)
+
+    def set_smoker(self, smoker=True):
+        checkbox = self.probe(SMOKER)
+        if checkbox is not None and checkbox.is_selected() != smoker:
+            self.click(checkbox)
+
+    def save(self):
+        since = self.api_mark()
+        self.click(FIRST_SUBMIT)
+        return self.api_saved("pim/employees/{id}/personal-details", "PUT", since)
+
+    @property
+    def attachments(self):
+        return AttachmentsSection(self.driver, self.timeout)
+
+
+class AttachmentsSection(BasePage):
+    ROOT = ATTACHMENTS
+
+    def scroll_into_view(self):
+        header = self.find(ATTACHMENTS_HEADER)
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'start', behavior: 'instant'});", header)
+
+    def open_form(self):
+        self.click(ADD_ATTACHMENT)
+
+    def choose_file(self, file_path):
+        self.find(FILE_INPUT).send_keys(file_path)
+
+    def set_comment(self, comment):
+        comment_area = self.probe(ATTACHMENT_COMMENT)
+        if comment_area is not None:
+            comment_area.clear()
+            comment_area.send_keys(comment)
+
+    def submit(self):
+        self.click(SUBMIT)
+
+    def add(self, file_path, comment):
+        self.open_form()
+        self.choose_file(file_path)
+        self.set_comment(comment)
+        self.submit()
+        return self.wait_toast()
+
+    def rows(self):
+        table = self.find(ATTACHMENT_TABLE)
+        return table, table.find_elements(*ATTACHMENT_ROW)
+
+    def wait_rows(self, count):
+        """Wait until the table lists ``count`` attachments; False on timeout."""
+        try:
+            self.wait.until(waits.element_count(ATTACHMENT_ROW, count, root=self.find(ATTACHMENT_TABLE)))
+            return True
+        except TimeoutException:
+            return False
+
+    def edit_comment(self, index, comment):
+        _, rows = self.rows()
+        self.click(rows[index].find_element(By.XPATH, ".//button[1]"))
+        comment_area = self.find(ATTACHMENT_COMMENT)
+        comment_area.clear()
+        comment_area.send_keys(comment)
+        self.click(SUBMIT)
+        return self.wait_toast()
+
+    def link(self, index):
+        """Download link of the ``index``-th (1-based) attachment."""
+        return self.find(ATTACHMENT_LINK(index=index), EC.element_to_be_clickable)
+
+    def delete(self, index):
+        """Delete a row; returns (row count before, row count after) or None when not confirmed."""
+        table, rows_before = self.rows()
+        self.click(rows_before[index].find_element(By.XPATH, ".//button[last()]"))
+        if not self.confirm_delete(timeout=self.timeout):
+            return None
+        self.wait_toast()
+        try:
+            self.wait.until(waits.element_count(ATTACHMENT_ROW, len(rows_before) - 1, root=table))
+        except TimeoutException:
+            pass
+        return len(rows_before), len(table.find_elements(*ATTACHMENT_ROW))
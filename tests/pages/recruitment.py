@@ -0,0 +1,114 @@
+"""Recruitment screens: the candidate list, Add Candidate and the candidate's stage actions."""
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from .base import FILE_INPUT, SUBMIT, BasePage
+from .locators import locator
+
+ADD_BUTTON = locator("recruitment.add", By.XPATH, "//button[contains(.,'Add') and contains(@class,'oxd-button')]")
+ADD_CANDIDATE_HEADER = locator("recruitment.add.header", By.XPATH, "//h6[text()='Add Candidate']")
+CANDIDATE_FIRST_NAME = locator("recruitment.add.first_name", By.NAME, "firstName")
+CANDIDATE_MIDDLE_NAME = locator("recruitment.add.middle_name", By.NAME, "middleName")
+CANDIDATE_LAST_NAME = locator("recruitment.add.last_name", By.NAME, "lastName")
+CONSENT = locator("recruitment.add.consent", By.XPATH, ".//label[contains(.,'Consent to keep data')]/../following-sibling::div//input")
+
+STAGE_BUTTON = locator("recruitment.stage.button", By.XPATH, "//button[contains(normalize-space(),{action})]")
+STAGE_NOTES = locator("recruitment.stage.notes", By.XPATH, ".//label[text()='Notes']/../..//textarea")
+STAGE_SAVE = locator("recruitment.stage.save", By.XPATH, ".//button[@type='submit' and contains(normalize-space(),'Save')]")
+DIALOG_SUBMIT = locator("recruitment.stage.dialog_submit", By.XPATH, "(//div[contains(@class,'oxd-dialog-container')]//button[@type='submit'])[1]")
+INTERVIEW_TITLE = locator("recruitment.interview.title", By.XPATH, ".//label[text()='Interview Title']/../..//input")
+INTERVIEW_SAVE = locator("recruitment.interview.save", By.XPATH, ".//button[@type='submit' and .='Save']")
+
+
+class RecruitmentPage(BasePage):
+    def navigate(self):
+        self.open_menu("Recruitment")
+        self.invalidate()
+        return self
+
+    def open_add_candidate(self):
+        self.click(ADD_BUTTON)
+        self.find(ADD_CANDIDATE_HEADER)
+        return AddCandidatePage(self.driver, self.timeout).wait_ready()
+
+
+class AddCandidatePage(BasePage):
+    READY = CANDIDATE_FIRST_NAME
+
+    def fill(self, first_name, middle_name, last_name, email, contact, keywords, notes, applied_on="2024-01-15", vacancy=None):
+        self.fill_form({
+            CANDIDATE_FIRST_NAME: first_name,
+            CANDIDATE_MIDDLE_NAME: middle_name,
+            CANDIDATE_LAST_NAME: last_name,
+            "Email": email,
+            "Contact Number": contact,
+            "Keywords": keywords,
+            "Notes": notes,
+        })
+        if vacancy:
+            self.select_option("Vacancy", vacancy)
+        else:
+            self.select_first("Vacancy")
+        # The application date defaults to today; only fill it when the form left it empty.
+        applied = self.field("Date of Application")
+        if applied is not None and not (applied.get_attribute("value") or "").strip():
+            self.fill_form({"Date of Application": applied_on})
+
+    def give_consent(self):
+        consent = self.probe(CONSENT)
+        if consent is not None and not consent.is_selected():
+            self.click(consent)
+
+    def attach(self, path):
+        file_input = self.probe(FILE_INPUT)
+        if file_input is None:
+            return False
+        file_input.send_keys(path)
+        return True
+
+    def submit(self):
+        self.click(SUBMIT)
+
+    def wait_saved(self):
+        """Wait until the candidate's stage actions are offered."""
+        self.find(STAGE_BUTTON(action="Shortlist"))
+        return CandidatePage(self.driver, self.timeout)
+
+    def save(self):
+        self.submit()
+        return self.wait_saved()
+
+
+class CandidatePage(BasePage):
+    def shortlist(self, note):
+        """Shortlist with a note; True when the save toast was seen, None when there was no Save button."""
+        self.click(STAGE_BUTTON(action="Shortlist"))
+        self.invalidate()
+        try:
+            self.find(STAGE_NOTES)
+        except TimeoutException:
+            pass
+        self.set_text("Notes", note)
+        save = self.probe(STAGE_SAVE) or self.probe(DIALOG_SUBMIT)
+        if save is None:
+            return None
+        self.click(save)
+        return self.wait_toast()
+
+    def open_schedule_interview(self):
+        """Raises TimeoutException when the candidate's stage offers no interview."""
+        self.click(STAGE_BUTTON(action="Schedule Interview"))
+        self.invalidate()
+
+    def schedule_interview(self, title, date, time, interviewer_hint="a"):
+        """Fill the Schedule Interview form; returns (interviewer picked, toast seen)."""
+        title_input = self.probe(INTERVIEW_TITLE, timeout=10)
+        if title_input is not None:
+            title_input.clear()
+            title_input.send_keys(title)
+        interviewer = self.field("Interviewer")
+        picked = self.autocomplete(interviewer, interviewer_hint) if interviewer is not None else None
+        self.fill_form({"Date": date, "Time": time})
+        self.click(INTERVIEW_SAVE)
+        return picked, self.wait_toast()
+
@@ -0,0 +1,161 @@
+"""PIM → Reports → Define Report."""
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from support import waits
+
+from .base import BasePage
+from .locators import locator
+
+DEFINE_REPORT_PATH = "/web/index.php/pim/definePredefinedReport"
+
+REPORTS_LINK = locator("reports.link", By.XPATH, "//a[contains(@href,'viewDefinedPredefinedReports') or .//span[normalize-space()='Reports']]")
+ADD_BUTTON = locator("reports.add", By.XPATH, "//button[contains(@class,'oxd-button') and contains(.,'Add')]")
+DEFINE_HEADER = locator("reports.define.header", By.XPATH, "//h6[contains(.,'Define Report')]")
+DEFINE_OR_LIST_HEADER = locator("reports.define.any_header", By.XPATH, "//h6[contains(.,'Define Report') or contains(.,'Reports')]")
+REPORT_LIST_HEADER = locator("reports.list.header", By.XPATH, "//h6[contains(.,'Defined Predefined Reports')]")
+
+REPORT_NAME_INPUT = locator("reports.name_input", By.XPATH, ".//label[text()='Report Name']/../following-sibling::div//input")
+OPTION_CONTAINING = locator("reports.option", By.XPATH, "//div[@role='option' and contains(.,{text})]")
+ANY_OPTION = locator("reports.any_option", By.XPATH, "//div[@role='option']")
+LISTBOX_OPTIONS = locator("reports.listbox_options", By.XPATH, "//div[@role='listbox']/div[@role='option']")
+CRITERIA_SELECT = locator("reports.criteria_select", By.XPATH, ".//label[text()='Selection Criteria']/../following-sibling::div//div[contains(@class,'oxd-select-text')]")
+ADD_CRITERIA = locator("reports.add_criteria", By.XPATH, ".//button[contains(@class,'oxd-button') and contains(.,'Add Criteria')]")
+CRITERIA_DELETE = locator("reports.criteria_delete", By.XPATH, ".//div[contains(@class,'oxd-table-card')]//button[contains(@class,'oxd-icon-button')]")
+GROUP_SELECT = locator("reports.group_select", By.XPATH, ".//label[text()='Display Fields']/../following-sibling::div//div[contains(@class,'oxd-select-text')]")
+FIELD_SELECT = locator("reports.field_select", By.XPATH, ".//label[text()='Display Fields']/../following-sibling::div//following::div[contains(@class,'oxd-select-text')][1]")
+ADD_DISPLAY_FIELD = locator("reports.add_display_field", By.XPATH, ".//button[contains(@class,'oxd-button') and contains(.,'Add Display Field')]")
+DISPLAY_ROWS = locator("reports.display_rows", By.XPATH, ".//div[contains(@class,'oxd-table-card')][.//div[contains(@class,'oxd-table-header-cell') and contains(.,'Display Field')]]/following-sibling::div[contains(@class,'oxd-table-card')]")
+ROW_BUTTON = locator("reports.row_button", By.CSS_SELECTOR, "button.oxd-icon-button")
+HEADER_CHECKBOXES = locator("reports.header_checkboxes", By.XPATH, ".//label[contains(.,'Include Header')]/../following-sibling::div//input[@type='checkbox']")
+GROUP_DELETE = locator("reports.group_delete", By.XPATH, ".//div[contains(@class,'oxd-table-card')][.//div[contains(.,'Display Field Group')]]//button[contains(@class,'oxd-icon-button')]")
+SAVE = locator("reports.save", By.XPATH, ".//button[@type='submit' and contains(.,'Save')]")
+
+
+class DefineReportPage(BasePage):
+    READY = DEFINE_HEADER
+
+    def navigate(self, base_url):
+        """PIM → Reports → Add; opens the page by URL when the menu path is not available.
+
+        Returns True when the fallback URL was used.
+        """
+        self.open_menu("PIM")
+        try:
+            self.click(REPORTS_LINK)
+            self.click(ADD_BUTTON)
+            self.find(DEFINE_HEADER)
+            return False
+        except TimeoutException:
+            self.driver.get(base_url + DEFINE_REPORT_PATH)
+            try:
+                self.find(DEFINE_OR_LIST_HEADER)
+            except TimeoutException:
+                pass
+            return True
+        finally:
+            self.invalidate()
+
+    def _remove(self, button):
+        """Best-effort click on a row's delete button; rows re-render as others go away."""
+        try:
+            button.click()
+            self.wait.until(waits.dom_quiet(100))
+        except ElementClickInterceptedException:
+            self.driver.execute_script("arguments[0].click();", button)
+        except StaleElementReferenceException:
+            pass
+
+    def set_name(self, name):
+        self.find(REPORT_NAME_INPUT)
+        self.set_text("Report Name", name)
+
+    def set_include(self, text):
+        self.select_option("Include", text)
+
+    def add_criteria(self, index):
+        """Add the ``index``-th selection criterion (the first when there are fewer)."""
+        self.click(CRITERIA_SELECT)
+        options = self.wait.until(EC.presence_of_all_elements_located(LISTBOX_OPTIONS))
+        (options[index] if index < len(options) else options[0]).click()
+        self.click(ADD_CRITERIA)
+        self.wait.until(waits.dom_quiet(100))
+
+    def remove_all_criteria(self):
+        for button in self.find_all(CRITERIA_DELETE):
+            self._remove(button)
+
+    def select_group(self, label_sub):
+        try:
+            self.click(GROUP_SELECT)
+        except TimeoutException:
+            return False
+        try:
+            self.click(OPTION_CONTAINING(text=label_sub))
+        except TimeoutException:
+            try:
+                self.click(ANY_OPTION)
+            except TimeoutException:
+                return False
+        return True
+
+    def add_fields_from_current_group(self, max_fields=5):
+        try:
+            self.click(FIELD_SELECT)
+            fields = self.wait.until(EC.presence_of_all_elements_located(LISTBOX_OPTIONS))
+            count = 0
+            for option in fields:
+                try:
+                    option.click()
+                    self.click(ADD_DISPLAY_FIELD)
+                    count += 1
+                    self.wait.until(waits.dom_quiet(100))
+                    if count >= max_fields:
+                        break
+                    self.click(FIELD_SELECT)
+                except Exception:
+                    break
+        except Exception:
+            pass
+
+    def display_rows(self):
+        return self.find_all(DISPLAY_ROWS)
+
+    def enable_headers(self):
+        for checkbox in self.find_all(HEADER_CHECKBOXES):
+            try:
+                if not checkbox.is_selected():
+                    checkbox.click()
+            except ElementClickInterceptedException:
+                self.driver.execute_script("arguments[0].click();", checkbox)
+            except StaleElementReferenceException:
+                pass
+
+    def remove_display_fields(self, count):
+        buttons = []
+        for row in self.display_rows():
+            row_buttons = row.find_elements(*ROW_BUTTON)
+            if row_buttons:
+                buttons.append(row_buttons[-1])
+        for button in buttons[:count]:
+            self._remove(button)
+
+    def remove_first_group(self):
+        group_buttons = self.find_all(GROUP_DELETE)
+        if group_buttons:
+            self._remove(group_buttons[0])
+
+    def save(self):
+        """Save and wait for the report list; False when it did not show up."""
+        try:
+            self.click(SAVE)
+            self.find(REPORT_LIST_HEADER)
+            return True
+        except Exception:
+            return False
+
@@ -1,6 +1,23 @@
+"""Run the test modules concurrently and merge their results.
+
+Each module runs in its own pytest process. Modules are started longest
+first (using the durations recorded in the duration store) on a pool of
+``--workers`` processes, which keeps the total run close to the duration of
+the slowest module instead of the sum of all of them. Failures do not stop
+the run; every module's JUnit XML is merged into ``reports/junit.xml`` and
+summarised in ``reports/report.html``.
+"""
+import argparse
+import html
+import os
 import subprocess
 import sys
-import os
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from support.durations import DurationStore, new_run_id
 
 TESTS = [
     "test_e2e_employee.py",
@@ -8,23 +25,152 @@ TESTS = [
     "test_recruitment_add_candidate.py",
     "test_buzz_post.py",
     "test_pim_report.py",
+    "test_durations.py",
 ]
 
-def run_tests():
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    venv_python = os.path.join(base_dir, "..", ".venv", "Scripts", "python.exe")
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass
+class ModuleResult:
+    module: str
+    returncode: int
+    duration: float
+    junit_path: str
+    html_path: str
+    log_path: str
+
+    @property
+    def passed(self):
+        return self.returncode == 0
+
+
+def find_python():
+    venv_python = os.path.join(BASE_DIR, "..", ".venv", "Scripts", "python.exe")
     if not os.path.exists(venv_python):
         venv_python = sys.executable  # fallback to current python
-    for test in TESTS:
-        print(f"\n==== Running {test} ====")
+    return venv_python
+
+
+def schedule(modules, history):
+    """Order modules longest first; modules without history go first."""
+    return sorted(modules, key=lambda m: (m in history, -history.get(m, 0.0)))
+
+
+def run_module(python, module, report_dir, env, worker_id):
+    """Run one module in its own pytest process; ``worker_id`` keeps its download dirs and dumps apart."""
+    name = os.path.splitext(module)[0]
+    junit_path = os.path.join(report_dir, "junit", f"{name}.xml")
+    html_path = os.path.join(report_dir, "modules", f"{name}.html")
+    log_path = os.path.join(report_dir, "logs", f"{name}.log")
+    start = time.monotonic()
+    with open(log_path, "w", encoding="utf-8") as log:
         result = subprocess.run([
-            venv_python, "-m", "pytest", test, "-vv", "--disable-warnings"
-        ], cwd=base_dir)
-        if result.returncode != 0:
-            print(f"FAILED: {test} (exit code {result.returncode})")
-            sys.exit(result.returncode)
-        print(f"PASSED: {test}")
+            python, "-m", "pytest", module, "-vv", "--disable-warnings",
+            f"--junitxml={junit_path}", f"--html={html_path}", "--self-contained-html",
+        ], cwd=BASE_DIR, env=dict(env, TEST_WORKER_ID=worker_id), stdout=log, stderr=subprocess.STDOUT)
+    return ModuleResult(module, result.returncode, time.monotonic() - start, junit_path, html_path, log_path)
+
+
+def merge_junit(results, target):
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    for result in results:
+        try:
+            root = ET.parse(result.junit_path).getroot()
+        except (OSError, ET.ParseError):
+            suite = ET.SubElement(merged, "testsuite", name=result.module, tests="1", errors="1")
+            case = ET.SubElement(suite, "testcase", classname=result.module, name="collection")
+            ET.SubElement(case, "error", message=f"pytest exited with code {result.returncode}; see {result.log_path}")
+            totals["tests"] += 1
+            totals["errors"] += 1
+            continue
+        suites = [root] if root.tag == "testsuite" else list(root)
+        for suite in suites:
+            for key in totals:
+                totals[key] += int(suite.get(key, 0))
+            merged.append(suite)
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    ET.ElementTree(merged).write(target, encoding="utf-8", xml_declaration=True)
+    return totals
+
+
+def write_html_summary(results, totals, wall_time, target):
+    rows = []
+    for result in sorted(results, key=lambda r: r.module):
+        status = "PASSED" if result.passed else f"FAILED ({result.returncode})"
+        color = "#2e7d32" if result.passed else "#c62828"
+        rows.append(
+            f"<tr><td>{html.escape(result.module)}</td>"
+            f"<td style='color:{color}'>{status}</td>"
+            f"<td>{result.duration:.1f}s</td>"
+            f"<td><a href='{html.escape(os.path.relpath(result.html_path, os.path.dirname(target)))}'>report</a> · "
+            f"<a href='{html.escape(os.path.relpath(result.log_path, os.path.dirname(target)))}'>log</a></td></tr>"
+        )
+    serial = sum(r.duration for r in results)
+    page = (
+        "<html><head><meta charset='utf-8'><title>OrangeHRM test run</title></head><body>"
+        "<h1>OrangeHRM test run</h1>"
+        f"<p>tests: {totals['tests']}, failures: {totals['failures']}, errors: {totals['errors']}, "
+        f"skipped: {totals['skipped']}</p>"
+        f"<p>wall time: {wall_time:.1f}s (sum of module durations: {serial:.1f}s)</p>"
+        "<table border='1' cellpadding='4' cellspacing='0'>"
+        "<tr><th>Module</th><th>Status</th><th>Duration</th><th>Details</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(page)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=TESTS, help="test modules to run (default: all)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of concurrent pytest processes (default: CPU count)")
+    parser.add_argument("--report-dir", default=os.path.join(BASE_DIR, "reports"),
+                        help="directory for merged JUnit/HTML reports and logs")
+    return parser.parse_args(argv)
+
+
+def run_tests(argv=None):
+    args = parse_args(argv)
+    report_dir = os.path.abspath(args.report_dir)
+    for sub in ("junit", "modules", "logs"):
+        os.makedirs(os.path.join(report_dir, sub), exist_ok=True)
+
+    python = find_python()
+    history = DurationStore().module_durations()
+    # All module processes record into the duration store under one run id.
+    env = dict(os.environ, TEST_RUN_ID=os.getenv("TEST_RUN_ID") or new_run_id())
+    ordered = schedule(args.modules, history)
+    workers = max(1, min(args.workers, len(ordered)))
+    print(f"Running {len(ordered)} modules on {workers} workers: {', '.join(ordered)}")
+
+    start = time.monotonic()
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_module, python, module, report_dir, env, f"mod{i}") for i, module in enumerate(ordered)]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            status = "PASSED" if result.passed else f"FAILED (exit code {result.returncode})"
+            print(f"{status}: {result.module} in {result.duration:.1f}s")
+    wall_time = time.monotonic() - start
+
+    totals = merge_junit(results, os.path.join(report_dir, "junit.xml"))
+    write_html_summary(results, totals, wall_time, os.path.join(report_dir, "report.html"))
+    serial = sum(r.duration for r in results)
+    print(f"\nWall time {wall_time:.1f}s (serial would be ~{serial:.1f}s). Reports in {report_dir}")
+
+    failed = [r for r in results if not r.passed]
+    if failed:
+        print(f"{len(failed)} module(s) failed: {', '.join(r.module for r in failed)}")
+        return 1
     print("\nAll tests completed successfully.")
+    return 0
+
 
 if __name__ == "__main__":
-    run_tests()
+    sys.exit(run_tests())
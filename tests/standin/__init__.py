@@ -0,0 +1,10 @@
+"""Local OrangeHRM stand-in for the E2E suite.
+
+A stdlib HTTP server that renders the Login, Dashboard, PIM, Recruitment,
+Buzz and Report screens with the OXD DOM the page objects rely on, plus the
+``/api/v2`` endpoints the tests and :mod:`support.api` call. Enabled with
+``STANDIN=1``; ``STANDIN_LATENCY_MS`` delays every response.
+"""
+from .server import StandinServer, standin_enabled
+
+__all__ = ["StandinServer", "standin_enabled"]
@@ -0,0 +1,402 @@
+"""``/web/index.php/api/v2`` endpoints of the stand-in.
+
+Only the endpoints the suite (pages and :mod:`support.api`) calls are
+implemented, with the response envelope OrangeHRM uses: ``{"data": ...,
+"meta": {...}, "rels": []}``.
+"""
+import base64
+import re
+
+from . import store as data
+
+ROUTES = []
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def route(method, pattern):
+    def register(fn):
+        ROUTES.append((method, re.compile(pattern + "$"), fn))
+        return fn
+    return register
+
+
+def dispatch(store, request, path):
+    """``(status, payload)`` for an API path (without the ``/api/v2/`` prefix)."""
+    allowed = False
+    for method, pattern, handler in ROUTES:
+        match = pattern.match(path)
+        if match is None:
+            continue
+        allowed = True
+        if method == request.method:
+            try:
+                result = handler(store, request, *match.groups())
+            except HttpError as exc:
+                return exc.status, {"error": {"status": str(exc.status), "message": str(exc)}}
+            data_, meta = result if isinstance(result, tuple) else (result, {})
+            return 200, {"data": data_, "meta": meta, "rels": []}
+    if allowed:
+        return 405, {"error": {"status": "405", "message": "Method Not Allowed"}}
+    return 404, {"error": {"status": "404", "message": "Not Found"}}
+
+
+def _listing(items, request):
+    limit = int(request.param("limit", 50) or 0)
+    offset = int(request.param("offset", 0) or 0)
+    page = items[offset:offset + limit] if limit else items[offset:]
+    return page, {"total": len(items)}
+
+
+def _employee(store, emp_number):
+    employee = store.employees.get(int(emp_number))
+    if employee is None:
+        raise HttpError(404, "Record Not Found")
+    return employee
+
+
+def _ids(request):
+    return [int(i) for i in request.json().get("ids", [])]
+
+
+# PIM
+
+@route("GET", r"pim/employees")
+def list_employees(store, request):
+    status = request.param("empStatusId")
+    supervisors = [int(s) for s in request.params.get("supervisorEmpNumbers[]", []) if s]
+    found = store.search_employees(
+        name=request.param("nameOrId"),
+        status_id=int(status) if status else None,
+        supervisor_ids=supervisors,
+    )
+    return _listing(found, request)
+
+
+@route("POST", r"pim/employees")
+def create_employee(store, request):
+    payload = request.json()
+    if not payload.get("firstName") or not payload.get("lastName"):
+        raise HttpError(422, "Invalid Parameter")
+    if len(payload.get("employeeId") or "") > 10:
+        raise HttpError(422, "Employee Id should not exceed 10 characters")
+    return store.employee_summary(store.add_employee(payload))
+
+
+@route("DELETE", r"pim/employees")
+def delete_employees(store, request):
+    ids = _ids(request)
+    store.delete_employees(ids)
+    return ids
+
+
+@route("GET", r"pim/employees/(\d+)/personal-details")
+def get_personal_details(store, request, emp_number):
+    employee = _employee(store, emp_number)
+    return {**store.employee_summary(employee), **employee["personal"]}
+
+
+@route("PUT", r"pim/employees/(\d+)/personal-details")
+def update_personal_details(store, request, emp_number):
+    employee = _employee(store, emp_number)
+    payload = request.json()
+    with store.lock:
+        for key in ("firstName", "middleName", "lastName", "employeeId"):
+            if key in payload:
+                employee[key] = payload.pop(key) or ""
+        employee["personal"].update(payload)
+    return {**store.employee_summary(employee), **employee["personal"]}
+
+
+@route("GET", r"pim/employees/(\d+)/job-details")
+def get_job_details(store, request, emp_number):
+    return dict(_employee(store, emp_number)["job"])
+
+
+@route("PUT", r"pim/employees/(\d+)/job-details")
+def update_job_details(store, request, emp_number):
+    employee = _employee(store, emp_number)
+    with store.lock:
+        employee["job"].update({k: v for k, v in request.json().items() if v not in ("", None)})
+    return dict(employee["job"])
+
+
+@route("GET", r"pim/employees/(\d+)/supervisors")
+def list_supervisors(store, request, emp_number):
+    employee = _employee(store, emp_number)
+    rows = []
+    for link in employee["supervisors"]:
+        supervisor = store.employees.get(link["empNumber"])
+        if supervisor is not None:
+            rows.append({
+                "supervisor": store.employee_summary(supervisor),
+                "reportingMethod": {"id": link["reportingMethodId"], "name": data.REPORTING_METHODS[link["reportingMethodId"] - 1]},
+            })
+    return _listing(rows, request)
+
+
+@route("POST", r"pim/employees/(\d+)/supervisors")
+def add_supervisor(store, request, emp_number):
+    employee = _employee(store, emp_number)
+    payload = request.json()
+    supervisor = _employee(store, payload.get("empNumber") or 0)
+    method = int(payload.get("reportingMethodId") or 0)
+    if not 1 <= method <= len(data.REPORTING_METHODS):
+        raise HttpError(422, "Invalid Parameter")
+    with store.lock:
+        employee["supervisors"].append({"empNumber": supervisor["empNumber"], "reportingMethodId": method})
+    return {"supervisor": store.employee_summary(supervisor), "reportingMethod": {"id": method}}
+
+
+def _attachment_view(attachment):
+    return {k: v for k, v in attachment.items() if k != "content"}
+
+
+@route("GET", r"pim/employees/(\d+)/screen/personal/attachments")
+def list_attachments(store, request, emp_number):
+    attachments = _employee(store, emp_number)["attachments"]
+    return _listing([_attachment_view(a) for a in attachments.values()], request)
+
+
+@route("POST", r"pim/employees/(\d+)/screen/personal/attachments")
+def add_attachment(store, request, emp_number):
+    employee = _employee(store, emp_number)
+    payload = request.json()
+    upload = payload.get("attachment") or {}
+    if not upload.get("name"):
+        raise HttpError(422, "Invalid Parameter")
+    content = base64.b64decode(upload.get("base64") or "")
+    attachment = store.add_attachment(employee, upload["name"], upload.get("type") or "application/octet-stream", content, payload.get("description") or "")
+    return _attachment_view(attachment)
+
+
+@route("PUT", r"pim/employees/(\d+)/screen/personal/attachments/(\d+)")
+def update_attachment(store, request, emp_number, attach_id):
+    attachment = _employee(store, emp_number)["attachments"].get(int(attach_id))
+    if attachment is None:
+        raise HttpError(404, "Record Not Found")
+    with store.lock:
+        attachment["description"] = request.json().get("description") or ""
+    return _attachment_view(attachment)
+
+
+@route("DELETE", r"pim/employees/(\d+)/screen/personal/attachments")
+def delete_attachments(store, request, emp_number):
+    attachments = _employee(store, emp_number)["attachments"]
+    ids = _ids(request)
+    with store.lock:
+        for attach_id in ids:
+            attachments.pop(attach_id, None)
+    return ids
+
+
+@route("POST", r"pim/reports")
+def create_report(store, request):
+    payload = request.json()
+    if not payload.get("name"):
+        raise HttpError(422, "Invalid Parameter")
+    return store.add_report(payload)
+
+
+# Admin
+
+@route("POST", r"admin/users")
+def create_user(store, request):
+    payload = request.json()
+    username = payload.get("username") or ""
+    if len(username) < 5 or username in store.users:
+        raise HttpError(422, "Username already exists" if username in store.users else "Should have at least 5 characters")
+    store.users[username] = payload.get("password") or ""
+    return {"id": store.next_id(), "userName": username, "empNumber": payload.get("empNumber")}
+
+
+@route("GET", r"admin/job-titles")
+def job_titles(store, request):
+    return _listing(data.option_list(data.JOB_TITLES), request)
+
+
+@route("GET", r"admin/employment-statuses")
+def employment_statuses(store, request):
+    return _listing(data.option_list(data.EMPLOYMENT_STATUSES), request)
+
+
+# Recruitment
+
+@route("GET", r"recruitment/vacancies")
+def list_vacancies(store, request):
+    return _listing(list(store.vacancies.values()), request)
+
+
+@route("POST", r"recruitment/vacancies")
+def create_vacancy(store, request):
+    payload = request.json()
+    if not payload.get("name") or not payload.get("jobTitleId"):
+        raise HttpError(422, "Invalid Parameter")
+    if any(v["name"] == payload["name"] for v in store.vacancies.values()):
+        raise HttpError(422, "Already exists")
+    return store.add_vacancy(payload)
+
+
+@route("DELETE", r"recruitment/vacancies")
+def delete_vacancies(store, request):
+    ids = _ids(request)
+    with store.lock:
+        for vacancy_id in ids:
+            store.vacancies.pop(vacancy_id, None)
+    return ids
+
+
+def _candidate(store, candidate_id):
+    candidate = store.candidates.get(int(candidate_id))
+    if candidate is None:
+        raise HttpError(404, "Record Not Found")
+    return candidate
+
+
+@route("GET", r"recruitment/candidates")
+def list_candidates(store, request):
+    return _listing(list(store.candidates.values()), request)
+
+
+@route("POST", r"recruitment/candidates")
+def create_candidate(store, request):
+    payload = request.json()
+    if not payload.get("firstName") or not payload.get("lastName") or not payload.get("email"):
+        raise HttpError(422, "Invalid Parameter")
+    return store.add_candidate(payload)
+
+
+@route("GET", r"recruitment/candidates/(\d+)")
+def get_candidate(store, request, candidate_id):
+    return _candidate(store, candidate_id)
+
+
+@route("DELETE", r"recruitment/candidates")
+def delete_candidates(store, request):
+    ids = _ids(request)
+    with store.lock:
+        for candidate_id in ids:
+            store.candidates.pop(candidate_id, None)
+    return ids
+
+
+@route("PUT", r"recruitment/candidates/(\d+)/shortlist")
+def shortlist_candidate(store, request, candidate_id):
+    candidate = _candidate(store, candidate_id)
+    if candidate["status"]["id"] != 1:
+        raise HttpError(422, "Action not allowed")
+    store.set_candidate_status(candidate, 2, note=request.json().get("note"))
+    return candidate
+
+
+@route("PUT", r"recruitment/candidates/(\d+)/reject")
+def reject_candidate(store, request, candidate_id):
+    candidate = _candidate(store, candidate_id)
+    store.set_candidate_status(candidate, 3, note=request.json().get("note"))
+    return candidate
+
+
+@route("POST", r"recruitment/candidates/(\d+)/shedule-interview")
+def schedule_interview(store, request, candidate_id):
+    candidate = _candidate(store, candidate_id)
+    payload = request.json()
+    if candidate["status"]["id"] != 2 or not payload.get("interviewName"):
+        raise HttpError(422, "Invalid Parameter")
+    store.set_candidate_status(candidate, 4, **payload)
+    return candidate
+
+
+# Buzz
+
+def _post(store, share_id):
+    post = store.posts.get(int(share_id))
+    if post is None:
+        raise HttpError(404, "Record Not Found")
+    return post
+
+
+def _comment(post, comment_id):
+    comment = post["comments"].get(int(comment_id))
+    if comment is None:
+        raise HttpError(404, "Record Not Found")
+    return comment
+
+
+@route("GET", r"buzz/feed")
+def feed(store, request):
+    return _listing(store.feed(), request)
+
+
+@route("POST", r"buzz/posts")
+def create_post(store, request):
+    payload = request.json()
+    upload = payload.get("photo")
+    if not (payload.get("text") or "").strip() and not upload:
+        raise HttpError(422, "Invalid Parameter")
+    photo = None
+    if upload:
+        photo = {"name": upload.get("name"), "type": upload.get("type") or "image/png", "content": base64.b64decode(upload.get("base64") or "")}
+    emp_number = next(iter(store.employees), None)
+    return store.post_view(store.add_post(emp_number, payload.get("text") or "", photo))
+
+
+@route("PUT", r"buzz/posts/(\d+)")
+def update_post(store, request, share_id):
+    post = _post(store, share_id)
+    with store.lock:
+        post["text"] = request.json().get("text") or ""
+    return store.post_view(post)
+
+
+@route("DELETE", r"buzz/shares/(\d+)")
+def delete_post(store, request, share_id):
+    with store.lock:
+        _post(store, share_id)
+        store.posts.pop(int(share_id))
+    return {"id": int(share_id)}
+
+
+@route("POST", r"buzz/shares/(\d+)/likes")
+def like_post(store, request, share_id):
+    return _toggle_like(store, _post(store, share_id))
+
+
+@route("POST", r"buzz/shares/(\d+)/comments")
+def add_comment(store, request, share_id):
+    text = (request.json().get("text") or "").strip()
+    if not text:
+        raise HttpError(422, "Invalid Parameter")
+    return store.add_comment(_post(store, share_id), text)
+
+
+@route("PUT", r"buzz/shares/(\d+)/comments/(\d+)")
+def update_comment(store, request, share_id, comment_id):
+    comment = _comment(_post(store, share_id), comment_id)
+    with store.lock:
+        comment["text"] = request.json().get("text") or comment["text"]
+    return dict(comment)
+
+
+@route("DELETE", r"buzz/shares/(\d+)/comments/(\d+)")
+def delete_comment(store, request, share_id, comment_id):
+    post = _post(store, share_id)
+    with store.lock:
+        _comment(post, comment_id)
+        post["comments"].pop(int(comment_id))
+    return {"id": int(comment_id)}
+
+
+@route("POST", r"buzz/shares/(\d+)/comments/(\d+)/likes")
+def like_comment(store, request, share_id, comment_id):
+    return _toggle_like(store, _comment(_post(store, share_id), comment_id))
+
+
+def _toggle_like(store, item):
+    with store.lock:
+        item["liked"] = not item["liked"]
+        item["likes"] += 1 if item["liked"] else -1
+    return {"liked": item["liked"], "likes": item["likes"]}
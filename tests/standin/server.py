@@ -0,0 +1,165 @@
+"""HTTP plumbing of the stand-in: sessions, routing, static files and latency."""
+import json
+import mimetypes
+import os
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from . import rest, views
+from .store import Store
+
+PREFIX = views.PREFIX
+SESSION_COOKIE = "orangehrm"
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+def standin_enabled():
+    return os.getenv("STANDIN", "0").lower() in ("1", "true", "yes")
+
+
+class Request:
+    def __init__(self, method, path, params, body, session):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.body = body
+        self.session = session
+        self._json = None
+
+    def param(self, name, default=None):
+        values = self.params.get(name)
+        return values[0] if values else default
+
+    def json(self):
+        if self._json is None:
+            self._json = json.loads(self.body or b"{}")
+        return self._json
+
+    def form(self):
+        return {key: values[0] for key, values in parse_qs(self.body.decode()).items()}
+
+
+class StandinServer:
+    """A local OrangeHRM stand-in served from a background thread.
+
+    ``port=0`` picks a free port; :attr:`url` is the ``base_url`` to test
+    against. ``latency`` (seconds) is added before every response, so the
+    framework's own overhead can be measured with and without a slow server.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0):
+        self.store = Store()
+        self.latency = latency
+        self.token = secrets.token_hex(16)
+        self.sessions = set()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.1}, name="orangehrm-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def handle(self, method, target, headers, body):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+        parts = urlsplit(target)
+        path = parts.path
+        cookie = SimpleCookie(headers.get("Cookie") or "")
+        session = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        if session not in self.sessions:
+            session = None
+        request = Request(method, path, parse_qs(parts.query), body, session)
+
+        if path.startswith("/web/dist/"):
+            return self._static(path[len("/web/dist/"):])
+        route = path[len(PREFIX):].strip("/") if path.startswith(PREFIX) else None
+        if route is None or route == "":
+            return views.redirect(f"{PREFIX}/{'dashboard/index' if session else 'auth/login'}")
+        if route.startswith("api/v2/"):
+            if session is None:
+                return views.json_response(401, {"error": {"status": "401", "message": "Session expired"}})
+            try:
+                status, payload = rest.dispatch(self.store, request, route[len("api/v2/"):])
+            except (ValueError, KeyError, TypeError) as exc:
+                status, payload = 422, {"error": {"status": "422", "message": f"Invalid Parameter: {exc}"}}
+            return views.json_response(status, payload)
+        if route == "auth/login":
+            return views.html_response(views.login_page(self.token, error="error" in request.params))
+        if route == "auth/validate" and method == "POST":
+            return self._login(request)
+        if route == "auth/logout":
+            self.sessions.discard(session)
+            return views.redirect(f"{PREFIX}/auth/login")
+        if session is None:
+            return views.redirect(f"{PREFIX}/auth/login")
+        return views.dispatch(self.store, request, route)
+
+    def _login(self, request):
+        form = request.form()
+        username, password = form.get("username", ""), form.get("password", "")
+        if form.get("_token") != self.token or self.store.users.get(username) != password or not password:
+            return views.redirect(f"{PREFIX}/auth/login?error=1")
+        session = secrets.token_hex(16)
+        self.sessions.add(session)
+        return views.redirect(f"{PREFIX}/dashboard/index", [
+            ("Set-Cookie", f"{SESSION_COOKIE}={session}; Path=/; HttpOnly; SameSite=Lax"),
+        ])
+
+    def _static(self, name):
+        path = os.path.normpath(os.path.join(STATIC_DIR, name))
+        if not path.startswith(STATIC_DIR + os.sep) or not os.path.isfile(path):
+            return views.Response(404, [("Content-Type", "text/plain")], b"Not Found")
+        with open(path, "rb") as f:
+            content = f.read()
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        return views.Response(200, [("Content-Type", content_type), ("Cache-Control", "public, max-age=3600")], content)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "OrangeHRM-standin"
+
+    def _serve(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        response = self.server.standin.handle(self.command, self.path, self.headers, body)
+        self.send_response(response.status)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(response.body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _serve
+
+    def log_message(self, format, *args):
+        pass
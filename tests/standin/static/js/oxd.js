@@ -0,0 +1,789 @@
+/* OrangeHRM stand-in front end: OXD widgets (select, autocomplete, toast,
+ * dialog, dropdown menu) and one controller per screen, keyed by
+ * <body data-page>. Data goes through the REST API with XMLHttpRequest, as
+ * the real (axios based) front end does. */
+(function () {
+    'use strict';
+
+    const API = '/web/index.php/api/v2/';
+    const PREFIX = '/web/index.php/';
+    const config = window.oxdConfig = Object.assign({toastMs: 3000, searchDelayMs: 300}, window.oxdConfig || {});
+    const stateNode = document.getElementById('oxd-state');
+    const state = stateNode ? JSON.parse(stateNode.textContent) : {};
+
+    const $ = (sel, root) => (root || document).querySelector(sel);
+    const $$ = (sel, root) => Array.from((root || document).querySelectorAll(sel));
+
+    function h(html) {
+        const t = document.createElement('template');
+        t.innerHTML = html.trim();
+        return t.content.firstElementChild;
+    }
+
+    function esc(value) {
+        return String(value == null ? '' : value).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+    }
+
+    function fromTemplate(name) {
+        return document.importNode($(`template[data-template="${name}"]`).content, true).firstElementChild;
+    }
+
+    function qs(params) {
+        const parts = [];
+        Object.keys(params).forEach(key => {
+            const value = params[key];
+            if (value === null || value === undefined || value === '') return;
+            (Array.isArray(value) ? value : [value]).forEach(v => parts.push(`${encodeURIComponent(key)}=${encodeURIComponent(v)}`));
+        });
+        return parts.length ? '?' + parts.join('&') : '';
+    }
+
+    function api(method, path, body) {
+        return new Promise((resolve, reject) => {
+            const xhr = new XMLHttpRequest();
+            xhr.open(method, API + path);
+            xhr.setRequestHeader('Accept', 'application/json');
+            if (body !== undefined) xhr.setRequestHeader('Content-Type', 'application/json');
+            xhr.onload = () => {
+                let json = null;
+                try { json = JSON.parse(xhr.responseText); } catch (e) { /* not JSON */ }
+                if (xhr.status >= 200 && xhr.status < 300) return resolve(json);
+                const message = (json && json.error && json.error.message) || xhr.statusText;
+                reject(Object.assign(new Error(message), {status: xhr.status}));
+            };
+            xhr.onerror = () => reject(new Error('Network Error'));
+            xhr.send(body === undefined ? null : JSON.stringify(body));
+        });
+    }
+
+    function readFile(file) {
+        return new Promise((resolve, reject) => {
+            const reader = new FileReader();
+            reader.onload = () => resolve({name: file.name, type: file.type, size: file.size, base64: String(reader.result).split(',')[1] || ''});
+            reader.onerror = () => reject(reader.error);
+            reader.readAsDataURL(file);
+        });
+    }
+
+    function fullName(p) {
+        return [p.firstName, p.middleName, p.lastName].filter(Boolean).join(' ');
+    }
+
+    function records(total) {
+        return total ? `(${total}) Record${total === 1 ? '' : 's'} Found` : 'No Records Found';
+    }
+
+    // Toasts and dialogs
+
+    function toast(kind, title, message) {
+        let container = $('.oxd-toast-container');
+        if (!container) {
+            container = h('<div class="oxd-toast-container oxd-toast-container--bottom"></div>');
+            document.body.appendChild(container);
+        }
+        const el = h(`<div class="oxd-toast oxd-toast--${kind} oxd-toast-container--toast"><div class="oxd-toast-start">
+            <div class="oxd-toast-content oxd-toast-content--${kind}"><p class="oxd-text oxd-text--p oxd-text--toast-title oxd-toast-content-text">${esc(title)}</p>
+            <p class="oxd-text oxd-text--p oxd-text--toast-message oxd-toast-content-text">${esc(message)}</p></div></div></div>`);
+        container.appendChild(el);
+        setTimeout(() => el.remove(), config.toastMs);
+    }
+
+    const saved = message => toast('success', 'Success', message || 'Successfully Saved');
+    const failed = err => toast('error', 'Error', err && err.message ? err.message : 'Unexpected Error!');
+
+    function confirmDelete() {
+        return new Promise(resolve => {
+            const dialog = h(`<div class="oxd-dialog-container-default"><div class="oxd-overlay oxd-overlay--flex oxd-overlay--flex-centered">
+                <div class="oxd-dialog-sheet oxd-dialog-sheet--shadow oxd-dialog-sheet--gutters orangehrm-dialog-popup" role="document">
+                <div class="orangehrm-modal-header"><p class="oxd-text oxd-text--p oxd-text--card-title">Are you Sure?</p></div>
+                <div class="orangehrm-text-center-align"><p class="oxd-text oxd-text--p oxd-text--card-body">The selected record will be permanently deleted. Are you sure you want to continue?</p></div>
+                <div class="orangehrm-modal-footer">
+                <button type="button" class="oxd-button oxd-button--medium oxd-button--ghost orangehrm-button-margin" data-answer="no">No, Cancel</button>
+                <button type="button" class="oxd-button oxd-button--medium oxd-button--label-danger orangehrm-button-margin" data-answer="yes">Yes, Delete</button>
+                </div></div></div></div>`);
+            dialog.addEventListener('click', e => {
+                const answer = e.target.closest('button[data-answer]');
+                if (!answer) return;
+                dialog.remove();
+                resolve(answer.dataset.answer === 'yes');
+            });
+            document.body.appendChild(dialog);
+        });
+    }
+
+    // Select and autocomplete
+
+    function options(wrapper) {
+        return JSON.parse(wrapper.dataset.options || '[]');
+    }
+
+    function setOptions(wrapper, list) {
+        wrapper.dataset.options = JSON.stringify(list);
+        closeListbox(wrapper);
+        wrapper._listbox = null;
+        setSelectValue(wrapper, null, true);
+    }
+
+    function setSelectValue(wrapper, id, silent) {
+        const option = options(wrapper).find(o => String(o.id) === String(id));
+        wrapper.dataset.value = option ? option.id : '';
+        $('.oxd-select-text-input', wrapper).textContent = option ? option.name : '-- Select --';
+        if (!silent) wrapper.dispatchEvent(new CustomEvent('oxd-change', {bubbles: true, detail: option || null}));
+    }
+
+    function selectedName(wrapper) {
+        const option = options(wrapper).find(o => String(o.id) === wrapper.dataset.value);
+        return option ? option.name : null;
+    }
+
+    function closeListbox(wrapper) {
+        wrapper.classList.remove('--open');
+        if (wrapper._listbox) wrapper._listbox.remove();
+    }
+
+    function closeAll(except) {
+        $$('.oxd-select-wrapper.--open, .oxd-autocomplete-wrapper.--open').forEach(w => { if (w !== except) closeListbox(w); });
+    }
+
+    // The listbox element is kept between openings (and rebuilt only when the
+    // options change), so option elements stay valid while a select is reused.
+    function openSelect(wrapper) {
+        closeAll(wrapper);
+        if (!wrapper._listbox) {
+            const listbox = h('<div role="listbox" class="oxd-select-dropdown --positon-bottom"></div>');
+            options(wrapper).forEach(o => {
+                const el = h(`<div role="option" class="oxd-select-option"><span>${esc(o.name)}</span></div>`);
+                el.dataset.id = o.id;
+                listbox.appendChild(el);
+            });
+            wrapper._listbox = listbox;
+        }
+        highlight(wrapper, -1);
+        wrapper.appendChild(wrapper._listbox);
+        wrapper.classList.add('--open');
+    }
+
+    function highlight(wrapper, index) {
+        const items = $$('[role=option]', wrapper._listbox);
+        wrapper._active = Math.max(-1, Math.min(index, items.length - 1));
+        items.forEach((el, i) => el.classList.toggle('--focus', i === wrapper._active));
+    }
+
+    function pick(wrapper, option) {
+        if (wrapper.classList.contains('oxd-select-wrapper')) {
+            setSelectValue(wrapper, option.dataset.id);
+            closeListbox(wrapper);
+            $('.oxd-select-text-input', wrapper).focus();
+        } else if (option.dataset.id) {
+            $('input', wrapper).value = option.textContent.trim();
+            wrapper.dataset.value = option.dataset.id;
+            closeListbox(wrapper);
+        }
+    }
+
+    function suggest(wrapper, hint) {
+        api('GET', 'pim/employees' + qs({nameOrId: hint, limit: 10})).then(res => {
+            if ($('input', wrapper).value.trim() !== hint) return;
+            const listbox = h('<div role="listbox" class="oxd-autocomplete-dropdown --positon-bottom"></div>');
+            if (!res.data.length) listbox.appendChild(h('<div role="option" class="oxd-autocomplete-option --no-results">No Records Found</div>'));
+            res.data.forEach(p => {
+                const el = h(`<div role="option" class="oxd-autocomplete-option"><span>${esc(fullName(p))}</span></div>`);
+                el.dataset.id = p.empNumber;
+                listbox.appendChild(el);
+            });
+            closeListbox(wrapper);
+            wrapper._listbox = listbox;
+            closeAll(wrapper);
+            wrapper.appendChild(listbox);
+            wrapper.classList.add('--open');
+        }).catch(failed);
+    }
+
+    function closeMenus(except) {
+        $$('.oxd-dropdown-menu').forEach(menu => { if (menu !== except) menu.remove(); });
+    }
+
+    document.addEventListener('click', e => {
+        const option = e.target.closest('[role=option]');
+        if (option) {
+            pick(option.closest('.oxd-select-wrapper, .oxd-autocomplete-wrapper'), option);
+            return;
+        }
+        const box = e.target.closest('.oxd-select-text');
+        const wrapper = box && box.closest('.oxd-select-wrapper');
+        closeAll(wrapper);
+        if (wrapper) {
+            if (wrapper.classList.contains('--open')) closeListbox(wrapper);
+            else openSelect(wrapper);
+        }
+        if (!e.target.closest('.oxd-dropdown-menu, [data-menu]')) closeMenus(null);
+        const link = e.target.closest('button[data-href]');
+        if (link) location.href = link.dataset.href;
+    });
+
+    document.addEventListener('keydown', e => {
+        const box = e.target.closest && e.target.closest('.oxd-select-text-input');
+        if (!box) return;
+        const wrapper = box.closest('.oxd-select-wrapper');
+        const open = wrapper.classList.contains('--open');
+        if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+            e.preventDefault();
+            if (!open) openSelect(wrapper);
+            highlight(wrapper, wrapper._active + (e.key === 'ArrowDown' ? 1 : -1));
+        } else if (e.key === 'Enter') {
+            e.preventDefault();
+            const items = open ? $$('[role=option]', wrapper._listbox) : [];
+            if (items[wrapper._active]) pick(wrapper, items[wrapper._active]);
+            else if (!open) openSelect(wrapper);
+        } else if (e.key === 'Escape' || e.key === 'Tab') {
+            closeListbox(wrapper);
+        }
+    });
+
+    document.addEventListener('input', e => {
+        const wrapper = e.target.closest && e.target.closest('.oxd-autocomplete-wrapper');
+        if (!wrapper) return;
+        wrapper.dataset.value = '';
+        clearTimeout(wrapper._timer);
+        const hint = e.target.value.trim();
+        if (!hint) return closeListbox(wrapper);
+        wrapper._timer = setTimeout(() => suggest(wrapper, hint), config.searchDelayMs);
+    });
+
+    // Forms
+
+    function collect(root) {
+        const values = {};
+        $$('[data-field]', root).forEach(el => {
+            const name = el.dataset.field;
+            if (el.classList.contains('oxd-select-wrapper') || el.classList.contains('oxd-autocomplete-wrapper')) {
+                values[name] = el.dataset.value ? Number(el.dataset.value) : null;
+            } else if (el.type === 'checkbox') {
+                values[name] = el.checked;
+            } else if (el.type === 'radio') {
+                if (el.checked) values[name] = el.value;
+                else if (!(name in values)) values[name] = null;
+            } else if (el.type === 'file') {
+                values[name] = el.files[0] || null;
+            } else {
+                values[name] = el.value;
+            }
+        });
+        return values;
+    }
+
+    function fill(root, values) {
+        $$('[data-field]', root).forEach(el => {
+            const name = el.dataset.field;
+            if (!(name in values)) return;
+            const value = values[name];
+            if (el.classList.contains('oxd-select-wrapper')) setSelectValue(el, value, true);
+            else if (el.type === 'checkbox') el.checked = Boolean(value);
+            else if (el.type === 'radio') el.checked = value != null && String(el.value) === String(value);
+            else if (el.type !== 'file') el.value = value == null ? '' : value;
+        });
+    }
+
+    function fieldError(el, message) {
+        const group = el.closest('.oxd-input-group');
+        group.appendChild(h(`<span class="oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message">${esc(message)}</span>`));
+    }
+
+    function validate(root) {
+        $$('.oxd-input-field-error-message', root).forEach(el => el.remove());
+        let ok = true;
+        $$('[data-required]', root).forEach(el => {
+            if (el.closest('[hidden]')) return;
+            const wrapped = el.classList.contains('oxd-select-wrapper') || el.classList.contains('oxd-autocomplete-wrapper');
+            const empty = wrapped ? !el.dataset.value : el.type === 'file' ? !el.files.length : !el.value.trim();
+            if (empty) {
+                ok = false;
+                fieldError(el, 'Required');
+            }
+        });
+        return ok;
+    }
+
+    function onSubmit(form, handler) {
+        form.addEventListener('submit', e => {
+            e.preventDefault();
+            if (validate(form)) Promise.resolve(handler(collect(form))).catch(failed);
+        });
+    }
+
+    function removeLoader(root) {
+        const loader = $('.oxd-form-loader', root);
+        if (loader) loader.remove();
+    }
+
+    function cell(content) {
+        return `<div class="oxd-table-cell oxd-padding-cell" role="cell"><div>${content}</div></div>`;
+    }
+
+    function card(cells, attrs) {
+        return `<div class="oxd-table-card"${attrs || ''}><div class="oxd-table-row oxd-table-row--with-border" role="row">${cells.join('')}</div></div>`;
+    }
+
+    function iconButton(icon, action, title) {
+        return `<button type="button" class="oxd-icon-button oxd-table-cell-action-space" data-action="${action}" title="${title}"><i class="oxd-icon bi-${icon}"></i></button>`;
+    }
+
+    // Screens
+
+    const pages = {};
+
+    pages.employeeList = () => {
+        const form = $('form[data-form=employee-search]');
+        const body = $('[data-role=rows]');
+        const count = $('[data-role=record-count]');
+        const search = v => api('GET', 'pim/employees' + qs({
+            limit: 50,
+            offset: 0,
+            nameOrId: $('[data-field=employee] input', form).value.trim() || v.employeeId,
+            empStatusId: v.empStatusId,
+            includeEmployees: v.includeEmployees,
+            jobTitleId: v.jobTitleId,
+            'supervisorEmpNumbers[]': v.supervisor ? [v.supervisor] : [],
+        })).then(res => {
+            body.innerHTML = res.data.map(p => card([
+                cell('<div class="oxd-checkbox-wrapper"><label><input type="checkbox"><span class="oxd-checkbox-input"></span></label></div>'),
+                cell(esc(p.employeeId)),
+                cell(esc([p.firstName, p.middleName].filter(Boolean).join(' '))),
+                cell(esc(p.lastName)),
+                cell(esc(p.jobTitle.name)),
+                cell(esc(p.empStatus.name)),
+                cell(esc(p.subunit.name)),
+                cell(esc(p.supervisors.map(fullName).join(', '))),
+                cell(iconButton('pencil-fill', 'edit', 'Edit')),
+            ], ` data-emp-number="${p.empNumber}"`)).join('');
+            count.textContent = records(res.meta.total);
+            if (!res.data.length) toast('info', 'Info', 'No Records Found');
+        });
+        onSubmit(form, search);
+        form.addEventListener('reset', () => setTimeout(() => {
+            $$('.oxd-select-wrapper', form).forEach(w => setSelectValue(w, w.dataset.field === 'includeEmployees' ? 1 : null, true));
+            $$('.oxd-autocomplete-wrapper', form).forEach(w => { w.dataset.value = ''; });
+            search(collect(form));
+        }));
+        body.addEventListener('click', e => {
+            const row = e.target.closest('.oxd-table-card');
+            if (row && !e.target.closest('input')) location.href = `${PREFIX}pim/viewPersonalDetails/empNumber/${row.dataset.empNumber}`;
+        });
+        search(collect(form)).catch(failed);
+    };
+
+    pages.addEmployee = () => {
+        const form = $('form[data-form=add-employee]');
+        const toggle = $('[data-field=createLogin]', form);
+        toggle.addEventListener('change', () => { $('.orangehrm-login-details', form).hidden = !toggle.checked; });
+        onSubmit(form, async v => {
+            if (v.createLogin && v.password !== v.confirmPassword) {
+                fieldError($('[data-field=confirmPassword]', form), 'Passwords do not match');
+                return;
+            }
+            const picture = v.empPicture ? await readFile(v.empPicture) : null;
+            const employee = (await api('POST', 'pim/employees', {
+                firstName: v.firstName, middleName: v.middleName, lastName: v.lastName, employeeId: v.employeeId, empPicture: picture,
+            })).data;
+            if (v.createLogin) {
+                await api('POST', 'admin/users', {
+                    username: v.username, password: v.password, status: v.status !== '0', userRoleId: 2, empNumber: employee.empNumber,
+                });
+            }
+            saved();
+            location.href = `${PREFIX}pim/viewPersonalDetails/empNumber/${employee.empNumber}`;
+        });
+    };
+
+    pages.personalDetails = () => {
+        const form = $('form[data-form=personal-details]');
+        const path = `pim/employees/${state.empNumber}/personal-details`;
+        api('GET', path).then(res => { fill(form, res.data); removeLoader(form); }).catch(failed);
+        onSubmit(form, v => api('PUT', path, v).then(() => saved('Successfully Updated')));
+        attachments($('.orangehrm-attachment'));
+    };
+
+    function attachments(section) {
+        const slot = $('[data-role=attachment-form]', section);
+        const body = $('[data-role=rows]', section);
+        const count = $('[data-role=record-count]', section);
+        const path = `pim/employees/${state.empNumber}/screen/personal/attachments`;
+        const load = () => api('GET', path).then(res => {
+            body.innerHTML = res.data.map(a => card([
+                cell(`<a class="orangehrm-attachment-link" href="${PREFIX}pim/viewAttachment/empNumber/${state.empNumber}/attachId/${a.id}">${esc(a.filename)}</a>`),
+                cell(esc(a.description)),
+                cell(esc(`${(a.size / 1024).toFixed(2)} kB`)),
+                cell(esc(a.fileType)),
+                cell(esc(a.attachedDate)),
+                cell('Admin'),
+                cell(iconButton('pencil-fill', 'edit', 'Edit') + iconButton('download', 'download', 'Download') + iconButton('trash', 'delete', 'Delete')),
+            ], ` data-id="${a.id}" data-description="${esc(a.description)}" data-filename="${esc(a.filename)}"`)).join('');
+            count.textContent = records(res.meta.total);
+        });
+        const show = (name, row) => {
+            slot.innerHTML = '';
+            const form = fromTemplate(name);
+            slot.appendChild(form);
+            $('[data-action=cancel]', form).addEventListener('click', () => { slot.innerHTML = ''; });
+            if (row) {
+                $('[data-field=description]', form).value = row.dataset.description;
+                $('[data-role=current-file]', form).textContent = row.dataset.filename;
+            }
+            onSubmit(form, async v => {
+                if (row) {
+                    await api('PUT', `${path}/${row.dataset.id}`, {description: v.description});
+                } else {
+                    await api('POST', path, {description: v.description, attachment: await readFile(v.attachment)});
+                }
+                slot.innerHTML = '';
+                await load();
+                saved(row ? 'Successfully Updated' : 'Successfully Saved');
+            });
+        };
+        $('.orangehrm-action-header button', section).addEventListener('click', () => show('attachment-add'));
+        body.addEventListener('click', e => {
+            const action = e.target.closest('button[data-action]');
+            if (!action) return;
+            const row = action.closest('.oxd-table-card');
+            if (action.dataset.action === 'edit') show('attachment-edit', row);
+            else if (action.dataset.action === 'download') $('a', row).click();
+            else if (action.dataset.action === 'delete') {
+                confirmDelete().then(yes => yes && api('DELETE', path, {ids: [Number(row.dataset.id)]})
+                    .then(load).then(() => saved('Successfully Deleted'))).catch(failed);
+            }
+        });
+        load().catch(failed);
+    }
+
+    pages.job = () => {
+        const form = $('form[data-form=job-details]');
+        const path = `pim/employees/${state.empNumber}/job-details`;
+        api('GET', path).then(res => { fill(form, res.data); removeLoader(form); }).catch(failed);
+        onSubmit(form, v => api('PUT', path, v).then(() => saved('Successfully Updated')));
+    };
+
+    pages.reportTo = () => {
+        const section = $('[data-section=supervisors]');
+        const slot = $('[data-role=supervisor-form]', section);
+        const body = $('[data-role=rows]', section);
+        const count = $('[data-role=record-count]', section);
+        const path = `pim/employees/${state.empNumber}/supervisors`;
+        const load = () => api('GET', path).then(res => {
+            body.innerHTML = res.data.map(row => card([
+                cell(esc(fullName(row.supervisor))),
+                cell(esc(row.reportingMethod.name)),
+                cell(iconButton('pencil-fill', 'edit', 'Edit')),
+            ])).join('');
+            count.textContent = records(res.meta.total);
+        });
+        $('.orangehrm-action-header button', section).addEventListener('click', () => {
+            slot.innerHTML = '';
+            const form = fromTemplate('supervisor-form');
+            slot.appendChild(form);
+            $('[data-action=cancel]', form).addEventListener('click', () => { slot.innerHTML = ''; });
+            onSubmit(form, async v => {
+                await api('POST', path, {empNumber: v.empNumber, reportingMethodId: v.reportingMethodId});
+                slot.innerHTML = '';
+                await load();
+                saved();
+            });
+        });
+        load().catch(failed);
+    };
+
+    pages.candidates = () => {
+        const body = $('[data-role=rows]');
+        const count = $('[data-role=record-count]');
+        api('GET', 'recruitment/candidates' + qs({limit: 50})).then(res => {
+            body.innerHTML = res.data.map(c => card([
+                cell(esc(c.vacancy ? c.vacancy.name : '')),
+                cell(esc(fullName(c))),
+                cell(''),
+                cell(esc(c.dateOfApplication)),
+                cell(esc(c.status.label)),
+                cell(iconButton('eye-fill', 'view', 'View')),
+            ], ` data-id="${c.id}"`)).join('');
+            count.textContent = records(res.meta.total);
+        }).catch(failed);
+        body.addEventListener('click', e => {
+            const row = e.target.closest('.oxd-table-card');
+            if (row) location.href = `${PREFIX}recruitment/addCandidate/${row.dataset.id}`;
+        });
+    };
+
+    pages.addCandidate = () => {
+        const form = $('form[data-form=add-candidate]');
+        onSubmit(form, async v => {
+            const resume = v.resume ? await readFile(v.resume) : null;
+            const candidate = (await api('POST', 'recruitment/candidates', {
+                firstName: v.firstName, middleName: v.middleName, lastName: v.lastName, email: v.email,
+                contactNumber: v.contactNumber, keywords: v.keywords, comment: v.comment,
+                dateOfApplication: v.dateOfApplication, consentToKeepData: v.consentToKeepData,
+                vacancyId: v.vacancyId, resume: resume,
+            })).data;
+            saved();
+            location.href = `${PREFIX}recruitment/addCandidate/${candidate.id}`;
+        });
+    };
+
+    const STAGE_ACTIONS = {
+        1: [['Reject', 'reject', 'danger'], ['Shortlist', 'shortlist', 'success']],
+        2: [['Reject', 'reject', 'danger'], ['Schedule Interview', 'interview', 'success']],
+        3: [],
+        4: [['Reject', 'reject', 'danger'], ['Mark Interview Failed', 'failed', 'danger'], ['Mark Interview Passed', 'passed', 'success']],
+    };
+
+    pages.candidate = () => {
+        const statusNode = $('[data-role=status]');
+        const actionsNode = $('[data-role=stage-actions]');
+        const slot = $('[data-role=stage-form]');
+        const id = state.candidate.id;
+        const render = candidate => {
+            statusNode.textContent = `Status: ${candidate.status.label}`;
+            actionsNode.innerHTML = STAGE_ACTIONS[candidate.status.id].map(([label, action, style]) =>
+                `<button type="button" class="oxd-button oxd-button--medium oxd-button--${style}" data-stage="${action}">${esc(label)}</button>`).join('');
+        };
+        const show = (template, submit) => {
+            slot.innerHTML = '';
+            const form = fromTemplate(template);
+            slot.appendChild(form);
+            $('[data-action=cancel]', form).addEventListener('click', () => { slot.innerHTML = ''; });
+            onSubmit(form, async v => {
+                const candidate = (await submit(v)).data;
+                slot.innerHTML = '';
+                render(candidate);
+                saved('Successfully Updated');
+            });
+        };
+        actionsNode.addEventListener('click', e => {
+            const button = e.target.closest('button[data-stage]');
+            if (!button) return;
+            const stage = button.dataset.stage;
+            if (stage === 'shortlist') {
+                show('stage-shortlist', v => api('PUT', `recruitment/candidates/${id}/shortlist`, {note: v.note}));
+            } else if (stage === 'interview') {
+                show('stage-interview', v => api('POST', `recruitment/candidates/${id}/shedule-interview`, {
+                    interviewName: v.interviewName,
+                    interviewerEmpNumbers: v.interviewer ? [v.interviewer] : [],
+                    interviewDate: v.interviewDate,
+                    interviewTime: v.interviewTime,
+                    note: v.note,
+                }));
+            } else if (stage === 'reject') {
+                api('PUT', `recruitment/candidates/${id}/reject`, {note: null}).then(res => { render(res.data); saved('Successfully Updated'); }).catch(failed);
+            }
+        });
+        render(state.candidate);
+    };
+
+    function postHtml(post) {
+        const photos = post.photos.map(p => `<img class="orangehrm-buzz-photos-item" alt="${esc(p.name)}" src="${PREFIX}buzz/photo/${post.id}/${p.id}">`).join('');
+        return `<div class="oxd-sheet oxd-sheet--rounded oxd-sheet--white orangehrm-buzz-post" data-share-id="${post.id}">
+            <div class="orangehrm-buzz-post-header"><div class="orangehrm-buzz-post-header-details">
+            <p class="oxd-text oxd-text--p orangehrm-buzz-post-emp-name">${esc(post.author)}</p><p class="oxd-text oxd-text--p orangehrm-buzz-post-time">${esc(post.createdAt)}</p></div>
+            <div class="orangehrm-buzz-post-header-config" data-menu="post"><button type="button" class="oxd-icon-button"><i class="oxd-icon bi-three-dots"></i></button></div></div>
+            <div class="orangehrm-buzz-post-body"><p class="oxd-text oxd-text--p orangehrm-buzz-post-body-text">${esc(post.text)}</p><div class="orangehrm-buzz-photos">${photos}</div></div>
+            <div class="orangehrm-buzz-post-footer"><div class="orangehrm-buzz-post-actions">
+            <button type="button" class="orangehrm-like-button${post.liked ? ' --liked' : ''}" data-action="like-post"><i class="oxd-icon bi-heart"></i><span>Like</span></button>
+            <button type="button" class="orangehrm-comment-button" data-action="focus-comment"><i class="oxd-icon bi-chat-text"></i><span>Comment</span></button></div>
+            <p class="oxd-text oxd-text--p orangehrm-buzz-stats" data-role="post-likes">${post.likes} Likes</p></div>
+            <div class="orangehrm-post-comment-area"><div class="oxd-input-group"><input class="oxd-input oxd-input--active" placeholder="Write your comment..." data-role="comment-input"></div>
+            <div class="orangehrm-post-comment-list" data-role="comments">${post.comments.map(commentHtml).join('')}</div></div></div>`;
+    }
+
+    function commentHtml(comment) {
+        return `<div class="orangehrm-buzz-comment" data-comment-id="${comment.id}"><div class="orangehrm-comment-header">
+            <span class="oxd-text oxd-text--span orangehrm-comment-author">Paul Collings</span>
+            <div class="orangehrm-comment-config" data-menu="comment"><button type="button" class="oxd-icon-button"><i class="oxd-icon bi-three-dots"></i></button></div></div>
+            <span class="oxd-text oxd-text--span orangehrm-comment-text" data-role="comment-text">${esc(comment.text)}</span>
+            <div class="orangehrm-comment-actions"><button type="button" class="orangehrm-comment-like${comment.liked ? ' --liked' : ''}" data-action="like-comment">Like</button>
+            <span class="oxd-text oxd-text--span" data-role="comment-likes">${comment.likes}</span></div></div>`;
+    }
+
+    pages.buzz = () => {
+        const form = $('form[data-form=buzz-create]');
+        const feed = $('[data-role=feed]');
+        const photoSlot = $('.orangehrm-buzz-photo-input', form);
+        const loadFeed = () => api('GET', 'buzz/feed' + qs({limit: 20})).then(res => { feed.innerHTML = res.data.map(postHtml).join(''); });
+        const shareId = el => el.closest('.orangehrm-buzz-post').dataset.shareId;
+        const reloadComments = post => api('GET', 'buzz/feed' + qs({limit: 0})).then(res => {
+            const fresh = res.data.find(p => String(p.id) === post.dataset.shareId);
+            $('[data-role=comments]', post).innerHTML = fresh ? fresh.comments.map(commentHtml).join('') : '';
+        });
+
+        $('.oxd-buzz-post-img-button', form).addEventListener('click', () => { photoSlot.hidden = false; });
+        form.addEventListener('submit', async e => {
+            e.preventDefault();
+            const text = $('textarea', form).value;
+            const file = $('input[type=file]', form).files[0];
+            if (!text.trim() && !file) return;
+            try {
+                await api('POST', 'buzz/posts', {text: text, photo: file ? await readFile(file) : null});
+                form.reset();
+                photoSlot.hidden = true;
+                await loadFeed();
+                saved();
+            } catch (err) {
+                failed(err);
+            }
+        });
+
+        feed.addEventListener('click', e => {
+            const menuHost = e.target.closest('[data-menu]');
+            const entry = e.target.closest('.oxd-dropdown-menu [data-entry]');
+            const action = e.target.closest('button[data-action]');
+            if (entry) {
+                const kind = entry.dataset.entry;
+                const post = entry.closest('.orangehrm-buzz-post');
+                const comment = entry.closest('.orangehrm-buzz-comment');
+                closeMenus(null);
+                if (kind === 'edit-post') editPost(post);
+                else if (kind === 'delete-post') {
+                    confirmDelete().then(yes => yes && api('DELETE', `buzz/shares/${post.dataset.shareId}`)
+                        .then(() => { post.remove(); saved('Successfully Deleted'); })).catch(failed);
+                } else if (kind === 'edit-comment') {
+                    const text = $('[data-role=comment-text]', comment);
+                    const area = h('<textarea class="oxd-textarea oxd-textarea--active" data-role="comment-edit" rows="1"></textarea>');
+                    area.value = text.textContent;
+                    text.replaceWith(area);
+                    area.focus();
+                } else if (kind === 'delete-comment') {
+                    confirmDelete().then(yes => yes && api('DELETE', `buzz/shares/${shareId(comment)}/comments/${comment.dataset.commentId}`)
+                        .then(() => { comment.remove(); saved('Successfully Deleted'); })).catch(failed);
+                }
+            } else if (menuHost && e.target.closest('.oxd-icon-button')) {
+                const open = $('.oxd-dropdown-menu', menuHost);
+                closeMenus(null);
+                if (open) return;
+                const entries = menuHost.dataset.menu === 'post'
+                    ? [['delete-post', 'Delete Post'], ['edit-post', 'Edit Post']]
+                    : [['edit-comment', 'Edit'], ['delete-comment', 'Delete']];
+                menuHost.appendChild(h(`<div class="oxd-dropdown-menu" role="menu">${entries.map(([key, label]) =>
+                    `<li class="orangehrm-buzz-menu-item" data-entry="${key}"><p class="oxd-text oxd-text--p">${label}</p></li>`).join('')}</div>`));
+            } else if (action && action.dataset.action === 'like-post') {
+                const post = action.closest('.orangehrm-buzz-post');
+                api('POST', `buzz/shares/${post.dataset.shareId}/likes`).then(res => {
+                    action.classList.toggle('--liked', res.data.liked);
+                    $('[data-role=post-likes]', post).textContent = `${res.data.likes} Likes`;
+                }).catch(failed);
+            } else if (action && action.dataset.action === 'like-comment') {
+                const comment = action.closest('.orangehrm-buzz-comment');
+                api('POST', `buzz/shares/${shareId(comment)}/comments/${comment.dataset.commentId}/likes`).then(res => {
+                    action.classList.toggle('--liked', res.data.liked);
+                    $('[data-role=comment-likes]', comment).textContent = res.data.likes;
+                }).catch(failed);
+            } else if (action && action.dataset.action === 'focus-comment') {
+                $('[data-role=comment-input]', action.closest('.orangehrm-buzz-post')).focus();
+            }
+        });
+
+        feed.addEventListener('keydown', e => {
+            if (e.key !== 'Enter' || e.shiftKey) return;
+            const role = e.target.dataset && e.target.dataset.role;
+            if (role !== 'comment-input' && role !== 'comment-edit') return;
+            e.preventDefault();
+            const text = e.target.value.trim();
+            if (!text) return;
+            const post = e.target.closest('.orangehrm-buzz-post');
+            const request = role === 'comment-input'
+                ? api('POST', `buzz/shares/${post.dataset.shareId}/comments`, {text: text})
+                : api('PUT', `buzz/shares/${post.dataset.shareId}/comments/${e.target.closest('.orangehrm-buzz-comment').dataset.commentId}`, {text: text});
+            request.then(() => {
+                if (role === 'comment-input') e.target.value = '';
+                return reloadComments(post);
+            }).then(() => saved(role === 'comment-input' ? 'Successfully Saved' : 'Successfully Updated')).catch(failed);
+        });
+
+        function editPost(post) {
+            const modal = h(`<div class="oxd-dialog-container-default"><div class="oxd-overlay oxd-overlay--flex oxd-overlay--flex-centered">
+                <div class="oxd-dialog-sheet oxd-dialog-sheet--shadow oxd-dialog-sheet--gutters orangehrm-buzz-post-modal" role="document">
+                <h6 class="oxd-text oxd-text--h6">Edit Post</h6><form class="oxd-form" novalidate>
+                <textarea class="oxd-buzz-post-input" rows="3"></textarea>
+                <div class="oxd-form-actions"><button type="button" class="oxd-button oxd-button--medium oxd-button--ghost" data-action="cancel">Cancel</button>
+                <button type="submit" class="oxd-button oxd-button--medium oxd-button--main">Update</button></div></form></div></div></div>`);
+            $('textarea', modal).value = $('.orangehrm-buzz-post-body-text', post).textContent;
+            $('[data-action=cancel]', modal).addEventListener('click', () => modal.remove());
+            $('form', modal).addEventListener('submit', e => {
+                e.preventDefault();
+                const text = $('textarea', modal).value;
+                api('PUT', `buzz/posts/${post.dataset.shareId}`, {text: text}).then(() => {
+                    modal.remove();
+                    $('.orangehrm-buzz-post-body-text', post).textContent = text;
+                    saved('Successfully Updated');
+                }).catch(failed);
+            });
+            document.body.appendChild(modal);
+        }
+
+        loadFeed().catch(failed);
+    };
+
+    pages.defineReport = () => {
+        const form = $('form[data-form=define-report]');
+        const criteriaSelect = $('[data-field=criteria]', form);
+        const criteriaList = $('[data-role=criteria]', form);
+        const groupSelect = $('[data-field=displayFieldGroup]', form);
+        const fieldSelect = $('[data-field=displayField]', form);
+        const groupsNode = $('[data-role=display-groups]', form);
+        const fieldsOf = name => (state.displayFields[name] || []).map((field, i) => ({id: i + 1, name: field}));
+
+        groupSelect.addEventListener('oxd-change', e => setOptions(fieldSelect, e.detail ? fieldsOf(e.detail.name) : []));
+
+        $('[data-action=add-criteria]', form).addEventListener('click', () => {
+            const name = selectedName(criteriaSelect);
+            if (!name || $(`[data-criterion="${CSS.escape(name)}"]`, criteriaList)) return;
+            criteriaList.appendChild(h(card([cell(esc(name)), cell(iconButton('trash-fill', 'remove', 'Remove'))], ` data-criterion="${esc(name)}"`)));
+        });
+        criteriaList.addEventListener('click', e => {
+            const remove = e.target.closest('.oxd-icon-button');
+            if (remove) remove.closest('.oxd-table-card').remove();
+        });
+
+        $('[data-action=add-display-field]', form).addEventListener('click', () => {
+            const groupName = selectedName(groupSelect);
+            const fieldName = selectedName(fieldSelect);
+            if (!groupName || !fieldName) return;
+            let groupNode = $(`[data-group="${CSS.escape(groupName)}"]`, groupsNode);
+            if (!groupNode) {
+                groupNode = h(`<div class="orangehrm-report-display-group" data-group="${esc(groupName)}"><div class="oxd-table-card orangehrm-report-group-header">
+                    <div class="oxd-table-header-cell">Display Field Group: ${esc(groupName)}</div>
+                    <div class="orangehrm-report-header-toggle"><div><label class="oxd-label">Include Header</label></div>
+                    <div class="oxd-checkbox-wrapper"><input type="checkbox" data-role="include-header"></div></div>
+                    ${iconButton('trash-fill', 'remove-group', 'Remove')}</div></div>`);
+                groupsNode.appendChild(groupNode);
+            }
+            if ($(`[data-display-field="${CSS.escape(fieldName)}"]`, groupNode)) return;
+            groupNode.appendChild(h(card([cell(esc(fieldName)), cell(iconButton('x', 'remove-field', 'Remove'))], ` data-display-field="${esc(fieldName)}"`)));
+        });
+        groupsNode.addEventListener('click', e => {
+            const remove = e.target.closest('button[data-action]');
+            if (!remove) return;
+            if (remove.dataset.action === 'remove-group') remove.closest('.orangehrm-report-display-group').remove();
+            else remove.closest('.oxd-table-card').remove();
+        });
+
+        onSubmit(form, async v => {
+            const displayFields = $$('.orangehrm-report-display-group', groupsNode).map(g => ({
+                group: g.dataset.group,
+                includeHeader: $('[data-role=include-header]', g).checked,
+                fields: $$('[data-display-field]', g).map(f => f.dataset.displayField),
+            })).filter(g => g.fields.length);
+            if (!displayFields.length) {
+                fieldError(fieldSelect, 'At least one display field should be added');
+                return;
+            }
+            await api('POST', 'pim/reports', {
+                name: v.name,
+                include: selectedName($('[data-field=include]', form)),
+                criteria: $$('[data-criterion]', criteriaList).map(c => c.dataset.criterion),
+                displayFields: displayFields,
+            });
+            saved();
+            location.href = `${PREFIX}pim/viewDefinedPredefinedReports`;
+        });
+    };
+
+    window.oxd = {api: api, toast: toast, state: state};
+    const controller = pages[document.body.dataset.page];
+    if (controller) controller();
+})();
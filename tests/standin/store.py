@@ -0,0 +1,224 @@
+"""In-memory data behind the stand-in: employees, recruitment, Buzz and reports."""
+import itertools
+import threading
+from datetime import date, datetime
+
+EMPLOYMENT_STATUSES = ["Freelance", "Full-Time Contract", "Full-Time Permanent", "Full-Time Probation", "Part-Time Contract", "Part-Time Internship"]
+JOB_TITLES = ["Account Assistant", "Automation Tester", "Chief Executive Officer", "HR Manager", "QA Engineer", "Software Engineer"]
+JOB_CATEGORIES = ["Craft Workers", "Laborers and Helpers", "Office and Clerical Workers", "Professionals", "Technicians"]
+LOCATIONS = ["Canadian Regional HQ", "New York Sales Office", "Texas R&D"]
+NATIONALITIES = ["American", "Canadian", "French", "German", "Indian", "Sri Lankan"]
+MARITAL_STATUSES = ["Single", "Married", "Other"]
+REPORTING_METHODS = ["Direct", "Indirect"]
+INCLUDE_OPTIONS = ["Current Employees Only", "Current and Past Employees", "Past Employees Only"]
+SELECTION_CRITERIA = ["Employee Name", "Pay Grade", "Education", "Employment Status", "Service Period", "Joined Date", "Job Title", "Language", "Skill", "Age Range", "Sub Unit", "Gender", "Location"]
+DISPLAY_FIELD_GROUPS = {
+    "Personal": ["Employee Id", "Employee Last Name", "Employee First Name", "Employee Middle Name", "Date of Birth", "Nationality", "Gender", "Marital Status", "Driver License Number", "License Expiry Date", "Other Id"],
+    "Contact Details": ["Address", "Home Telephone", "Mobile", "Work Telephone", "Work Email", "Other Email"],
+    "Emergency Contacts": ["Name", "Home Telephone", "Work Telephone", "Relationship", "Mobile"],
+    "Job": ["Contract Start Date", "Contract End Date", "Job Title", "Employment Status", "Job Category", "Joined Date", "Sub Unit", "Location"],
+    "Salary": ["Pay Grade", "Salary Component", "Amount", "Comments", "Pay Frequency", "Currency"],
+}
+CANDIDATE_STATUSES = {1: "Application Initiated", 2: "Shortlisted", 3: "Rejected", 4: "Interview Scheduled"}
+
+
+def option_list(names):
+    return [{"id": i, "name": name} for i, name in enumerate(names, start=1)]
+
+
+def full_name(employee):
+    return " ".join(part for part in (employee["firstName"], employee.get("middleName"), employee["lastName"]) if part)
+
+
+class Store:
+    """All mutable stand-in state; every public method holds the lock."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._ids = itertools.count(1)
+        self.users = {"Admin": "admin123"}
+        self.employees = {}
+        self.vacancies = {}
+        self.candidates = {}
+        self.posts = {}
+        self.reports = {}
+        self._seed()
+
+    def next_id(self):
+        return next(self._ids)
+
+    def _seed(self):
+        admin = self.add_employee({"firstName": "Paul", "middleName": "", "lastName": "Collings", "employeeId": "0001"})
+        for first, last in (("Odis", "Adalwin"), ("Linda", "Anderson"), ("Russel", "Hamilton"), ("Peter", "Mac Anderson")):
+            employee = self.add_employee({"firstName": first, "middleName": "", "lastName": last, "employeeId": ""})
+            employee["supervisors"].append({"empNumber": admin["empNumber"], "reportingMethodId": 1})
+            employee["job"].update({"empStatusId": 3, "jobTitleId": 5})
+        self.add_vacancy({"name": "Senior QA Lead", "jobTitleId": 5, "employeeId": admin["empNumber"], "numOfPositions": 1})
+        self.add_post(admin["empNumber"], "Welcome to the OrangeHRM stand-in Buzz feed!")
+
+    # PIM
+
+    def add_employee(self, payload):
+        with self.lock:
+            emp_number = self.next_id()
+            employee = {
+                "empNumber": emp_number,
+                "employeeId": payload.get("employeeId") or f"{emp_number:04d}",
+                "firstName": payload.get("firstName", ""),
+                "middleName": payload.get("middleName") or "",
+                "lastName": payload.get("lastName", ""),
+                "terminationId": None,
+                "personal": {},
+                "job": {},
+                "supervisors": [],
+                "attachments": {},
+            }
+            self.employees[emp_number] = employee
+            return employee
+
+    def employee_summary(self, employee):
+        job = employee["job"]
+        return {
+            "empNumber": employee["empNumber"],
+            "employeeId": employee["employeeId"],
+            "firstName": employee["firstName"],
+            "middleName": employee["middleName"],
+            "lastName": employee["lastName"],
+            "terminationId": employee["terminationId"],
+            "jobTitle": _named(JOB_TITLES, job.get("jobTitleId")),
+            "empStatus": _named(EMPLOYMENT_STATUSES, job.get("empStatusId")),
+            "subunit": {"id": None, "name": None},
+            "supervisors": [
+                {"empNumber": s["empNumber"], "firstName": self.employees[s["empNumber"]]["firstName"], "lastName": self.employees[s["empNumber"]]["lastName"]}
+                for s in employee["supervisors"] if s["empNumber"] in self.employees
+            ],
+        }
+
+    def search_employees(self, name=None, status_id=None, supervisor_ids=(), include="1"):
+        with self.lock:
+            found = []
+            for employee in self.employees.values():
+                if name and name.lower() not in f"{full_name(employee)} {employee['employeeId']}".lower():
+                    continue
+                if status_id and employee["job"].get("empStatusId") != status_id:
+                    continue
+                if supervisor_ids and not {s["empNumber"] for s in employee["supervisors"]} & set(supervisor_ids):
+                    continue
+                found.append(self.employee_summary(employee))
+            return found
+
+    def delete_employees(self, emp_numbers):
+        with self.lock:
+            for emp_number in emp_numbers:
+                self.employees.pop(emp_number, None)
+            for employee in self.employees.values():
+                employee["supervisors"] = [s for s in employee["supervisors"] if s["empNumber"] in self.employees]
+
+    def add_attachment(self, employee, name, content_type, content, description):
+        with self.lock:
+            attach_id = self.next_id()
+            employee["attachments"][attach_id] = {
+                "id": attach_id,
+                "filename": name,
+                "fileType": content_type,
+                "size": len(content),
+                "content": content,
+                "description": description,
+                "attachedDate": date.today().isoformat(),
+            }
+            return employee["attachments"][attach_id]
+
+    # Recruitment
+
+    def add_vacancy(self, payload):
+        with self.lock:
+            vacancy_id = self.next_id()
+            self.vacancies[vacancy_id] = {
+                "id": vacancy_id,
+                "name": payload["name"],
+                "jobTitle": _named(JOB_TITLES, payload.get("jobTitleId")),
+                "hiringManager": {"empNumber": payload.get("employeeId")},
+                "numOfPositions": payload.get("numOfPositions"),
+                "status": payload.get("status", True),
+            }
+            return self.vacancies[vacancy_id]
+
+    def add_candidate(self, payload):
+        with self.lock:
+            candidate_id = self.next_id()
+            candidate = {
+                "id": candidate_id,
+                "firstName": payload.get("firstName", ""),
+                "middleName": payload.get("middleName") or "",
+                "lastName": payload.get("lastName", ""),
+                "email": payload.get("email", ""),
+                "contactNumber": payload.get("contactNumber"),
+                "keywords": payload.get("keywords"),
+                "comment": payload.get("comment"),
+                "dateOfApplication": payload.get("dateOfApplication") or date.today().isoformat(),
+                "consentToKeepData": bool(payload.get("consentToKeepData")),
+                "vacancy": self.vacancies.get(payload.get("vacancyId")),
+                "status": {"id": 1, "label": CANDIDATE_STATUSES[1]},
+                "history": [],
+            }
+            self.candidates[candidate_id] = candidate
+            return candidate
+
+    def set_candidate_status(self, candidate, status_id, **details):
+        with self.lock:
+            candidate["status"] = {"id": status_id, "label": CANDIDATE_STATUSES[status_id]}
+            candidate["history"].append({"status": status_id, **details})
+
+    # Buzz
+
+    def add_post(self, emp_number, text, photo=None):
+        with self.lock:
+            share_id = self.next_id()
+            self.posts[share_id] = {
+                "id": share_id,
+                "empNumber": emp_number,
+                "text": text,
+                "photos": [photo] if photo else [],
+                "liked": False,
+                "likes": 0,
+                "comments": {},
+                "createdAt": datetime.now().isoformat(timespec="seconds"),
+            }
+            return self.posts[share_id]
+
+    def feed(self):
+        with self.lock:
+            return [self.post_view(post) for post in sorted(self.posts.values(), key=lambda p: -p["id"])]
+
+    def post_view(self, post):
+        author = self.employees.get(post["empNumber"])
+        return {
+            "id": post["id"],
+            "text": post["text"],
+            "author": full_name(author) if author else "Deleted Employee",
+            "createdAt": post["createdAt"],
+            "photos": [{"id": i, "name": photo["name"]} for i, photo in enumerate(post["photos"])],
+            "liked": post["liked"],
+            "likes": post["likes"],
+            "comments": [dict(c) for c in sorted(post["comments"].values(), key=lambda c: c["id"])],
+        }
+
+    def add_comment(self, post, text):
+        with self.lock:
+            comment_id = self.next_id()
+            post["comments"][comment_id] = {"id": comment_id, "text": text, "liked": False, "likes": 0}
+            return post["comments"][comment_id]
+
+    # Reports
+
+    def add_report(self, payload):
+        with self.lock:
+            report_id = self.next_id()
+            self.reports[report_id] = {"id": report_id, **payload}
+            return self.reports[report_id]
+
+
+def _named(names, item_id):
+    if not item_id or not 1 <= item_id <= len(names):
+        return {"id": None, "name": None}
+    return {"id": item_id, "name": names[item_id - 1]}
@@ -0,0 +1,604 @@
+"""Pages of the stand-in, rendered with OrangeHRM 5's OXD markup.
+
+The class names, label/control nesting and element types follow the real
+screens closely enough for the page objects' locators (``.oxd-input-group``
+label maps, ``div[role=listbox]`` options, ``.oxd-table-card`` rows, toasts,
+the form loader). Data is loaded by ``static/oxd.js`` through the REST API,
+as the real front end does, so the same waits apply.
+"""
+import html
+import json
+import re
+from datetime import date
+from typing import NamedTuple
+
+from . import store as data
+
+PREFIX = "/web/index.php"
+
+MENU = [
+    ("Admin", None),
+    ("PIM", "pim/viewEmployeeList"),
+    ("Leave", None),
+    ("Time", None),
+    ("Recruitment", "recruitment/viewCandidates"),
+    ("My Info", None),
+    ("Performance", None),
+    ("Dashboard", "dashboard/index"),
+    ("Directory", None),
+    ("Maintenance", None),
+    ("Claim", None),
+    ("Buzz", "buzz/viewBuzz"),
+]
+PIM_NAV = [("Configuration", None), ("Employee List", "pim/viewEmployeeList"), ("Add Employee", "pim/addEmployee"), ("Reports", "pim/viewDefinedPredefinedReports")]
+RECRUITMENT_NAV = [("Candidates", "recruitment/viewCandidates"), ("Vacancies", None)]
+EMPLOYEE_TABS = [
+    ("Personal Details", "pim/viewPersonalDetails"),
+    ("Contact Details", None),
+    ("Emergency Contacts", None),
+    ("Dependents", None),
+    ("Immigration", None),
+    ("Job", "pim/viewJobDetails"),
+    ("Salary", None),
+    ("Report-to", "pim/viewReportToDetails"),
+    ("Qualifications", None),
+    ("Memberships", None),
+]
+PREDEFINED_REPORTS = ["All Employee Sub Unit Hierarchy Report", "Employee Contact info report", "Employee Job Details", "PIM Sample Report"]
+
+PAGES = []
+
+
+class Response(NamedTuple):
+    status: int
+    headers: list
+    body: bytes
+
+
+def page(pattern):
+    def register(fn):
+        PAGES.append((re.compile(pattern + "$"), fn))
+        return fn
+    return register
+
+
+def dispatch(store, request, route):
+    for pattern, handler in PAGES:
+        match = pattern.match(route)
+        if match is not None and request.method in ("GET", "HEAD"):
+            return handler(store, request, *match.groups())
+    return not_found()
+
+
+def not_found():
+    body = '<div class="orangehrm-card-container"><h6 class="oxd-text oxd-text--h6">Page Not Found</h6></div>'
+    return html_response(layout("Not Found", body, "none"), 404)
+
+
+def html_response(body, status=200, headers=()):
+    return Response(status, [("Content-Type", "text/html; charset=utf-8"), ("Cache-Control", "no-store"), *headers], body.encode())
+
+
+def json_response(status, payload):
+    return Response(status, [("Content-Type", "application/json"), ("Cache-Control", "no-store")], json.dumps(payload).encode())
+
+
+def redirect(location, headers=()):
+    return Response(302, [("Location", location), *headers], b"")
+
+
+def url(route):
+    return f"{PREFIX}/{route}" if route else "#"
+
+
+def e(value):
+    return html.escape("" if value is None else str(value), quote=True)
+
+
+# OXD widgets
+
+def group(label, control, required=False):
+    required_class = " oxd-input-field-required" if required else ""
+    return (
+        '<div class="oxd-input-group oxd-input-field-bottom-space">'
+        f'<div class="oxd-input-group__label-wrapper"><label class="oxd-label{required_class}">{e(label)}</label></div>'
+        f"<div>{control}</div></div>"
+    )
+
+
+def _attrs(field, required, extra=""):
+    return f' data-field="{e(field)}"' + (" data-required" if required else "") + extra
+
+
+def text_input(field, value="", placeholder="", required=False, name=None, kind="text"):
+    name_attr = f' name="{e(name)}"' if name else ""
+    return (
+        f'<input class="oxd-input oxd-input--active" type="{kind}" autocomplete="off"{name_attr}'
+        f' placeholder="{e(placeholder)}" value="{e(value)}"{_attrs(field, required)}>'
+    )
+
+
+def date_input(field, value="", required=False):
+    return (
+        '<div class="oxd-date-wrapper"><div class="oxd-date-input">'
+        + text_input(field, value, "yyyy-mm-dd", required)
+        + '<i class="oxd-icon bi-calendar oxd-date-input-icon"></i></div></div>'
+    )
+
+
+def time_input(field, value="", required=False):
+    return (
+        '<div class="oxd-time-wrapper"><div class="oxd-time-input">'
+        + text_input(field, value, "hh:mm", required)
+        + '<i class="oxd-icon bi-clock oxd-time-input--clock"></i></div></div>'
+    )
+
+
+def textarea(field, placeholder="Type here", required=False):
+    return f'<textarea class="oxd-textarea oxd-textarea--active oxd-textarea--resize-vertical" placeholder="{e(placeholder)}"{_attrs(field, required)}></textarea>'
+
+
+def select(field, options, value=None, required=False):
+    """OXD select: a focusable text box; oxd.js opens a ``div[role=listbox]`` under it."""
+    selected = next((o for o in options if o["id"] == value), None)
+    return (
+        f'<div class="oxd-select-wrapper"{_attrs(field, required)}'
+        f' data-value="{e(selected["id"] if selected else "")}" data-options="{e(json.dumps(options))}">'
+        '<div class="oxd-select-text oxd-select-text--active">'
+        f'<div class="oxd-select-text-input" tabindex="0">{e(selected["name"] if selected else "-- Select --")}</div>'
+        '<div class="oxd-select-text--after"><i class="oxd-icon bi-caret-down-fill oxd-select-text--arrow"></i></div>'
+        "</div></div>"
+    )
+
+
+def autocomplete(field, required=False):
+    """Employee autocomplete; suggestions come from ``pim/employees?nameOrId=``."""
+    return (
+        f'<div class="oxd-autocomplete-wrapper"{_attrs(field, required)} data-value="">'
+        '<div class="oxd-autocomplete-text-input oxd-autocomplete-text-input--active">'
+        '<input placeholder="Type for hints..." autocomplete="off"></div></div>'
+    )
+
+
+def checkbox(field, checked=False, text=""):
+    return (
+        '<div class="oxd-checkbox-wrapper"><label class="">'
+        f'<input type="checkbox" value=""{" checked" if checked else ""}{_attrs(field, False)}>'
+        f'<span class="oxd-checkbox-input oxd-checkbox-input--active --label-right"></span>{e(text)}</label></div>'
+    )
+
+
+def radios(field, options):
+    return '<div class="oxd-radio-group">' + "".join(
+        f'<div class="oxd-radio-wrapper"><input type="radio" name="{e(field)}" value="{option["id"]}" id="{e(field)}_{option["id"]}"{_attrs(field, False)}>'
+        f'<label for="{e(field)}_{option["id"]}">{e(option["name"])}</label></div>'
+        for option in options
+    ) + "</div>"
+
+
+def file_input(field, required=False, accept=""):
+    accept_attr = f' accept="{e(accept)}"' if accept else ""
+    return (
+        '<div class="oxd-file-div oxd-file-div--active"><div class="oxd-file-button">Browse</div>'
+        f'<input type="file" class="oxd-file-input"{accept_attr}{_attrs(field, required)}></div>'
+    )
+
+
+def button(text, kind="submit", style="secondary", action=None, icon=None, href=None):
+    extra = (f' data-action="{e(action)}"' if action else "") + (f' data-href="{e(href)}"' if href else "")
+    icon_html = f'<i class="oxd-icon bi-{icon} oxd-button-icon"></i> ' if icon else ""
+    return f'<button type="{kind}" class="oxd-button oxd-button--medium oxd-button--{style}"{extra}>{icon_html}{e(text)}</button>'
+
+
+def name_fields(required=True):
+    return (
+        '<div class="oxd-input-group oxd-input-field-bottom-space">'
+        '<div class="oxd-input-group__label-wrapper"><label class="oxd-label oxd-input-field-required">Employee Full Name</label></div>'
+        '<div class="--name-grouped-field">'
+        + "".join(
+            f"<div>{text_input(field, placeholder=placeholder, required=required and field != 'middleName', name=field)}</div>"
+            for field, placeholder in (("firstName", "First Name"), ("middleName", "Middle Name"), ("lastName", "Last Name"))
+        )
+        + "</div></div>"
+    )
+
+
+def actions(*buttons, hint=True):
+    hint_html = '<p class="oxd-text oxd-text--p orangehrm-form-hint">* Required</p>' if hint else ""
+    return f'<div class="oxd-form-actions">{hint_html}{"".join(buttons)}</div>'
+
+
+def form_loader():
+    return '<div class="oxd-form-loader"><div class="oxd-loading-spinner-container"><div class="oxd-loading-spinner"></div></div></div>'
+
+
+def table(headers, body_role="rows"):
+    cells = "".join(f'<div class="oxd-table-header-cell oxd-padding-cell oxd-table-th" role="columnheader">{e(h)}</div>' for h in headers)
+    return (
+        '<div class="orangehrm-horizontal-padding orangehrm-vertical-padding"><span class="oxd-text oxd-text--span" data-role="record-count">No Records Found</span></div>'
+        '<div class="oxd-table" role="table">'
+        f'<div class="oxd-table-header" role="rowgroup"><div class="oxd-table-row oxd-table-row--with-border" role="row">{cells}</div></div>'
+        f'<div class="oxd-table-body" role="rowgroup" data-role="{body_role}"></div></div>'
+    )
+
+
+def template(name, content):
+    return f'<template data-template="{e(name)}">{content}</template>'
+
+
+# Layout
+
+def layout(module, body, page_name, state=None, nav=(), active=None):
+    menu = "".join(
+        f'<li class="oxd-main-menu-item-wrapper"><a class="oxd-main-menu-item{" active" if name == module else ""}" href="{url(route)}">'
+        f'<i class="oxd-icon oxd-main-menu-item--icon"></i><span class="oxd-text oxd-text--span oxd-main-menu-item--name">{e(name)}</span></a></li>'
+        for name, route in MENU
+    )
+    tabs = "".join(
+        f'<li class="oxd-topbar-body-nav-tab{" --visited" if name == active else ""}"><a class="oxd-topbar-body-nav-tab-item" href="{url(route)}">{e(name)}</a></li>'
+        for name, route in nav
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>OrangeHRM</title>
+<link rel="stylesheet" href="/web/dist/css/oxd.css"></head>
+<body data-page="{e(page_name)}"><div id="app"><div class="oxd-layout">
+<div class="oxd-layout-navigation">
+<aside class="oxd-sidepanel"><nav class="oxd-navbar-nav" role="navigation" aria-label="Sidepanel"><div class="oxd-sidepanel-header"><a class="oxd-brand" href="{url("dashboard/index")}"><div class="oxd-brand-banner">OrangeHRM</div></a></div>
+<div class="oxd-sidepanel-body"><ul class="oxd-main-menu">{menu}</ul></div></nav></aside>
+<header class="oxd-topbar"><div class="oxd-topbar-header"><div class="oxd-topbar-header-title"><span class="oxd-topbar-header-breadcrumb"><h6 class="oxd-text oxd-text--h6 oxd-topbar-header-breadcrumb-module">{e(module)}</h6></span></div>
+<div class="oxd-topbar-header-userarea"><span class="oxd-userdropdown-tab"><p class="oxd-userdropdown-name">Paul Collings</p></span></div></div>
+<div class="oxd-topbar-body"><nav class="oxd-topbar-body-nav" aria-label="Topbar Menu"><ul>{tabs}</ul></nav></div></header>
+</div>
+<div class="oxd-layout-container"><div class="oxd-layout-context">{body}</div></div>
+</div></div>
+<script id="oxd-state" type="application/json">{_state_json(state or {})}</script>
+<script src="/web/dist/js/oxd.js"></script>
+</body></html>"""
+
+
+def _state_json(state):
+    return json.dumps(state).replace("</", "<\\/")
+
+
+def login_page(token, error=False):
+    alert = (
+        '<div class="oxd-alert oxd-alert--error" role="alert"><div class="oxd-alert-content oxd-alert-content--error">'
+        '<p class="oxd-text oxd-text--p oxd-alert-content-text">Invalid credentials</p></div></div>'
+    ) if error else ""
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>OrangeHRM</title>
+<link rel="stylesheet" href="/web/dist/css/oxd.css"></head>
+<body data-page="login"><div id="app"><div class="orangehrm-login-layout"><div class="orangehrm-login-layout-blob">
+<div class="orangehrm-login-container"><div class="orangehrm-login-slot-wrapper"><div class="orangehrm-login-slot">
+<h5 class="oxd-text oxd-text--h5 orangehrm-login-title">Login</h5>
+<auth-login :token="{e(json.dumps(token))}"></auth-login>{alert}
+<div class="orangehrm-login-form"><form class="oxd-form" method="post" action="{PREFIX}/auth/validate" novalidate>
+<input type="hidden" name="_token" value="{e(token)}">
+{group("Username", text_input("username", placeholder="Username", name="username"))}
+{group("Password", text_input("password", placeholder="Password", name="password", kind="password"))}
+<div class="oxd-form-actions orangehrm-login-action"><button type="submit" class="oxd-button oxd-button--medium oxd-button--main orangehrm-login-button">Login</button></div>
+</form></div></div></div></div></div></div></div>
+<script src="/web/dist/js/oxd.js"></script>
+</body></html>"""
+
+
+# Dashboard
+
+@page(r"dashboard/index")
+def dashboard(store, request):
+    widgets = "".join(
+        f'<div class="oxd-grid-item oxd-grid-item--gutters orangehrm-dashboard-widget"><div class="oxd-sheet oxd-sheet--rounded oxd-sheet--white orangehrm-dashboard-widget">'
+        f'<div class="orangehrm-dashboard-widget-header"><p class="oxd-text oxd-text--p">{e(title)}</p></div>'
+        f'<div class="orangehrm-dashboard-widget-body"><p class="oxd-text oxd-text--p">{e(text)}</p></div></div></div>'
+        for title, text in (
+            ("Time at Work", "Punched Out"),
+            ("My Actions", "No Pending Actions"),
+            ("Quick Launch", "Assign Leave, Leave List, Timesheets"),
+            ("Buzz Latest Posts", f"{len(store.posts)} posts"),
+            ("Employees on Leave Today", "No Employees are on Leave Today"),
+            ("Employee Distribution by Sub Unit", f"{len(store.employees)} employees"),
+        )
+    )
+    return html_response(layout("Dashboard", f'<div class="oxd-grid-3 orangehrm-dashboard-grid">{widgets}</div>', "dashboard"))
+
+
+# PIM
+
+@page(r"pim/viewEmployeeList")
+def employee_list(store, request):
+    body = f"""<div class="oxd-table-filter"><div class="oxd-table-filter-header"><div class="oxd-table-filter-header-title"><h5 class="oxd-text oxd-text--h5 oxd-table-filter-title">Employee Information</h5></div></div>
+<hr class="oxd-divider"><form class="oxd-form" data-form="employee-search" novalidate><div class="oxd-form-row"><div class="oxd-grid-4 orangehrm-full-width-grid">
+{group("Employee Name", autocomplete("employee"))}
+{group("Employee Id", text_input("employeeId"))}
+{group("Employment Status", select("empStatusId", data.option_list(data.EMPLOYMENT_STATUSES)))}
+{group("Include", select("includeEmployees", data.option_list(data.INCLUDE_OPTIONS), value=1))}
+{group("Supervisor Name", autocomplete("supervisor"))}
+{group("Job Title", select("jobTitleId", data.option_list(data.JOB_TITLES)))}
+{group("Sub Unit", select("subunitId", data.option_list(["Administration", "Engineering", "Sales & Marketing"])))}
+</div></div><hr class="oxd-divider">
+{actions(button("Reset", "reset", "ghost"), button("Search"), hint=False)}</form></div>
+<div class="orangehrm-paper-container"><div class="orangehrm-header-container">{button("Add", "button", "secondary", icon="plus", href=url("pim/addEmployee"))}</div>
+{table(["", "Id", "First (& Middle) Name", "Last Name", "Job Title", "Employment Status", "Sub Unit", "Supervisor", "Actions"])}</div>"""
+    return html_response(layout("PIM", body, "employeeList", nav=PIM_NAV, active="Employee List"))
+
+
+@page(r"pim/addEmployee")
+def add_employee(store, request):
+    generated = f"{store.next_id():04d}"
+    body = f"""<div class="orangehrm-background-container"><div class="orangehrm-card-container">
+<h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Add Employee</h6><hr class="oxd-divider">
+<form class="oxd-form" data-form="add-employee" novalidate><div class="orangehrm-employee-container">
+<div class="orangehrm-employee-image">{group("Employee Image", file_input("empPicture", accept="image/gif, image/jpeg, image/png"))}</div>
+<div class="orangehrm-employee-form"><div class="oxd-form-row">{name_fields()}</div>
+<div class="oxd-form-row"><div class="oxd-grid-2 orangehrm-full-width-grid">{group("Employee Id", text_input("employeeId", generated))}</div></div>
+<hr class="oxd-divider"><div class="oxd-form-row user-form-header"><p class="oxd-text oxd-text--p orangehrm-employee-form-header-text">Create Login Details</p>
+<div class="oxd-switch-wrapper"><label><input type="checkbox" data-field="createLogin"><span class="oxd-switch-input oxd-switch-input--active --label-right"></span></label></div></div>
+<div class="orangehrm-login-details" hidden><div class="oxd-form-row"><div class="oxd-grid-2 orangehrm-full-width-grid">
+{group("Username", text_input("username", required=True), required=True)}
+{group("Status", radios("status", [{"id": 1, "name": "Enabled"}, {"id": 0, "name": "Disabled"}]))}
+</div></div><div class="oxd-form-row user-password-row"><div class="oxd-grid-2 orangehrm-full-width-grid">
+{group("Password", text_input("password", kind="password", required=True), required=True)}
+{group("Confirm Password", text_input("confirmPassword", kind="password", required=True), required=True)}
+</div></div></div></div></div>
+<hr class="oxd-divider">{actions(button("Cancel", "button", "ghost", href=url("pim/viewEmployeeList")), button("Save"))}</form></div></div>"""
+    return html_response(layout("PIM", body, "addEmployee", nav=PIM_NAV, active="Add Employee"))
+
+
+def employee_screen(store, emp_number, tab, content, page_name, state=None):
+    employee = store.employees.get(int(emp_number))
+    if employee is None:
+        return not_found()
+    tabs = "".join(
+        f'<div class="orangehrm-tabs-wrapper"><a class="orangehrm-tabs-item{" --active" if name == tab else ""}" href="{url(f"{route}/empNumber/{emp_number}") if route else "#"}">{e(name)}</a></div>'
+        for name, route in EMPLOYEE_TABS
+    )
+    body = f"""<div class="orangehrm-background-container"><div class="orangehrm-card-container orangehrm-edit-employee">
+<div class="orangehrm-edit-employee-navigation"><div class="orangehrm-edit-employee-imagesection"><div class="orangehrm-edit-employee-name"><h6 class="oxd-text oxd-text--h6">{e(data.full_name(employee))}</h6></div></div>
+<div class="orangehrm-tabs">{tabs}</div></div>
+<div class="orangehrm-edit-employee-content">{content}</div></div></div>"""
+    return html_response(layout("PIM", body, page_name, {"empNumber": employee["empNumber"], **(state or {})}, nav=PIM_NAV))
+
+
+@page(r"pim/viewPersonalDetails/empNumber/(\d+)")
+def personal_details(store, request, emp_number):
+    content = f"""<div class="orangehrm-horizontal-padding orangehrm-vertical-padding"><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Personal Details</h6><hr class="oxd-divider">
+<form class="oxd-form" data-form="personal-details" novalidate>{form_loader()}
+<div class="oxd-form-row">{name_fields()}</div>
+<div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">{group("Nick Name", text_input("nickname"))}</div></div>
+<hr class="oxd-divider"><div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("Employee Id", text_input("employeeId"))}
+{group("Other Id", text_input("otherId"))}
+</div><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("Driver's License Number", text_input("drivingLicenseNo"))}
+{group("License Expiry Date", date_input("drivingLicenseExpiredDate"))}
+</div><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("SSN Number", text_input("ssnNumber"))}
+{group("SIN Number", text_input("sinNumber"))}
+</div></div>
+<hr class="oxd-divider"><div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("Nationality", select("nationalityId", data.option_list(data.NATIONALITIES)))}
+{group("Marital Status", select("maritalStatus", data.option_list(data.MARITAL_STATUSES)))}
+</div><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("Date of Birth", date_input("birthday"))}
+{group("Gender", radios("gender", [{"id": 1, "name": "Male"}, {"id": 2, "name": "Female"}]))}
+</div></div>
+<hr class="oxd-divider"><div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("Military Service", text_input("militaryService"))}
+{group("Smoker", checkbox("smoker", text="Yes"))}
+</div></div>
+{actions(button("Save"))}</form></div>
+<div class="orangehrm-attachment"><div class="orangehrm-action-header"><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Attachments</h6>
+{button("Add", "button", "text", icon="plus")}</div>
+<div data-role="attachment-form"></div>
+{table(["", "File Name", "Description", "Size", "Type", "Date Added", "Added By", "Actions"])}
+{template("attachment-add", _attachment_form("Add Attachment", file_input("attachment", required=True)))}
+{template("attachment-edit", _attachment_form("Edit Attachment", '<p class="oxd-text oxd-text--p orangehrm-file-current" data-role="current-file"></p>'))}
+</div>"""
+    return employee_screen(store, emp_number, "Personal Details", content, "personalDetails")
+
+
+def _attachment_form(title, file_control):
+    return (
+        f'<form class="oxd-form" novalidate><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">{e(title)}</h6>'
+        f'<div class="oxd-form-row">{group("Select File", file_control, required=True)}</div>'
+        f'<div class="oxd-form-row">{group("Comment", textarea("description", "Type comment here"))}</div>'
+        f'{actions(button("Cancel", "button", "ghost", action="cancel"), button("Save"))}</form>'
+    )
+
+
+@page(r"pim/viewJobDetails/empNumber/(\d+)")
+def job_details(store, request, emp_number):
+    content = f"""<div class="orangehrm-horizontal-padding orangehrm-vertical-padding"><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Job Details</h6><hr class="oxd-divider">
+<form class="oxd-form" data-form="job-details" novalidate>{form_loader()}
+<div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("Joined Date", date_input("joinedDate"))}
+{group("Job Title", select("jobTitleId", data.option_list(data.JOB_TITLES)))}
+{group("Job Specification", '<p class="oxd-text oxd-text--p orangehrm-job-specification">Not Defined</p>')}
+{group("Job Category", select("jobCategoryId", data.option_list(data.JOB_CATEGORIES)))}
+{group("Sub Unit", select("subunitId", data.option_list(["Administration", "Engineering", "Sales & Marketing"])))}
+{group("Location", select("locationId", data.option_list(data.LOCATIONS)))}
+{group("Employment Status", select("empStatusId", data.option_list(data.EMPLOYMENT_STATUSES)))}
+</div></div>
+{actions(button("Save"))}</form></div>"""
+    return employee_screen(store, emp_number, "Job", content, "job")
+
+
+@page(r"pim/viewReportToDetails/empNumber/(\d+)")
+def report_to(store, request, emp_number):
+    supervisor_form = (
+        '<form class="oxd-form" novalidate><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Add Supervisor</h6>'
+        '<div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">'
+        + group("Name", autocomplete("empNumber", required=True), required=True)
+        + group("Reporting Method", select("reportingMethodId", data.option_list(data.REPORTING_METHODS), required=True), required=True)
+        + "</div></div>"
+        + actions(button("Cancel", "button", "ghost", action="cancel"), button("Save"))
+        + "</form>"
+    )
+    content = f"""<div class="orangehrm-horizontal-padding orangehrm-vertical-padding"><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Report to</h6></div>
+<div class="orangehrm-report-to" data-section="supervisors"><div class="orangehrm-action-header"><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Assigned Supervisors</h6>
+{button("Add", "button", "text", icon="plus")}</div>
+<div data-role="supervisor-form"></div>
+{table(["", "Name", "Reporting Method", "Actions"])}
+{template("supervisor-form", supervisor_form)}</div>
+<div class="orangehrm-report-to" data-section="subordinates"><div class="orangehrm-action-header"><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Assigned Subordinates</h6></div>
+<div class="orangehrm-horizontal-padding orangehrm-vertical-padding"><span class="oxd-text oxd-text--span">No Records Found</span></div></div>"""
+    return employee_screen(store, emp_number, "Report-to", content, "reportTo")
+
+
+@page(r"pim/viewAttachment/empNumber/(\d+)/attachId/(\d+)")
+def download_attachment(store, request, emp_number, attach_id):
+    employee = store.employees.get(int(emp_number))
+    attachment = employee and employee["attachments"].get(int(attach_id))
+    if attachment is None:
+        return Response(404, [("Content-Type", "text/plain")], b"Not Found")
+    filename = attachment["filename"].replace('"', "")
+    return Response(200, [
+        ("Content-Type", attachment["fileType"]),
+        ("Content-Disposition", f'attachment; filename="{filename}"'),
+        ("Cache-Control", "no-store"),
+    ], attachment["content"])
+
+
+@page(r"pim/viewDefinedPredefinedReports")
+def reports(store, request):
+    names = PREDEFINED_REPORTS + [r["name"] for r in store.reports.values()]
+    rows = "".join(
+        f'<div class="oxd-table-card"><div class="oxd-table-row oxd-table-row--with-border" role="row">'
+        f'<div class="oxd-table-cell oxd-padding-cell" role="cell"><div>{e(name)}</div></div></div></div>'
+        for name in sorted(names)
+    )
+    body = f"""<div class="oxd-table-filter"><div class="oxd-table-filter-header"><h5 class="oxd-text oxd-text--h5 oxd-table-filter-title">Employee Reports</h5></div>
+<hr class="oxd-divider"><form class="oxd-form" novalidate><div class="oxd-form-row"><div class="oxd-grid-4 orangehrm-full-width-grid">{group("Report Name", text_input("name", placeholder="Type for hints..."))}</div></div>
+{actions(button("Reset", "reset", "ghost"), button("Search"), hint=False)}</form></div>
+<div class="orangehrm-paper-container"><div class="orangehrm-header-container"><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Defined Predefined Reports</h6>
+{button("Add", "button", "secondary", icon="plus", href=url("pim/definePredefinedReport"))}</div>
+<div class="orangehrm-horizontal-padding orangehrm-vertical-padding"><span class="oxd-text oxd-text--span">({len(names)}) Records Found</span></div>
+<div class="oxd-table" role="table"><div class="oxd-table-body" role="rowgroup">{rows}</div></div></div>"""
+    return html_response(layout("PIM", body, "reports", nav=PIM_NAV, active="Reports"))
+
+
+@page(r"pim/definePredefinedReport")
+def define_report(store, request):
+    groups = data.option_list(list(data.DISPLAY_FIELD_GROUPS))
+    body = f"""<div class="orangehrm-background-container"><div class="orangehrm-card-container">
+<h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Define Report</h6><hr class="oxd-divider">
+<form class="oxd-form" data-form="define-report" novalidate>
+<div class="oxd-form-row"><div class="oxd-grid-2 orangehrm-full-width-grid">{group("Report Name", text_input("name", placeholder="Type here ...", required=True), required=True)}</div></div>
+<h6 class="oxd-text oxd-text--h6 orangehrm-sub-title">Selection Criteria</h6><hr class="oxd-divider">
+<div class="oxd-form-row"><div class="oxd-grid-4 orangehrm-full-width-grid">
+<div class="oxd-input-group oxd-input-field-bottom-space"><div class="oxd-input-group__label-wrapper"><label class="oxd-label">Selection Criteria</label></div>
+<div class="orangehrm-report-criteria">{select("criteria", data.option_list(data.SELECTION_CRITERIA))}{button("Add Criteria", "button", "secondary", action="add-criteria")}</div></div>
+{group("Include", select("include", data.option_list(data.INCLUDE_OPTIONS), value=1))}
+</div></div>
+<div class="orangehrm-report-criteria-list" data-role="criteria"></div>
+<h6 class="oxd-text oxd-text--h6 orangehrm-sub-title">Display Fields</h6><hr class="oxd-divider">
+<div class="oxd-form-row"><div class="oxd-grid-4 orangehrm-full-width-grid">
+<div class="oxd-input-group oxd-input-field-bottom-space"><div class="oxd-input-group__label-wrapper"><label class="oxd-label oxd-input-field-required">Display Fields</label></div>
+<div class="orangehrm-report-display">{select("displayFieldGroup", groups)}{select("displayField", [], required=True)}{button("Add Display Field", "button", "secondary", action="add-display-field")}</div></div>
+</div></div>
+<div class="orangehrm-report-display-groups" data-role="display-groups"></div>
+<hr class="oxd-divider">{actions(button("Cancel", "button", "ghost", href=url("pim/viewDefinedPredefinedReports")), button("Save"))}</form></div></div>"""
+    state = {"displayFields": data.DISPLAY_FIELD_GROUPS}
+    return html_response(layout("PIM", body, "defineReport", state, nav=PIM_NAV, active="Reports"))
+
+
+# Recruitment
+
+@page(r"recruitment/viewCandidates")
+def candidates(store, request):
+    vacancies = [{"id": v["id"], "name": v["name"]} for v in store.vacancies.values()]
+    body = f"""<div class="oxd-table-filter"><div class="oxd-table-filter-header"><h5 class="oxd-text oxd-text--h5 oxd-table-filter-title">Candidates</h5></div>
+<hr class="oxd-divider"><form class="oxd-form" data-form="candidate-search" novalidate><div class="oxd-form-row"><div class="oxd-grid-4 orangehrm-full-width-grid">
+{group("Job Title", select("jobTitleId", data.option_list(data.JOB_TITLES)))}
+{group("Vacancy", select("vacancyId", vacancies))}
+{group("Hiring Manager", autocomplete("hiringManagerId"))}
+{group("Status", select("status", [{"id": k, "name": v} for k, v in data.CANDIDATE_STATUSES.items()]))}
+</div></div>{actions(button("Reset", "reset", "ghost"), button("Search"), hint=False)}</form></div>
+<div class="orangehrm-paper-container"><div class="orangehrm-header-container">{button("Add", "button", "secondary", icon="plus", href=url("recruitment/addCandidate"))}</div>
+{table(["", "Vacancy", "Candidate", "Hiring Manager", "Date of Application", "Status", "Actions"])}</div>"""
+    return html_response(layout("Recruitment", body, "candidates", nav=RECRUITMENT_NAV, active="Candidates"))
+
+
+@page(r"recruitment/addCandidate")
+def add_candidate(store, request):
+    vacancies = [{"id": v["id"], "name": v["name"]} for v in store.vacancies.values()]
+    body = f"""<div class="orangehrm-background-container"><div class="orangehrm-card-container">
+<h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Add Candidate</h6><hr class="oxd-divider">
+<form class="oxd-form" data-form="add-candidate" novalidate>
+<div class="oxd-form-row">{name_fields()}</div>
+<div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">{group("Vacancy", select("vacancyId", vacancies))}</div></div>
+<div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("Email", text_input("email", placeholder="Type here", required=True), required=True)}
+{group("Contact Number", text_input("contactNumber", placeholder="Type here"))}
+</div></div>
+<div class="oxd-form-row">{group("Resume", file_input("resume"))}</div>
+<div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">
+{group("Keywords", text_input("keywords", placeholder="Enter comma seperated words..."))}
+{group("Date of Application", date_input("dateOfApplication", date.today().isoformat()))}
+</div></div>
+<div class="oxd-form-row">{group("Notes", textarea("comment"))}</div>
+<div class="oxd-form-row">{group("Consent to keep data", checkbox("consentToKeepData"))}</div>
+<hr class="oxd-divider">{actions(button("Cancel", "button", "ghost", href=url("recruitment/viewCandidates")), button("Save"))}</form></div></div>"""
+    return html_response(layout("Recruitment", body, "addCandidate", nav=RECRUITMENT_NAV, active="Candidates"))
+
+
+@page(r"recruitment/addCandidate/(\d+)")
+def candidate(store, request, candidate_id):
+    record = store.candidates.get(int(candidate_id))
+    if record is None:
+        return not_found()
+    shortlist_form = (
+        '<form class="oxd-form" novalidate><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Shortlist Candidate</h6>'
+        + f'<div class="oxd-form-row">{group("Notes", textarea("note"))}</div>'
+        + actions(button("Cancel", "button", "ghost", action="cancel"), button("Save"), hint=False)
+        + "</form>"
+    )
+    interview_form = (
+        '<form class="oxd-form" novalidate><h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Schedule Interview</h6>'
+        '<div class="oxd-form-row"><div class="oxd-grid-3 orangehrm-full-width-grid">'
+        + group("Interview Title", text_input("interviewName", placeholder="Type here", required=True), required=True)
+        + group("Interviewer", autocomplete("interviewer"))
+        + group("Date", date_input("interviewDate", required=True), required=True)
+        + group("Time", time_input("interviewTime"))
+        + "</div></div>"
+        + f'<div class="oxd-form-row">{group("Notes", textarea("note"))}</div>'
+        + actions(button("Cancel", "button", "ghost", action="cancel"), button("Save"))
+        + "</form>"
+    )
+    body = f"""<div class="orangehrm-background-container"><div class="orangehrm-card-container">
+<h6 class="oxd-text oxd-text--h6 orangehrm-main-title">Application Stage</h6><hr class="oxd-divider">
+<div class="orangehrm-recruitment"><div class="orangehrm-recruitment-candidate"><p class="oxd-text oxd-text--p oxd-text--subtitle-2">Name</p><p class="oxd-text oxd-text--p">{e(data.full_name(record))}</p></div>
+<div class="orangehrm-recruitment-vacancy"><p class="oxd-text oxd-text--p oxd-text--subtitle-2">Vacancy</p><p class="oxd-text oxd-text--p">{e((record["vacancy"] or {}).get("name"))}</p></div>
+<div class="orangehrm-recruitment-status"><p class="oxd-text oxd-text--p oxd-text--subtitle-2" data-role="status"></p></div>
+<div class="orangehrm-recruitment-actions" data-role="stage-actions"></div></div></div>
+<div class="orangehrm-card-container" data-role="stage-form"></div>
+{template("stage-shortlist", shortlist_form)}{template("stage-interview", interview_form)}</div>"""
+    return html_response(layout("Recruitment", body, "candidate", {"candidate": record}, nav=RECRUITMENT_NAV, active="Candidates"))
+
+
+# Buzz
+
+@page(r"buzz/viewBuzz")
+def buzz(store, request):
+    body = """<div class="orangehrm-buzz-layout"><div class="orangehrm-buzz-newsfeed">
+<div class="oxd-sheet oxd-sheet--rounded oxd-sheet--white orangehrm-buzz-create-post"><form class="oxd-form" data-form="buzz-create" novalidate>
+<div class="orangehrm-buzz-create-post-header"><div class="orangehrm-buzz-create-post-header-text">
+<textarea class="oxd-buzz-post-input" rows="1" placeholder="What's on your mind?"></textarea></div>
+<button type="submit" class="oxd-button oxd-button--medium oxd-button--main">Post</button></div>
+<div class="orangehrm-buzz-create-post-actions">
+<button type="button" class="oxd-glass-button oxd-buzz-post-img-button"><i class="oxd-icon bi-camera-fill"></i><span>Share Photos</span></button>
+<button type="button" class="oxd-glass-button"><i class="oxd-icon bi-camera-video-fill"></i><span>Share Video</span></button></div>
+<div class="orangehrm-buzz-photo-input" hidden><input type="file" class="oxd-file-input" accept="image/gif, image/jpeg, image/png"></div>
+</form></div>
+<div class="orangehrm-buzz-newsfeed-posts" data-role="feed"></div></div></div>"""
+    return html_response(layout("Buzz", body, "buzz"))
+
+
+@page(r"buzz/photo/(\d+)/(\d+)")
+def buzz_photo(store, request, share_id, index):
+    post = store.posts.get(int(share_id))
+    photos = post["photos"] if post else []
+    if int(index) >= len(photos):
+        return Response(404, [("Content-Type", "text/plain")], b"Not Found")
+    photo = photos[int(index)]
+    return Response(200, [("Content-Type", photo["type"]), ("Cache-Control", "private, max-age=3600")], photo["content"])
@@ -0,0 +1 @@
+"""Shared infrastructure for the OrangeHRM test suite (browsers, waits, reporting)."""
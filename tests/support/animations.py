@@ -0,0 +1,91 @@
+"""Animation-free UI for test browsers (on by default; ``DISABLE_ANIMATIONS=0`` turns it off).
+
+OXD dropdowns, dialogs, toasts and the form loader animate in and out, and
+a wait for any of them sits through the animation. :data:`STILL_JS` is
+installed with CDP ``Page.addScriptToEvaluateOnNewDocument``, so it runs
+before the page's own scripts on every document. It does two things:
+
+* adds a stylesheet that zeroes CSS transition and animation durations and
+  delays. Elements then jump to their final state within a frame, and
+  ``transitionend`` / ``animationend`` still fire.
+* hides every ``.oxd-toast`` :data:`TOAST_MS` after it appears (a
+  MutationObserver sets ``display: none``), so a toast stops covering the
+  buttons below it sooner. This works on the real OrangeHRM build, whose
+  toaster has no configurable timeout. The stand-in's own timer honours
+  ``window.oxdConfig.toastMs``, which is set to the same value so that it
+  removes its toasts at that point too.
+
+A test that asserts on the animations themselves keeps them with
+``@pytest.mark.animations``. The script only affects documents loaded after
+it was installed or removed, and the fixtures toggle it before the test
+navigates anywhere.
+"""
+import json
+import os
+
+TOAST_MS = 1000
+
+NO_ANIMATION_CSS = (
+    "*, *::before, *::after {"
+    " transition-duration: 0s !important; transition-delay: 0s !important;"
+    " animation-duration: 0s !important; animation-delay: 0s !important;"
+    " scroll-behavior: auto !important; }"
+)
+
+# Runs before the page's scripts; <head> may not exist yet. Toasts are hidden
+# rather than removed, so the app's own toaster still owns its nodes.
+STILL_JS = """
+(() => {
+    window.oxdConfig = Object.assign(window.oxdConfig || {}, {toastMs: %(toast)d});
+    const style = document.createElement('style');
+    style.id = '__no-animations';
+    style.textContent = %(css)s;
+    const hide = toast => setTimeout(() => { toast.style.display = 'none'; }, %(toast)d);
+    const added = records => {
+        for (const record of records) {
+            for (const node of record.addedNodes) {
+                if (node.nodeType !== 1) continue;
+                if (node.matches('.oxd-toast')) hide(node);
+                else node.querySelectorAll('.oxd-toast').forEach(hide);
+            }
+        }
+    };
+    const start = () => {
+        (document.head || document.documentElement).appendChild(style);
+        new MutationObserver(added).observe(document.documentElement, {childList: true, subtree: true});
+    };
+    if (document.documentElement) start(); else document.addEventListener('readystatechange', start, {once: true});
+})();
+""" % {"toast": TOAST_MS, "css": json.dumps(NO_ANIMATION_CSS)}
+
+
+def animations_disabled():
+    return os.getenv("DISABLE_ANIMATIONS", "1").lower() in ("1", "true", "yes")
+
+
+class AnimationSwitch:
+    """Installs or removes :data:`STILL_JS` on one browser; kept on the driver and reused across leases."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.identifier = None
+
+    @classmethod
+    def of(cls, driver):
+        switch = getattr(driver, "_animation_switch", None)
+        if switch is None:
+            switch = driver._animation_switch = cls(driver)
+        return switch
+
+    @property
+    def still(self):
+        return self.identifier is not None
+
+    def apply(self, still):
+        """Make documents loaded from now on animation-free (``still``) or animated."""
+        if still and self.identifier is None:
+            self.identifier = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STILL_JS})["identifier"]
+        elif not still and self.identifier is not None:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": self.identifier})
+            self.identifier = None
+        return self
@@ -0,0 +1,239 @@
+"""Test data seeding through OrangeHRM's REST API (``/web/index.php/api/v2``).
+
+Building prerequisites through the UI (an employee to edit, a supervisor to
+assign, a vacancy to apply to) takes tens of seconds per test; the same
+records cost a few milliseconds as API calls. :class:`OrangeHRMApi` talks to
+the API with the authenticated session cookies, which it shares with the
+browser fixtures through the session cache: whichever side logs in first,
+the other reuses the session.
+
+:class:`DataSeeder` creates records and remembers them, so the ``seed``
+fixture can delete everything it created when the test ends.
+"""
+import html
+import re
+from datetime import date
+
+import requests
+
+from support.session_cache import LOGIN_PATH
+from support.unique import unique_id
+
+API_PREFIX = "/web/index.php/api/v2"
+VALIDATE_PATH = "/web/index.php/auth/validate"
+DIRECT_REPORTING_METHOD = 1
+
+_TOKEN_RE = re.compile(r':token="([^"]+)"')
+
+
+class ApiError(RuntimeError):
+    def __init__(self, method, path, status, body):
+        super().__init__(f"{method} {path} -> HTTP {status}: {body[:300]}")
+        self.status = status
+
+
+def _browser_cookies(jar):
+    """Cookies in the shape ``driver.get_cookies()`` returns, for the session cache."""
+    cookies = []
+    for cookie in jar:
+        entry = {
+            "name": cookie.name,
+            "value": cookie.value,
+            "path": cookie.path or "/",
+            "domain": cookie.domain,
+            "secure": bool(cookie.secure),
+            "httpOnly": bool(cookie.has_nonstandard_attr("HttpOnly")),
+        }
+        if cookie.expires:
+            entry["expiry"] = cookie.expires
+        cookies.append(entry)
+    return cookies
+
+
+class OrangeHRMApi:
+    def __init__(self, base_url, cookies=(), timeout=15):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.calls = 0
+        self.http = requests.Session()
+        self.http.headers["Accept"] = "application/json"
+        for cookie in cookies:
+            self.http.cookies.set(cookie["name"], cookie["value"], path=cookie.get("path", "/"))
+
+    @classmethod
+    def connect(cls, base_url, credentials, cache=None, timeout=15):
+        """Client with a valid session: the cached one when the server still accepts it."""
+        username = credentials["username"]
+        cookies = cache.load(base_url, username) if cache is not None else None
+        if cookies:
+            api = cls(base_url, cookies, timeout)
+            if api.authenticated():
+                cache.reused += 1
+                return api
+            cache.invalidate(base_url, username)
+        api = cls(base_url, timeout=timeout)
+        api.login(username, credentials["password"])
+        if cache is not None:
+            cache.logins += 1
+            cache.save(base_url, username, _browser_cookies(api.http.cookies))
+        return api
+
+    def login(self, username, password):
+        """Form login: read the CSRF token from the login page and post the credentials."""
+        page = self.http.get(self.base_url + LOGIN_PATH, timeout=self.timeout)
+        match = _TOKEN_RE.search(page.text)
+        if match is None:
+            raise ApiError("GET", LOGIN_PATH, page.status_code, "login token not found")
+        token = html.unescape(match.group(1)).strip('"')
+        response = self.http.post(
+            self.base_url + VALIDATE_PATH,
+            data={"_token": token, "username": username, "password": password},
+            timeout=self.timeout,
+        )
+        if not self.authenticated():
+            raise ApiError("POST", VALIDATE_PATH, response.status_code, "login rejected")
+
+    def authenticated(self):
+        try:
+            self.request("GET", "pim/employees", params={"limit": 1})
+            return True
+        except ApiError:
+            return False
+
+    def request(self, method, path, **kwargs):
+        """Call ``/api/v2/<path>`` and return the ``data`` member of the JSON response."""
+        self.calls += 1
+        response = self.http.request(
+            method, f"{self.base_url}{API_PREFIX}/{path}", timeout=self.timeout, allow_redirects=False, **kwargs
+        )
+        if response.status_code >= 300:
+            raise ApiError(method, path, response.status_code, response.text)
+        return response.json().get("data")
+
+    # PIM
+
+    def create_employee(self, first_name, last_name, employee_id="", middle_name=""):
+        return self.request("POST", "pim/employees", json={
+            "firstName": first_name,
+            "middleName": middle_name,
+            "lastName": last_name,
+            "employeeId": employee_id,
+            "empPicture": None,
+        })
+
+    def delete_employees(self, emp_numbers):
+        return self.request("DELETE", "pim/employees", json={"ids": list(emp_numbers)})
+
+    def add_supervisor(self, emp_number, supervisor_emp_number, reporting_method_id=DIRECT_REPORTING_METHOD):
+        return self.request("POST", f"pim/employees/{emp_number}/supervisors", json={
+            "empNumber": supervisor_emp_number,
+            "reportingMethodId": reporting_method_id,
+        })
+
+    # Recruitment
+
+    def job_titles(self):
+        return self.request("GET", "admin/job-titles", params={"limit": 0})
+
+    def create_vacancy(self, name, job_title_id, hiring_manager_emp_number, positions=1):
+        return self.request("POST", "recruitment/vacancies", json={
+            "name": name,
+            "jobTitleId": job_title_id,
+            "employeeId": hiring_manager_emp_number,
+            "numOfPositions": positions,
+            "description": "",
+            "status": True,
+            "isPublished": False,
+        })
+
+    def delete_vacancies(self, ids):
+        return self.request("DELETE", "recruitment/vacancies", json={"ids": list(ids)})
+
+    def create_candidate(self, first_name, last_name, email, vacancy_id=None, **extra):
+        payload = {
+            "firstName": first_name,
+            "middleName": extra.pop("middle_name", ""),
+            "lastName": last_name,
+            "email": email,
+            "contactNumber": extra.pop("contact", None),
+            "keywords": extra.pop("keywords", None),
+            "comment": extra.pop("notes", None),
+            "dateOfApplication": extra.pop("applied_on", date.today().isoformat()),
+            "consentToKeepData": extra.pop("consent", True),
+            "vacancyId": vacancy_id,
+        }
+        payload.update(extra)
+        return self.request("POST", "recruitment/candidates", json=payload)
+
+    def delete_candidates(self, ids):
+        return self.request("DELETE", "recruitment/candidates", json={"ids": list(ids)})
+
+
+class DataSeeder:
+    """Creates test records through the API and deletes them again in :meth:`cleanup`."""
+
+    def __init__(self, api):
+        self.api = api
+        self.created = {"candidates": [], "vacancies": [], "employees": []}
+
+    def employee(self, first_name=None, last_name="Seeded", employee_id=None, middle_name=""):
+        suffix = unique_id()
+        record = self.api.create_employee(
+            first_name or f"Seed{suffix}",
+            last_name,
+            employee_id if employee_id is not None else f"S{suffix}",
+            middle_name,
+        )
+        self.created["employees"].append(record["empNumber"])
+        return record
+
+    def employees(self, count, **overrides):
+        return [self.employee(**overrides) for _ in range(count)]
+
+    def supervisor(self, of=None, first_name=None, last_name="Supervisor"):
+        """A new employee; assigned as supervisor of ``of`` (an employee record) when given."""
+        record = self.employee(first_name=first_name, last_name=last_name)
+        if of is not None:
+            self.api.add_supervisor(of["empNumber"], record["empNumber"])
+        return record
+
+    def vacancy(self, name=None, hiring_manager=None):
+        titles = self.api.job_titles()
+        if not titles:
+            raise ApiError("GET", "admin/job-titles", 200, "no job titles to attach a vacancy to")
+        manager = hiring_manager or self.employee(last_name="Manager")
+        record = self.api.create_vacancy(
+            name or f"Seeded Vacancy {unique_id()}", titles[0]["id"], manager["empNumber"]
+        )
+        self.created["vacancies"].append(record["id"])
+        return record
+
+    def candidate(self, vacancy=None, first_name=None, last_name="Candidate", **extra):
+        suffix = unique_id()
+        record = self.api.create_candidate(
+            first_name or f"Cand{suffix}",
+            last_name,
+            extra.pop("email", f"candidate.{suffix}@example.com"),
+            vacancy_id=vacancy["id"] if vacancy else None,
+            **extra,
+        )
+        self.created["candidates"].append(record["id"])
+        return record
+
+    def cleanup(self):
+        """Delete everything created, dependants first; returns the errors instead of raising."""
+        errors = []
+        for kind, delete in (
+            ("candidates", self.api.delete_candidates),
+            ("vacancies", self.api.delete_vacancies),
+            ("employees", self.api.delete_employees),
+        ):
+            ids = self.created[kind]
+            if not ids:
+                continue
+            try:
+                delete(ids)
+            except (ApiError, requests.RequestException) as exc:
+                errors.append(f"{kind}: {exc}")
+            self.created[kind] = []
+        return errors
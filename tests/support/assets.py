@@ -0,0 +1,217 @@
+"""Deterministic upload files of a requested type and size.
+
+Performance problems in the file paths only show up with realistic uploads
+(multi-MB photos, PDF resumes), not with a 1x1 PNG. :class:`AssetFactory`
+generates PNG and JPEG images (noise, so they do not compress), plain text
+and single-page PDFs from a seed. PNG, text and PDF files hit the requested
+size exactly; JPEG lands within a few percent of it.
+
+Generated files are kept across sessions under ``tests/.cache/assets``,
+content-addressed: ``<sha256 of content>/<kind>-<size>.<ext>``, plus one small
+index file per (kind, size, seed) so a cached asset is found without
+regenerating it. ``UPLOAD_SIZES`` (e.g. ``64KB,1MB,5MB``) is the size matrix
+the upload tests are parametrised over.
+"""
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import re
+from dataclasses import dataclass
+
+from PIL import Image, PngImagePlugin
+
+GENERATOR_VERSION = 1
+EXTENSIONS = {"png": "png", "jpeg": "jpg", "txt": "txt", "pdf": "pdf"}
+MIME_TYPES = {"png": "image/png", "jpeg": "image/jpeg", "txt": "text/plain", "pdf": "application/pdf"}
+UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+WORDS = (
+    "employee", "vacancy", "candidate", "interview", "attachment", "supervisor", "report", "salary",
+    "leave", "timesheet", "performance", "directory", "buzz", "recruitment", "onboarding", "payroll",
+)
+
+
+def parse_size(size):
+    """``65536``, ``"64KB"``, ``"1.5MB"`` -> bytes (binary units)."""
+    if isinstance(size, int):
+        return size
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMG]?B?)\s*", str(size).upper())
+    if match is None:
+        raise ValueError(f"not a size: {size!r}")
+    return int(float(match.group(1)) * UNITS[match.group(2) if match.group(2) != "K" else "KB"])
+
+
+def format_size(size):
+    for unit in ("GB", "MB", "KB"):
+        if size >= UNITS[unit] and size % UNITS[unit] == 0:
+            return f"{size // UNITS[unit]}{unit}"
+    return f"{size}B"
+
+
+def upload_sizes():
+    """The upload-size matrix from UPLOAD_SIZES (default 64KB)."""
+    return [parse_size(s) for s in os.getenv("UPLOAD_SIZES", "64KB").split(",") if s.strip()]
+
+
+@dataclass(frozen=True)
+class Asset:
+    path: str
+    kind: str
+    size: int
+    sha256: str
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    @property
+    def mime_type(self):
+        return MIME_TYPES[self.kind]
+
+
+class AssetFactory:
+    def __init__(self, root):
+        self.root = root
+        self.generated = 0
+        self.reused = 0
+        os.makedirs(os.path.join(root, "index"), exist_ok=True)
+
+    def create(self, kind, size, seed=0):
+        """An :class:`Asset` of ``kind`` (png, jpeg, txt, pdf) and about ``size`` bytes."""
+        if kind not in GENERATORS:
+            raise ValueError(f"unknown asset kind {kind!r}; expected one of {sorted(GENERATORS)}")
+        size = parse_size(size)
+        key = hashlib.sha256(f"{GENERATOR_VERSION}|{kind}|{size}|{seed}".encode()).hexdigest()
+        index_path = os.path.join(self.root, "index", f"{key}.json")
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                asset = Asset(**json.load(f))
+            if os.path.exists(asset.path):
+                self.reused += 1
+                return asset
+        except (OSError, ValueError, TypeError):
+            pass
+        data = GENERATORS[kind](size, random.Random(f"{kind}:{size}:{seed}"))
+        digest = hashlib.sha256(data).hexdigest()
+        path = os.path.join(self.root, digest, f"{kind}-{format_size(size)}.{EXTENSIONS[kind]}")
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _write_atomic(path, data)
+        asset = Asset(path=path, kind=kind, size=len(data), sha256=digest)
+        _write_atomic(index_path, json.dumps(asset.__dict__).encode())
+        self.generated += 1
+        return asset
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _filler(rng, count):
+    """``count`` printable, incompressible bytes."""
+    return rng.randbytes((count + 1) // 2).hex()[:count].encode()
+
+
+def _noise_image(pixels, rng):
+    width = max(1, math.isqrt(max(pixels, 1)))
+    height = max(1, pixels // width)
+    return Image.frombytes("RGB", (width, height), rng.randbytes(width * height * 3))
+
+
+def _png(size, rng):
+    # Noise does not compress, so the file is about 3 bytes per pixel; a text chunk pads it to the exact size.
+    pixels = max(1, (size - 256) // 3)
+    noise = rng.randbytes(pixels * 3)
+    while True:
+        width = max(1, math.isqrt(pixels))
+        height = max(1, pixels // width)
+        image = Image.frombytes("RGB", (width, height), noise[:width * height * 3])
+        plain = io.BytesIO()
+        image.save(plain, "PNG", compress_level=1)
+        padding = size - plain.tell() - len("tEXtComment") - 9
+        if padding >= 0 or pixels == 1:
+            break
+        pixels = max(1, pixels - (-padding // 3 + width))
+    if padding < 0:
+        return plain.getvalue()
+    info = PngImagePlugin.PngInfo()
+    info.add_text("Comment", _filler(rng, padding).decode())
+    out = io.BytesIO()
+    image.save(out, "PNG", compress_level=1, pnginfo=info)
+    return out.getvalue()
+
+
+def _jpeg(size, rng):
+    # Rescale from the measured bytes per pixel until just under the size, then a COM segment closes the gap.
+    pixels, noise_seed = max(1, size // 4), rng.random()
+    for _ in range(8):
+        out = io.BytesIO()
+        image = _noise_image(pixels, random.Random(noise_seed))
+        image.save(out, "JPEG", quality=90)
+        if 0.97 * size <= out.tell() <= size or (out.tell() < size and pixels == 1):
+            break
+        pixels = max(1, int(pixels * size / out.tell() * 0.985))
+    gap = size - out.tell() - 4
+    if 0 < gap <= 65000:
+        out = io.BytesIO()
+        image.save(out, "JPEG", quality=90, comment=_filler(rng, gap))
+    return out.getvalue()
+
+
+def _txt(size, rng):
+    lines, length = [], 0
+    while length < size:
+        line = " ".join(rng.choice(WORDS) for _ in range(12)) + "\n"
+        lines.append(line)
+        length += len(line)
+    return "".join(lines).encode("ascii")[:size]
+
+
+def _pdf(size, rng):
+    """A one-page PDF whose content stream is padded with comment lines to the exact size."""
+    text = f"BT /F1 18 Tf 72 720 Td (Generated resume, {format_size(size)}) Tj ET\n".encode()
+
+    def build(padding):
+        content = text + padding
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R"
+            b" /Resources << /Font << /F1 5 0 R >> >> >>",
+            b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        ]
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        return bytes(out)
+
+    def comments(count):
+        lines, left = [], count
+        while left > 0:
+            chunk = min(left, 80)
+            lines.append(b"%" + _filler(rng, chunk - 2) + b"\n" if chunk >= 2 else b"\n")
+            left -= chunk
+        return b"".join(lines)
+
+    base = build(b"")
+    padding = size - len(base)
+    if padding <= 0:
+        return base
+    # The /Length and startxref numbers grow by a few digits with the padding; trim those from the padding.
+    data = build(comments(padding))
+    return build(comments(padding - (len(data) - size))) if len(data) != size else data
+
+
+GENERATORS = {"png": _png, "jpeg": _jpeg, "txt": _txt, "pdf": _pdf}
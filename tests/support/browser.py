@@ -0,0 +1,112 @@
+"""Chrome launch helpers used by the driver fixtures."""
+import functools
+import os
+import shutil
+import tempfile
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+from support.animations import AnimationSwitch
+from support.driver_resolver import chrome_version
+from support.har import har_enabled
+from support.launch_profile import FAST_ARGUMENTS, clone_tree, launch_profile, profile_template
+from support.request_blocking import blocking_enabled
+
+
+def headless_enabled():
+    return os.getenv("HEADLESS", "0").lower() in ("1", "true", "yes")
+
+
+def chrome_options(download_dir, profile="default", user_data_dir=None):
+    """Build the Chrome options used for every test browser (see ``support.launch_profile``)."""
+    chrome_options = Options()
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    chrome_options.add_argument("--window-size=1920,1080")
+    prefs = {
+        "download.default_directory": download_dir,
+        "download.prompt_for_download": False,
+        "download.directory_upgrade": True,
+        "safebrowsing.enabled": True,
+        "profile.default_content_settings.popups": 0,
+    }
+    chrome_options.add_experimental_option("prefs", prefs)
+    if headless_enabled():
+        chrome_options.add_argument("--headless=new")
+    if profile == "fast":
+        for argument in FAST_ARGUMENTS:
+            chrome_options.add_argument(argument)
+    if user_data_dir is not None:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    if blocking_enabled() or har_enabled():
+        # Network events only; the request blocker and the HAR recorder read this log.
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    # Suppress ChromeDriver/system error logs for cleaner output
+    chrome_options.add_argument("--log-level=3")  # Suppress most Chrome logs
+    return chrome_options
+
+
+@functools.lru_cache(maxsize=None)
+def _template_key():
+    version = chrome_version()
+    return ".".join(version.split(".")[:3]) if version else "unknown"
+
+
+def _start(download_dir, driver_path, profile, user_data_dir=None):
+    options = chrome_options(download_dir, profile, user_data_dir)
+    service = Service(driver_path)
+    service.log_output = os.devnull  # Suppress driver logs to console
+    return webdriver.Chrome(service=service, options=options)
+
+
+def _warm_template(path, driver_path):
+    driver = _start(tempfile.gettempdir(), driver_path, "fast", path)
+    try:
+        driver.get("about:blank")
+    finally:
+        driver.quit()
+
+
+def launch_chrome(download_dir, driver_path, profile=None):
+    """Start a Chrome instance driven by the chromedriver at ``driver_path`` that saves downloads into ``download_dir``.
+
+    ``profile`` defaults to BROWSER_PROFILE; the ``fast`` profile starts from a
+    clone of the pre-warmed user-data-dir template, removed again by :func:`quit_chrome`.
+    """
+    os.makedirs(download_dir, exist_ok=True)
+    profile = profile or launch_profile()
+    user_data_dir = None
+    if profile == "fast":
+        template = profile_template(_template_key(), lambda path: _warm_template(path, driver_path))
+        user_data_dir = clone_tree(template, os.path.join(tempfile.mkdtemp(prefix="chrome-profile-"), "user-data"))
+    try:
+        driver = _start(download_dir, driver_path, profile, user_data_dir)
+    except Exception:
+        if user_data_dir is not None:
+            shutil.rmtree(os.path.dirname(user_data_dir), ignore_errors=True)
+        raise
+    driver._user_data_dir = user_data_dir
+    if profile == "fast":
+        AnimationSwitch.of(driver).apply(still=True)
+    # Explicit waits only: an implicit wait makes every failed probe block for its full timeout.
+    driver.implicitly_wait(0)
+    return driver
+
+
+def quit_chrome(driver):
+    try:
+        driver.quit()
+    except Exception:
+        try:
+            driver.service.stop()
+        except Exception:
+            pass
+    user_data_dir = getattr(driver, "_user_data_dir", None)
+    if user_data_dir is not None:
+        shutil.rmtree(os.path.dirname(user_data_dir), ignore_errors=True)
@@ -0,0 +1,216 @@
+"""Pool of warm Chrome instances shared by the tests of one pytest session.
+
+Launching Chrome (and resolving chromedriver) costs several seconds, so the
+``driver`` fixture leases a browser from this pool instead of starting a new
+one for every test. Between leases the browser is reset: extra tabs are
+closed, cookies and web storage are cleared, the download directory is
+emptied and the window is parked on ``about:blank``. A browser is recycled
+after ``max_uses`` leases, when its reset fails, or when it has crashed.
+:meth:`BrowserPool.warm` launches the ``size`` browsers up front, in
+parallel, when the session fixture is created; later misses (after a
+recycle or a crash, or with more concurrent leases than ``size``) launch on
+demand.
+
+Each pytest-xdist worker is its own process, so it gets its own pool.
+"""
+import os
+import shutil
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from selenium.common.exceptions import WebDriverException
+
+
+class StartupBudgetWarning(UserWarning):
+    """A browser took longer than the startup budget to launch."""
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    recycled: int = 0
+    crashed: int = 0
+    startup_budget: Optional[float] = None
+    launch_times: list = field(default_factory=list)
+    reset_times: list = field(default_factory=list)
+
+    def summary_lines(self):
+        leases = self.hits + self.misses
+        lines = [
+            f"leases: {leases} (hits {self.hits}, misses {self.misses})",
+            f"recycled: {self.recycled}, crashed: {self.crashed}",
+        ]
+        if self.launch_times:
+            total = sum(self.launch_times)
+            lines.append(
+                f"launches: {len(self.launch_times)}, total {total:.2f}s, avg {total / len(self.launch_times):.2f}s,"
+                f" max {max(self.launch_times):.2f}s"
+            )
+            if self.startup_budget is not None:
+                over = sum(1 for t in self.launch_times if t > self.startup_budget)
+                lines.append(f"startup budget {self.startup_budget:g}s: {over} of {len(self.launch_times)} launches over")
+        if self.reset_times:
+            total = sum(self.reset_times)
+            lines.append(
+                f"resets: {len(self.reset_times)}, total {total:.2f}s, avg {total / len(self.reset_times):.3f}s"
+            )
+        if self.launch_times and self.hits:
+            avg_launch = sum(self.launch_times) / len(self.launch_times)
+            avg_reset = sum(self.reset_times) / len(self.reset_times) if self.reset_times else 0.0
+            lines.append(f"estimated time saved: {self.hits * (avg_launch - avg_reset):.2f}s")
+        return lines
+
+
+@dataclass
+class PooledBrowser:
+    slot: int
+    driver: object
+    download_dir: str
+    uses: int = 0
+
+
+class BrowserPool:
+    """Hands out warm browsers created by ``factory(download_dir)``.
+
+    ``size`` is the number of browsers launched by :meth:`warm` and kept
+    idle between leases; browsers released while the pool is full are quit
+    instead of being kept.
+    """
+
+    def __init__(self, factory, download_root, size=1, max_uses=25, quit_fn=None, startup_budget=None):
+        self.factory = factory
+        self.download_root = download_root
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.quit_fn = quit_fn or (lambda driver: driver.quit())
+        self.stats = PoolStats(startup_budget=startup_budget)
+        self._idle = []
+        self._next_slot = 0
+        self._lock = threading.Lock()
+
+    def warm(self):
+        """Launch browsers until ``size`` are idle, all at once; returns the pool."""
+        with self._lock:
+            missing = self.size - len(self._idle)
+        if missing <= 0:
+            return self
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._launch) for _ in range(missing)]
+        launched, errors = [], []
+        for future in futures:
+            try:
+                launched.append(future.result())
+            except Exception as exc:
+                errors.append(exc)
+        with self._lock:
+            self._idle.extend(launched)
+        if errors:
+            self.close()
+            raise errors[0]
+        return self
+
+    def acquire(self):
+        with self._lock:
+            browser = self._idle.pop() if self._idle else None
+        while browser is not None and not self._alive(browser):
+            self.stats.crashed += 1
+            self._discard(browser)
+            with self._lock:
+                browser = self._idle.pop() if self._idle else None
+        if browser is None:
+            self.stats.misses += 1
+            browser = self._launch()
+        else:
+            self.stats.hits += 1
+        browser.uses += 1
+        return browser
+
+    def release(self, browser):
+        if not self._alive(browser):
+            self.stats.crashed += 1
+            self._discard(browser)
+            return
+        if browser.uses >= self.max_uses:
+            self.stats.recycled += 1
+            self._discard(browser)
+            return
+        start = time.monotonic()
+        try:
+            self._reset(browser)
+        except WebDriverException:
+            self.stats.recycled += 1
+            self._discard(browser)
+            return
+        finally:
+            self.stats.reset_times.append(time.monotonic() - start)
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(browser)
+                return
+        self._discard(browser)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for browser in idle:
+            self._discard(browser)
+
+    def _launch(self):
+        with self._lock:
+            slot = self._next_slot
+            self._next_slot += 1
+        download_dir = os.path.join(self.download_root, f"browser-{slot}")
+        os.makedirs(download_dir, exist_ok=True)
+        start = time.monotonic()
+        driver = self.factory(download_dir)
+        elapsed = time.monotonic() - start
+        self.stats.launch_times.append(elapsed)
+        if self.stats.startup_budget is not None and elapsed > self.stats.startup_budget:
+            warnings.warn(StartupBudgetWarning(f"browser launch took {elapsed:.2f}s (budget {self.stats.startup_budget:g}s)"))
+        return PooledBrowser(slot=slot, driver=driver, download_dir=download_dir)
+
+    def _discard(self, browser):
+        try:
+            self.quit_fn(browser.driver)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _alive(browser):
+        try:
+            return bool(browser.driver.window_handles)
+        except Exception:
+            return False
+
+    def _reset(self, browser):
+        driver = browser.driver
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if driver.current_url.startswith("http"):
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+        _empty_dir(browser.download_dir)
+
+
+def _empty_dir(path):
+    for name in os.listdir(path):
+        full = os.path.join(path, name)
+        if os.path.isdir(full):
+            shutil.rmtree(full, ignore_errors=True)
+        else:
+            try:
+                os.remove(full)
+            except OSError:
+                pass
@@ -0,0 +1,173 @@
+"""Event-driven download tracking for the test browsers.
+
+Polling the download directory for a guessed filename is slow and breaks as
+soon as Chrome renames a duplicate to ``name (1).ext``. The
+:class:`DownloadManager` instead switches the browser to CDP
+``Browser.setDownloadBehavior(allowAndName, eventsEnabled)`` and listens for
+``Browser.downloadWillBegin`` / ``Browser.downloadProgress`` over Selenium's
+CDP websocket (a trio loop on a background thread). Chrome then saves each
+download under its GUID; on completion the manager renames it to the
+suggested filename (``name (n).ext`` when taken, like Chrome does) and wakes
+up :meth:`DownloadManager.wait`. Nothing polls the file system.
+
+:meth:`Download.sha256` hashes the file in chunks, so large attachments can
+be compared with the uploaded original without reading either into memory.
+"""
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import trio
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def sha256_file(path, chunk_size=CHUNK_SIZE):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class Download:
+    guid: str
+    url: str
+    suggested_filename: str
+    started: float
+    state: str = "inProgress"
+    total_bytes: int = 0
+    received_bytes: int = 0
+    finished: Optional[float] = None
+    path: Optional[str] = None
+
+    @property
+    def filename(self):
+        return os.path.basename(self.path) if self.path else None
+
+    @property
+    def duration(self):
+        return self.finished - self.started if self.finished is not None else None
+
+    def sha256(self):
+        return sha256_file(self.path)
+
+
+class DownloadError(RuntimeError):
+    pass
+
+
+class DownloadManager:
+    """Tracks the downloads of one browser while started (see module docstring)."""
+
+    def __init__(self, driver, directory, connect_timeout=10):
+        self.driver = driver
+        self.directory = os.path.abspath(directory)
+        self.connect_timeout = connect_timeout
+        self.downloads = {}
+        self._finished = []
+        self._returned = 0
+        self._changed = threading.Condition()
+        self._ready = threading.Event()
+        self._error = None
+        self._trio_token = None
+        self._cancel_scope = None
+        self._thread = None
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=trio.run, args=(self._run,), name="download-events", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(self.connect_timeout) and self._error is None:
+            self._error = TimeoutError(f"no CDP connection within {self.connect_timeout}s")
+        if self._error is not None:
+            raise DownloadError(f"could not subscribe to download events: {self._error}")
+        return self
+
+    def stop(self):
+        if self._trio_token is not None and self._thread.is_alive():
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._trio_token)
+            except trio.RunFinishedError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def wait(self, timeout=30):
+        """The next finished download (in completion order); raises on timeout, cancellation or a failed listener."""
+        with self._changed:
+            self._changed.wait_for(lambda: len(self._finished) > self._returned or self._error is not None, timeout)
+            if len(self._finished) <= self._returned:
+                if self._error is not None:
+                    raise DownloadError(f"download events unavailable: {self._error}")
+                pending = [d.suggested_filename for d in self.downloads.values() if d.state == "inProgress"]
+                raise DownloadError(f"no download finished within {timeout}s (in progress: {pending or 'none'})")
+            download = self._finished[self._returned]
+            self._returned += 1
+        if download.state != "completed":
+            raise DownloadError(f"download of {download.suggested_filename} was {download.state}")
+        return download
+
+    async def _run(self):
+        try:
+            async with self.driver.bidi_connection() as connection:
+                session, devtools = connection.session, connection.devtools
+                events = session.listen(devtools.browser.DownloadWillBegin, devtools.browser.DownloadProgress, buffer_size=256)
+                await session.execute(devtools.browser.set_download_behavior(
+                    behavior="allowAndName", download_path=self.directory, events_enabled=True,
+                ))
+                try:
+                    with trio.CancelScope() as self._cancel_scope:
+                        self._trio_token = trio.lowlevel.current_trio_token()
+                        self._ready.set()
+                        async for event in events:
+                            self._on_event(event, devtools)
+                finally:
+                    # Back to the download.default_directory preference for the next lease of this browser.
+                    with trio.move_on_after(5):
+                        await session.execute(devtools.browser.set_download_behavior(behavior="default"))
+        except Exception as exc:
+            with self._changed:
+                self._error = exc
+                self._changed.notify_all()
+            self._ready.set()
+
+    def _on_event(self, event, devtools):
+        if isinstance(event, devtools.browser.DownloadWillBegin):
+            self.downloads[event.guid] = Download(event.guid, event.url, event.suggested_filename, time.monotonic())
+            return
+        download = self.downloads.get(event.guid)
+        if download is None or download.state != "inProgress":
+            return
+        download.total_bytes = int(event.total_bytes)
+        download.received_bytes = int(event.received_bytes)
+        if event.state == "inProgress":
+            return
+        download.state = event.state
+        download.finished = time.monotonic()
+        if event.state == "completed":
+            download.path = self._claim_name(download)
+        with self._changed:
+            self._finished.append(download)
+            self._changed.notify_all()
+
+    def _claim_name(self, download):
+        """Rename the GUID-named file to its suggested name, numbering it like Chrome when taken."""
+        stem, ext = os.path.splitext(download.suggested_filename or download.guid)
+        target, n = os.path.join(self.directory, f"{stem}{ext}"), 0
+        while os.path.exists(target):
+            n += 1
+            target = os.path.join(self.directory, f"{stem} ({n}){ext}")
+        # Events are handled one at a time on the listener thread, so the name cannot be taken meanwhile.
+        os.replace(os.path.join(self.directory, download.guid), target)
+        return target
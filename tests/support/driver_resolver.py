@@ -0,0 +1,140 @@
+"""Offline, cached chromedriver resolution.
+
+``ChromeDriverManager().install()`` looks the driver version up online on
+every call. :func:`resolve_chromedriver` runs once per session and pins a
+chromedriver binary to the installed Chrome version instead. It tries, in
+order:
+
+1. ``CHROMEDRIVER_PATH`` - an explicit binary, used as is
+2. ``tests/.cache/chromedriver/<chrome build>/`` - a driver cached by an
+   earlier run for this Chrome build (major.minor.build)
+3. a ``chromedriver`` on the PATH whose major version matches Chrome
+4. a download through webdriver-manager, copied into the cache for next time
+
+Steps 1-3 never touch the network; with ``CHROMEDRIVER_OFFLINE=1`` step 4 is
+an error instead. The Chrome version comes from ``<chrome> --version`` (or
+the registry on Windows); ``CHROME_BINARY`` points at a non-standard install.
+"""
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "chromedriver")
+VERSION_RE = re.compile(r"\d+\.\d+\.\d+\.\d+")
+DRIVER_NAME = "chromedriver.exe" if sys.platform == "win32" else "chromedriver"
+
+
+class DriverResolutionError(RuntimeError):
+    pass
+
+
+@dataclass
+class Resolution:
+    path: str
+    source: str
+    seconds: float
+    chrome_version: Optional[str] = None
+
+    def summary_line(self):
+        chrome = f"Chrome {self.chrome_version}" if self.chrome_version else "Chrome version unknown"
+        return f"{self.source} in {self.seconds:.3f}s ({chrome}): {self.path}"
+
+
+def offline():
+    return os.getenv("CHROMEDRIVER_OFFLINE", "0").lower() in ("1", "true", "yes")
+
+
+def chrome_version():
+    """The installed Chrome's full version, or None when it cannot be found locally."""
+    binary = os.getenv("CHROME_BINARY")
+    for candidate in [binary] if binary else _chrome_candidates():
+        version = _binary_version(candidate)
+        if version:
+            return version
+    if sys.platform == "win32" and not binary:
+        return _registry_version()
+    return None
+
+
+def _chrome_candidates():
+    if sys.platform == "darwin":
+        return ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "/Applications/Chromium.app/Contents/MacOS/Chromium"]
+    if sys.platform == "win32":
+        return []  # chrome.exe --version prints nothing on Windows; the registry has it
+    return ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+
+
+def _binary_version(binary):
+    path = shutil.which(binary) or (binary if os.path.isfile(binary) else None)
+    if path is None:
+        return None
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=15).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_RE.search(output)
+    return match.group(0) if match else None
+
+
+def _registry_version():
+    import winreg
+
+    for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(root, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            continue
+    return None
+
+
+def _build(version):
+    return ".".join(version.split(".")[:3])
+
+
+def _major(version):
+    return version.split(".")[0]
+
+
+def resolve_chromedriver(cache_dir=CACHE_DIR):
+    """A :class:`Resolution` for the installed Chrome; raises :class:`DriverResolutionError`."""
+    start = time.monotonic()
+
+    def done(path, source, version=None):
+        return Resolution(path, source, time.monotonic() - start, version)
+
+    explicit = os.getenv("CHROMEDRIVER_PATH")
+    if explicit:
+        if not os.path.isfile(explicit):
+            raise DriverResolutionError(f"CHROMEDRIVER_PATH does not exist: {explicit}")
+        return done(explicit, "CHROMEDRIVER_PATH")
+
+    version = chrome_version()
+    if version is None:
+        raise DriverResolutionError("Chrome not found; set CHROME_BINARY to its executable or CHROMEDRIVER_PATH to a driver")
+    cached = os.path.join(cache_dir, _build(version), DRIVER_NAME)
+    if os.path.isfile(cached):
+        return done(cached, "cache", version)
+
+    on_path = shutil.which("chromedriver")
+    if on_path:
+        driver_version = _binary_version(on_path)
+        if driver_version and _major(driver_version) == _major(version):
+            return done(on_path, "PATH", version)
+
+    if offline():
+        raise DriverResolutionError(f"no cached chromedriver for Chrome {version} and CHROMEDRIVER_OFFLINE is set")
+    downloaded = ChromeDriverManager().install()
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    tmp_path = f"{cached}.{os.getpid()}.tmp"
+    shutil.copy2(downloaded, tmp_path)
+    os.chmod(tmp_path, 0o755)
+    os.replace(tmp_path, cached)
+    return done(cached, "download", version)
@@ -0,0 +1,67 @@
+"""Pytest plugin feeding the duration store with per-test and per-step timings.
+
+Steps are reported by calling :func:`record_step` with the running test item;
+the records are written together with the test's own record once its call
+phase has finished. Set ``DURATION_STORE=0`` to disable recording and
+``TEST_RUN_ID`` to group several pytest processes into one run.
+"""
+import os
+import time
+
+import pytest
+
+from support.durations import DurationStore, new_run_id
+
+steps_key = pytest.StashKey[list]()
+store_key = pytest.StashKey[DurationStore]()
+run_id_key = pytest.StashKey[str]()
+
+
+def record_step(item, name, duration, outcome="passed", **extra):
+    item.stash.setdefault(steps_key, []).append(
+        {"name": name, "duration": duration, "outcome": outcome, **extra}
+    )
+
+
+def _enabled():
+    return os.getenv("DURATION_STORE", "1").lower() not in ("0", "false", "no")
+
+
+def pytest_configure(config):
+    if not _enabled():
+        return
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput and "duration_run_id" in workerinput:
+        run_id = workerinput["duration_run_id"]
+    else:
+        run_id = os.getenv("TEST_RUN_ID") or new_run_id()
+    config.stash[run_id_key] = run_id
+    config.stash[store_key] = DurationStore()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """pytest-xdist: share the controller's run id with every worker."""
+    run_id = node.config.stash.get(run_id_key, None)
+    if run_id:
+        node.workerinput["duration_run_id"] = run_id
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    store = item.config.stash.get(store_key, None)
+    if store is None:
+        return
+    if report.when != "call" and not (report.when == "setup" and report.failed):
+        return
+    run_id = item.config.stash[run_id_key]
+    now = time.time()
+    records = [{
+        "run": run_id, "ts": now, "nodeid": item.nodeid, "kind": "test", "name": "",
+        "duration": report.duration, "outcome": report.outcome,
+    }]
+    for step in item.stash.get(steps_key, []):
+        records.append({"run": run_id, "ts": now, "nodeid": item.nodeid, "kind": "step", **step})
+    store.append(records)
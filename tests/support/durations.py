@@ -0,0 +1,189 @@
+"""Persistent store of test and step durations, plus a small reporting CLI.
+
+Every finished test appends one JSON line per test and per step to
+``tests/.cache/durations.jsonl``; lines from the same run share a ``run`` id.
+The file is append-only so concurrent pytest processes can write to it.
+
+Usage (from the ``tests`` directory)::
+
+    python -m support.durations report [--steps] [--last N]
+    python -m support.durations regressions [--z 3.0] [--min-baseline 5]
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "durations.jsonl")
+
+
+def percentile(values, q):
+    """Linear-interpolated percentile, ``q`` in [0, 100]."""
+    ordered = sorted(values)
+    if not ordered:
+        return math.nan
+    pos = (len(ordered) - 1) * q / 100.0
+    lower = math.floor(pos)
+    upper = math.ceil(pos)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+
+
+@dataclass
+class Regression:
+    nodeid: str
+    kind: str
+    name: str
+    duration: float
+    baseline_p50: float
+    baseline_p95: float
+    zscore: float
+
+
+class DurationStore:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+
+    def append(self, records):
+        if not records:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        payload = "".join(json.dumps(r, sort_keys=True) + "\n" for r in records)
+        # One write per test keeps lines from concurrent processes intact.
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(payload)
+
+    def records(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # tolerate a torn line from an interrupted run
+        except OSError:
+            return
+
+    def runs(self):
+        """Run ids in the order they first appear."""
+        seen = {}
+        for record in self.records():
+            seen.setdefault(record["run"], record.get("ts", 0))
+        return sorted(seen, key=seen.get)
+
+    def series(self, kinds=("test",), last=None):
+        """Map (nodeid, kind, name) -> list of durations in run order."""
+        runs = self.runs()
+        if last:
+            runs = runs[-last:]
+        allowed = set(runs)
+        grouped = defaultdict(list)
+        for record in self.records():
+            if record["run"] in allowed and record["kind"] in kinds:
+                grouped[(record["nodeid"], record["kind"], record.get("name", ""))].append(record["duration"])
+        return grouped
+
+    def module_durations(self, last=5):
+        """Average total test time per module file over the last ``last`` runs."""
+        runs = self.runs()[-last:]
+        allowed = set(runs)
+        per_run = defaultdict(lambda: defaultdict(float))
+        for record in self.records():
+            if record["kind"] == "test" and record["run"] in allowed:
+                module = os.path.basename(record["nodeid"].split("::", 1)[0])
+                per_run[module][record["run"]] += record["duration"]
+        return {module: statistics.mean(totals.values()) for module, totals in per_run.items()}
+
+    def regressions(self, z_threshold=3.0, min_baseline=5, kinds=("test", "step")):
+        """Compare the latest run against all earlier runs.
+
+        A test or step is flagged when its latest duration is above the
+        baseline p95 and more than ``z_threshold`` standard deviations above
+        the baseline mean. A step name that repeats within a test (a step in
+        a loop) counts as its total per run, on both sides of the comparison.
+        """
+        runs = self.runs()
+        if len(runs) < 2:
+            return []
+        latest = runs[-1]
+        per_run = defaultdict(lambda: defaultdict(float))
+        for record in self.records():
+            if record["kind"] in kinds:
+                per_run[(record["nodeid"], record["kind"], record.get("name", ""))][record["run"]] += record["duration"]
+        found = []
+        for key, totals in per_run.items():
+            if latest not in totals:
+                continue
+            duration = totals[latest]
+            history = [total for run, total in totals.items() if run != latest]
+            if len(history) < min_baseline:
+                continue
+            mean = statistics.mean(history)
+            stdev = statistics.pstdev(history)
+            # A perfectly stable baseline would make any change infinitely significant.
+            stdev = max(stdev, 0.05 * mean, 0.01)
+            zscore = (duration - mean) / stdev
+            p95 = percentile(history, 95)
+            if duration > p95 and zscore > z_threshold:
+                found.append(Regression(*key, duration, percentile(history, 50), p95, zscore))
+        return sorted(found, key=lambda r: -r.zscore)
+
+
+def new_run_id():
+    return time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+
+
+def _print_report(store, steps, last):
+    kinds = ("test", "step") if steps else ("test",)
+    series = store.series(kinds=kinds, last=last)
+    if not series:
+        print(f"No durations recorded in {store.path}")
+        return
+    print(f"{'n':>4} {'p50':>8} {'p95':>8}  test / step")
+    for (nodeid, kind, name), values in sorted(series.items(), key=lambda kv: (kv[0][0], kv[0][1] != "test")):
+        label = nodeid if kind == "test" else f"  └ {name}"
+        print(f"{len(values):>4} {percentile(values, 50):>7.2f}s {percentile(values, 95):>7.2f}s  {label}")
+
+
+def _print_regressions(store, z_threshold, min_baseline):
+    found = store.regressions(z_threshold=z_threshold, min_baseline=min_baseline)
+    if not found:
+        print("No regressions in the latest run.")
+        return 0
+    print(f"Slower than baseline in run {store.runs()[-1]}:")
+    for r in found:
+        label = r.nodeid if r.kind == "test" else f"{r.nodeid} :: {r.name}"
+        print(f"  {label}: {r.duration:.2f}s (baseline p50 {r.baseline_p50:.2f}s, p95 {r.baseline_p95:.2f}s, z={r.zscore:.1f})")
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m support.durations", description="Test duration history")
+    parser.add_argument("--store", default=DEFAULT_PATH, help="path of the durations JSONL file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    report = sub.add_parser("report", help="p50/p95 per test")
+    report.add_argument("--steps", action="store_true", help="include per-step timings")
+    report.add_argument("--last", type=int, default=None, help="only use the last N runs")
+    regress = sub.add_parser("regressions", help="flag tests slower than baseline in the latest run")
+    regress.add_argument("--z", type=float, default=3.0, help="z-score threshold (default 3.0)")
+    regress.add_argument("--min-baseline", type=int, default=5, help="minimum earlier samples (default 5)")
+    args = parser.parse_args(argv)
+
+    store = DurationStore(args.store)
+    if args.command == "report":
+        _print_report(store, args.steps, args.last)
+        return 0
+    return _print_regressions(store, args.z, args.min_baseline)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
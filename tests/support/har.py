@@ -0,0 +1,218 @@
+"""Network waterfall (HAR) capture for slow or failing steps (``HAR_CAPTURE=1``).
+
+The recorder follows the ``Network.*`` events of Chrome's performance log
+(through :class:`support.perf_log.PerformanceLog`). It keeps the last
+``HAR_BUFFER`` finished requests (default 500) in a ring buffer, so memory
+stays flat however long the session runs. Nothing is written for a step that
+passes within ``HAR_STEP_THRESHOLD`` seconds (default 5).
+
+For a slower or failed step, the requests issued during the step go to
+``tests/reports/har/<test>/<step number>-<step name>.har``. Requests still in
+flight when the step ended are included too, as entries without a response.
+This is HAR 1.2, so DevTools and other HAR viewers open it. The timings
+split every request into blocked / dns / connect / ssl / send / wait /
+receive: a long ``wait`` is the backend, while short requests in a slow step
+point at the frontend.
+"""
+import json
+import os
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from support.perf_log import PerformanceLog
+
+
+def har_enabled():
+    return os.getenv("HAR_CAPTURE", "0").lower() in ("1", "true", "yes")
+
+
+def _iso(wall_time):
+    return datetime.fromtimestamp(wall_time, timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _headers(headers):
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def _slug(text, limit=60):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", text).strip("_")[:limit] or "step"
+
+
+class _Request:
+    """One request being assembled from its CDP events."""
+
+    __slots__ = ("request_id", "wall_time", "timestamp", "request", "response", "end", "size", "error")
+
+    def __init__(self, params):
+        self.request_id = params["requestId"]
+        self.wall_time = params["wallTime"]
+        self.timestamp = params["timestamp"]
+        self.request = params["request"]
+        self.response = None
+        self.end = None
+        self.size = -1
+        self.error = None
+
+    def entry(self, pageref):
+        request, response = self.request, self.response or {}
+        total = (self.end - self.timestamp) * 1000 if self.end is not None else -1
+        entry = {
+            "pageref": pageref,
+            "startedDateTime": _iso(self.wall_time),
+            "time": round(total, 3),
+            "request": {
+                "method": request.get("method", "GET"),
+                "url": request.get("url", ""),
+                "httpVersion": response.get("protocol", ""),
+                "headers": _headers(request.get("headers")),
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(request.get("postData", "")),
+            },
+            "response": {
+                "status": response.get("status", 0),
+                "statusText": response.get("statusText", ""),
+                "httpVersion": response.get("protocol", ""),
+                "headers": _headers(response.get("headers")),
+                "cookies": [],
+                "content": {"size": self.size, "mimeType": response.get("mimeType", "")},
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": self.size,
+            },
+            "cache": {},
+            "timings": self._timings(total),
+        }
+        if response.get("remoteIPAddress"):
+            entry["serverIPAddress"] = response["remoteIPAddress"]
+        if self.error:
+            entry["_error"] = self.error
+        if self.end is None:
+            entry["_inFlight"] = True
+        return entry
+
+    def _timings(self, total):
+        timing = (self.response or {}).get("timing")
+        if not timing or total < 0:
+            return {"send": 0, "wait": round(max(total, 0), 3), "receive": 0}
+
+        def span(start, end):
+            return round(timing[end] - timing[start], 3) if timing.get(start, -1) >= 0 else -1
+
+        # CDP timing offsets are milliseconds relative to timing.requestTime (seconds).
+        offset = (timing["requestTime"] - self.timestamp) * 1000
+        starts = [timing[k] for k in ("dnsStart", "connectStart", "sendStart") if timing.get(k, -1) >= 0]
+        headers_end = timing.get("receiveHeadersEnd", 0)
+        return {
+            "blocked": round(offset + (starts[0] if starts else 0), 3),
+            "dns": span("dnsStart", "dnsEnd"),
+            "connect": span("connectStart", "connectEnd"),
+            "ssl": span("sslStart", "sslEnd"),
+            "send": span("sendStart", "sendEnd"),
+            "wait": round(headers_end - timing.get("sendEnd", 0), 3),
+            "receive": round(max(0.0, total - offset - headers_end), 3),
+        }
+
+
+@dataclass
+class HarCapture:
+    """Session-wide settings, plus the HAR files written so far."""
+
+    directory: str
+    threshold: float = 5.0
+    capacity: int = 500
+    written: list = field(default_factory=list)
+
+    @classmethod
+    def from_env(cls, directory):
+        return cls(
+            directory,
+            threshold=float(os.getenv("HAR_STEP_THRESHOLD", "5")),
+            capacity=int(os.getenv("HAR_BUFFER", "500")),
+        )
+
+    def recorder(self, driver):
+        """The driver's recorder, installing it on first use."""
+        recorder = getattr(driver, "_har_recorder", None)
+        if recorder is None:
+            recorder = driver._har_recorder = HarRecorder(driver, self)
+        return recorder
+
+
+class HarRecorder:
+    """Ring buffer of one browser's requests; installed once per driver and reused across leases."""
+
+    def __init__(self, driver, capture):
+        self.capture = capture
+        self.finished = deque(maxlen=capture.capacity)
+        self.pending = OrderedDict()
+        self.item = None
+        self.log = PerformanceLog.of(driver)
+        self.log.subscribe(self._on_message)
+        self._step_start = None
+
+    def begin(self, item):
+        self.log.pump()
+        self.item = item
+
+    def end(self):
+        self.item = None
+
+    def step_started(self):
+        self._step_start = time.time()
+
+    def step_finished(self, number, name, duration, failed):
+        """Write the step's HAR when it failed or exceeded the threshold; returns the path or None."""
+        if self.item is None or self._step_start is None or not (failed or duration > self.capture.threshold):
+            return None
+        self.log.pump()
+        since = self._step_start - 0.05
+        requests = [r for r in self.finished if r.wall_time >= since]
+        requests += [r for r in self.pending.values() if r.wall_time >= since]
+        requests.sort(key=lambda r: r.timestamp)
+        path = os.path.join(self.capture.directory, _slug(self.item.nodeid, 120), f"{number:02d}-{_slug(name)}.har")
+        title = f"Step {number}: {name} ({duration:.2f}s{', failed' if failed else ''})"
+        har = {"log": {
+            "version": "1.2",
+            "creator": {"name": "orangehrm-tests", "version": "1.0"},
+            "pages": [{"startedDateTime": _iso(self._step_start), "id": "step", "title": title, "pageTimings": {}}],
+            "entries": [r.entry("step") for r in requests],
+        }}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(har, f, indent=1)
+        self.capture.written.append(path)
+        return path
+
+    def _on_message(self, message):
+        method, params = message.get("method", ""), message.get("params", {})
+        if not method.startswith("Network."):
+            return
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            previous = self.pending.pop(request_id, None)
+            if previous is not None and params.get("redirectResponse"):
+                # A redirect reuses the request id: close the hop that was redirected.
+                previous.response = params["redirectResponse"]
+                previous.end = params["timestamp"]
+                self.finished.append(previous)
+            self.pending[request_id] = _Request(params)
+            while len(self.pending) > self.capture.capacity:
+                self.pending.popitem(last=False)
+            return
+        current = self.pending.get(request_id)
+        if current is None:
+            return
+        if method == "Network.responseReceived":
+            current.response = params["response"]
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            current.end = params["timestamp"]
+            if method == "Network.loadingFinished":
+                current.size = int(params.get("encodedDataLength", 0))
+            else:
+                current.error = params.get("blockedReason") or params.get("errorText", "failed")
+            self.finished.append(self.pending.pop(request_id))
@@ -0,0 +1,308 @@
+"""Record/replay HTTP cache in front of the OrangeHRM server.
+
+Every fresh Chrome downloads the full OrangeHRM JS/CSS bundles, fonts and
+images again. With ``HTTP_CACHE=record`` or ``HTTP_CACHE=replay`` the tests
+talk to a local reverse proxy instead of the server: ``base_url`` becomes the
+proxy URL and the proxy forwards everything to the real origin over pooled
+keep-alive connections.
+
+Cacheable responses (static assets, plus the API GETs listed in
+``HTTP_CACHE_API``) are kept in a content-addressed store under
+``tests/.cache/http``:
+
+* ``blobs/<sha256 of body>`` - response bodies, shared by identical responses
+* ``entries/<sha256 of request>.json`` - status, headers and body hash per request
+
+``record`` always fetches from the origin and refreshes the store; ``replay``
+serves stored responses and only goes upstream (and stores the result) on a
+miss. Entries expire after ``HTTP_CACHE_TTL`` seconds and the least recently
+used ones are evicted once the blobs exceed ``HTTP_CACHE_MAX_MB``. Entries are
+single files replaced atomically, so pytest-xdist workers can share a store.
+
+HTML pages, non-GET requests and responses that set cookies are never cached:
+they carry the session and the CSRF token.
+"""
+import hashlib
+import http.cookiejar
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+
+MODES = ("record", "replay")
+STATIC_PATH_RE = re.compile(r"^/web/(dist|images|build)/|\.(js|css|woff2?|ttf|eot|svg|png|jpe?g|gif|ico|map)$")
+API_PREFIX = "/web/index.php/api/v2/"
+HOP_BY_HOP = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailer",
+    "transfer-encoding", "upgrade", "content-encoding", "content-length", "host", "accept-encoding",
+}
+TEXT_TYPES = ("text/", "application/javascript", "application/json", "application/x-javascript")
+
+
+def cache_mode():
+    """``record``, ``replay`` or None (HTTP_CACHE unset or off)."""
+    mode = os.getenv("HTTP_CACHE", "").lower()
+    return mode if mode in MODES else None
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: list
+    body: bytes
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    passed: int = 0
+    bytes_served: int = 0
+    evicted: int = 0
+
+    def summary_lines(self):
+        lookups = self.hits + self.misses
+        rate = f"{100 * self.hits / lookups:.0f}%" if lookups else "n/a"
+        return [
+            f"hits: {self.hits}, misses: {self.misses} (hit rate {rate}), stored: {self.stored}",
+            f"served from cache: {self.bytes_served / 1024:.0f} KiB, passed through: {self.passed}, evicted: {self.evicted}",
+        ]
+
+
+class HttpCache:
+    """Content-addressed response store with TTL and size-based LRU eviction."""
+
+    def __init__(self, root, ttl=7 * 24 * 3600, max_bytes=200 * 1024 * 1024):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._blobs = os.path.join(root, "blobs")
+        self._entries = os.path.join(root, "entries")
+        os.makedirs(self._blobs, exist_ok=True)
+        os.makedirs(self._entries, exist_ok=True)
+
+    @staticmethod
+    def key(method, target):
+        return hashlib.sha256(f"{method} {target}".encode()).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self._entries, f"{key}.json")
+
+    def get(self, key):
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry["stored_at"] + self.ttl <= time.time():
+                return None
+            with open(os.path.join(self._blobs, entry["sha256"]), "rb") as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        os.utime(path)  # the entry's mtime is its last use, for LRU eviction
+        return CachedResponse(entry["status"], [tuple(h) for h in entry["headers"]], body)
+
+    def put(self, key, target, response):
+        digest = hashlib.sha256(response.body).hexdigest()
+        blob = os.path.join(self._blobs, digest)
+        if not os.path.exists(blob):
+            _write_atomic(blob, response.body)
+        entry = {
+            "target": target,
+            "status": response.status,
+            "headers": response.headers,
+            "sha256": digest,
+            "size": len(response.body),
+            "stored_at": time.time(),
+        }
+        _write_atomic(self._entry_path(key), json.dumps(entry).encode())
+        self.stats.stored += 1
+
+    def prune(self):
+        """Drop expired entries, then least recently used ones until under ``max_bytes``."""
+        now = time.time()
+        live = []
+        for name in os.listdir(self._entries):
+            path = os.path.join(self._entries, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = json.load(f)
+                used_at = os.path.getmtime(path)
+            except (OSError, ValueError):
+                continue
+            if entry.get("stored_at", 0) + self.ttl <= now:
+                self._remove(path)
+            else:
+                live.append((used_at, path, entry.get("sha256"), entry.get("size", 0)))
+        live.sort()
+        sizes = {digest: size for _, _, digest, size in live}
+        refs = {}
+        for _, _, digest, _ in live:
+            refs[digest] = refs.get(digest, 0) + 1
+        total = sum(sizes.values())
+        while live and total > self.max_bytes:
+            _, path, digest, _ = live.pop(0)
+            self._remove(path)
+            refs[digest] -= 1
+            if not refs[digest]:
+                total -= sizes[digest]
+        for digest in os.listdir(self._blobs):
+            if not refs.get(digest) and not digest.endswith(".tmp"):
+                self._remove(os.path.join(self._blobs, digest), count=False)
+
+    def _remove(self, path, count=True):
+        try:
+            os.remove(path)
+            if count:
+                self.stats.evicted += 1
+        except OSError:
+            pass
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class CachingProxy:
+    """Reverse proxy for ``upstream`` on a random local port, backed by an :class:`HttpCache`.
+
+    ``api_paths`` are ``/api/v2/`` path prefixes whose GET responses may be
+    cached too (reference data such as ``admin/job-titles``).
+    """
+
+    def __init__(self, upstream, cache, mode="replay", api_paths=(), host="127.0.0.1", port=0, timeout=30):
+        if mode not in MODES:
+            raise ValueError(f"HTTP cache mode must be one of {MODES}, not {mode!r}")
+        self.upstream = upstream.rstrip("/")
+        self.cache = cache
+        self.mode = mode
+        self.api_paths = tuple(p.strip("/") for p in api_paths if p.strip("/"))
+        self.timeout = timeout
+        self.http = requests.Session()
+        # The proxy is shared by every browser; cookies must only travel in the forwarded headers.
+        self.http.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        self._httpd = ThreadingHTTPServer((host, port), _ProxyHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.proxy = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self):
+        return self.cache.stats
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.1}, name="http-cache-proxy", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self.http.close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def cacheable(self, method, target):
+        if method != "GET":
+            return False
+        path = urlsplit(target).path
+        if path.startswith(API_PREFIX):
+            return any(path[len(API_PREFIX):].startswith(p) for p in self.api_paths)
+        return bool(STATIC_PATH_RE.search(path))
+
+    def handle(self, method, target, headers, body):
+        if not self.cacheable(method, target):
+            self.stats.passed += 1
+            return self._localize(self._forward(method, target, headers, body))
+        key = self.cache.key(method, target)
+        if self.mode == "replay":
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats.hits += 1
+                self.stats.bytes_served += len(cached.body)
+                return self._localize(cached)
+        self.stats.misses += 1
+        response = self._forward(method, target, headers, body)
+        if response.status == 200 and not any(name.lower() == "set-cookie" for name, _ in response.headers):
+            self.cache.put(key, target, response)
+        return self._localize(response)
+
+    def _forward(self, method, target, headers, body):
+        forwarded = {name: value for name, value in headers.items() if name.lower() not in HOP_BY_HOP}
+        try:
+            upstream = self.http.request(
+                method, self.upstream + target, headers=forwarded, data=body or None,
+                allow_redirects=False, timeout=self.timeout,
+            )
+        except requests.RequestException as exc:
+            return CachedResponse(502, [("Content-Type", "text/plain")], f"Upstream error: {exc}".encode())
+        response_headers = [
+            (name, value) for name, value in upstream.raw.headers.items()
+            if name.lower() not in HOP_BY_HOP
+        ]
+        return CachedResponse(upstream.status_code, response_headers, upstream.content)
+
+    def _localize(self, response):
+        """Point absolute upstream URLs and cookies at the proxy."""
+        headers = []
+        for name, value in response.headers:
+            lower = name.lower()
+            if lower == "location":
+                value = value.replace(self.upstream, self.url)
+            elif lower == "set-cookie":
+                value = _local_cookie(value)
+            headers.append((name, value))
+        body = response.body
+        content_type = next((v for n, v in response.headers if n.lower() == "content-type"), "")
+        if content_type.startswith(TEXT_TYPES) and self.upstream.encode() in body:
+            body = body.replace(self.upstream.encode(), self.url.encode())
+        return CachedResponse(response.status, headers, body)
+
+
+def _local_cookie(value):
+    """Drop Domain/Secure so the cookie sticks to the plain-HTTP proxy host."""
+    parts = [p for p in value.split(";") if p.strip().lower().split("=")[0] not in ("domain", "secure")]
+    return ";".join("SameSite=Lax" if p.strip().lower() == "samesite=none" else p for p in parts)
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        response = self.server.proxy.handle(self.command, self.path, self.headers, body)
+        self.send_response(response.status)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(response.body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = do_PATCH = _serve
+
+    def log_message(self, format, *args):
+        pass
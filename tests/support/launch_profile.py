@@ -0,0 +1,98 @@
+"""Named Chrome launch profiles (``BROWSER_PROFILE=default|fast``).
+
+``default`` is the historical option set. ``fast`` trades fidelity nobody
+asserts on for throughput:
+
+* no background networking, component updates, extensions, sync or first-run
+  UI, and no GPU compositing or smooth scrolling
+* animations off: ``--force-prefers-reduced-motion`` plus the
+  ``support.animations`` script on every document, even where
+  ``DISABLE_ANIMATIONS=0`` leaves the other browsers animated
+* a pre-warmed user-data-dir: the first launch builds a template profile
+  under ``tests/.cache/chrome-profile/<Chrome build>/``. Every browser then
+  starts from a copy-on-write clone of it (``cp --reflink`` on Linux,
+  ``clonefile`` on macOS, a plain copy elsewhere), which skips Chrome's
+  first-run profile creation.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+PROFILES = ("default", "fast")
+TEMPLATE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "chrome-profile")
+
+FAST_ARGUMENTS = (
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-gpu-compositing",
+    "--disable-smooth-scrolling",
+    "--force-prefers-reduced-motion",
+    "--disable-renderer-backgrounding",
+    "--disable-background-timer-throttling",
+)
+
+# Left behind by a Chrome that did not shut down cleanly; a clone carrying them would refuse to start.
+_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+# BrowserPool.warm launches browsers from several threads; one of them builds the template.
+_template_lock = threading.Lock()
+
+
+def launch_profile():
+    profile = os.getenv("BROWSER_PROFILE", "default").lower()
+    if profile not in PROFILES:
+        raise ValueError(f"BROWSER_PROFILE must be one of {PROFILES}, not {profile!r}")
+    return profile
+
+
+def profile_template(key, warm):
+    """The pre-warmed user-data-dir for ``key``; ``warm(path)`` builds it on first use.
+
+    The template is built in a private directory and renamed into place, so
+    concurrent pytest-xdist workers never see a half-built one.
+    """
+    path = os.path.join(TEMPLATE_ROOT, key)
+    with _template_lock:
+        if os.path.isdir(path):
+            return path
+        return _build_template(path, warm)
+
+
+def _build_template(path, warm):
+    build = f"{path}.{os.getpid()}.tmp"
+    shutil.rmtree(build, ignore_errors=True)
+    os.makedirs(build)
+    warm(build)
+    for name in _LOCK_FILES:
+        lock = os.path.join(build, name)
+        if os.path.lexists(lock):
+            os.remove(lock)
+    try:
+        os.rename(build, path)
+    except OSError:  # another worker finished first
+        shutil.rmtree(build, ignore_errors=True)
+    return path
+
+
+def clone_tree(src, dst):
+    """Copy ``src`` to ``dst``, sharing blocks with it where the file system can (reflink / clonefile)."""
+    if sys.platform.startswith("linux"):
+        command = ["cp", "-a", "--reflink=auto", src, dst]
+    elif sys.platform == "darwin":
+        command = ["cp", "-cR", src, dst]
+    else:
+        command = None
+    if command is not None:
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+            return dst
+        except (OSError, subprocess.CalledProcessError):
+            shutil.rmtree(dst, ignore_errors=True)
+    shutil.copytree(src, dst, symlinks=True)
+    return dst
@@ -0,0 +1,75 @@
+"""Assertions on search and list screens, made on the list API's JSON.
+
+A list screen fills its table from one API call, e.g. ``GET pim/employees``
+for the PIM employee list. :func:`assert_listed` checks the records in that
+call's response (``BasePage.wait_for_api``, see ``support.xhr_tracker``) as
+structured data. There is no XPath scan of the rows, and no
+``driver.page_source``, which serializes the whole DOM and runs to megabytes
+on a populated list.
+
+When the response is not available (the request was not seen, or it failed
+or was not JSON), the check falls back to the rendered table. One script
+execution reads every row's cell texts (``BasePage.table_rows``), and that
+query is repeated until a row matches or the page's timeout passes.
+"""
+from selenium.common.exceptions import TimeoutException
+
+
+def records_of(response):
+    """``(records, total)`` from a list API response; ``(None, None)`` when it has no usable payload."""
+    if response is None or not response.ok:
+        return None, None
+    payload = response.json()
+    if not isinstance(payload, dict) or not isinstance(payload.get("data"), list):
+        return None, None
+    return payload["data"], (payload.get("meta") or {}).get("total")
+
+
+def find_record(records, fields):
+    """The first record whose values equal ``fields``; dotted keys reach into nested objects."""
+    for record in records:
+        if all(_value(record, key) == value for key, value in fields.items()):
+            return record
+    return None
+
+
+def _value(record, key):
+    for part in key.split("."):
+        if not isinstance(record, dict):
+            return None
+        record = record.get(part)
+    return record
+
+
+def assert_listed(page, response, fields, cells=None):
+    """Assert that the list shows a record matching ``fields`` (API field names, e.g. ``firstName``).
+
+    Returns the matching API record, or the matching table row (a list of
+    cell texts) when the check had to fall back to the table. There, a row
+    matches when each of ``cells`` (default: the values of ``fields``)
+    occurs in one of its cells.
+    """
+    records, total = records_of(response)
+    if records is not None:
+        record = find_record(records, fields)
+        if record is None:
+            shown = ", ".join(f"{r.get('firstName', '')} {r.get('lastName', '')}".strip() or str(r.get("id")) for r in records[:10])
+            raise AssertionError(
+                f"{response.method} {response.url} returned {len(records)} of {total if total is not None else '?'}"
+                f" records, none matching {fields}" + (f": {shown}" if shown else "")
+            )
+        return record
+
+    cells = [str(value) for value in (cells if cells is not None else fields.values())]
+
+    def matching_row(_driver):
+        for row in page.table_rows():
+            if all(any(text in cell for cell in row) for text in cells):
+                return row
+        return False
+
+    try:
+        return page.wait.until(matching_row)
+    except TimeoutException:
+        rows = page.table_rows()
+        raise AssertionError(f"no list row shows {cells} ({len(rows)} rows: {rows[:5]})") from None
@@ -0,0 +1,201 @@
+"""Browser-side performance metrics per page (``PAGE_METRICS=1``).
+
+The ``page_metrics`` fixture enables the CDP ``Performance`` and ``Network``
+domains on the leased browser and installs a small observer script on every
+new document (long tasks, a larger resource-timing buffer). A snapshot is
+taken after every ``driver.get`` and at the start and end of every
+``with step(...)`` block. Each snapshot holds:
+
+* the navigation timing of the document, the first time it is seen
+  (TTFB, DOMContentLoaded, load, transfer size)
+* ``Performance.getMetrics``: JS heap, DOM nodes, documents, event listeners
+  and layout / style recalculation counts, plus the script and task time
+  spent since the previous snapshot
+* long tasks and XHR/fetch durations since the previous snapshot
+
+Step snapshots are stored with the step in the duration store. All snapshots
+are attached to the test report (``user_properties``, so they land in the
+JUnit XML). They are also aggregated per page (the URL path with ids
+replaced by ``{id}``) into the terminal summary and
+``tests/.cache/page_metrics[-<worker>].json``.
+"""
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from support.durations import percentile
+
+# Installed with Page.addScriptToEvaluateOnNewDocument, so it runs before the page's own scripts.
+OBSERVER_JS = """
+(() => {
+    const t = window.__pageMetrics = {longTasks: [], xhrSeen: 0, reported: false};
+    try { performance.setResourceTimingBufferSize(5000); } catch (e) {}
+    try {
+        new PerformanceObserver(list => { for (const e of list.getEntries()) t.longTasks.push(e.duration); })
+            .observe({type: 'longtask', buffered: true});
+    } catch (e) {}
+})();
+"""
+
+_SNAPSHOT_JS = """
+const t = window.__pageMetrics || (window.__pageMetrics = {longTasks: [], xhrSeen: 0, reported: false});
+const nav = performance.getEntriesByType('navigation')[0];
+const xhr = performance.getEntriesByType('resource')
+    .filter(e => e.initiatorType === 'xmlhttprequest' || e.initiatorType === 'fetch');
+const fresh = xhr.slice(t.xhrSeen);
+t.xhrSeen = xhr.length;
+const firstSeen = !t.reported;
+t.reported = true;
+return {
+    url: location.href,
+    navigation: firstSeen && nav ? {
+        ttfb_ms: nav.responseStart, dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+        load_ms: nav.loadEventEnd, transfer_bytes: nav.transferSize,
+    } : null,
+    long_tasks_ms: t.longTasks.splice(0),
+    xhr: fresh.map(e => [e.name, e.duration]),
+};
+"""
+
+CDP_METRICS = {
+    "JSHeapUsedSize": "heap_used_bytes",
+    "JSHeapTotalSize": "heap_total_bytes",
+    "Nodes": "dom_nodes",
+    "Documents": "documents",
+    "JSEventListeners": "event_listeners",
+    "LayoutCount": "layouts",
+    "RecalcStyleCount": "style_recalcs",
+}
+# Cumulative seconds; snapshots report the milliseconds spent since the previous one.
+CDP_DURATIONS = {"ScriptDuration": "script_ms", "TaskDuration": "task_ms"}
+ID_SEGMENT_RE = re.compile(r"/\d+(?=/|$)")
+
+
+def metrics_enabled():
+    return os.getenv("PAGE_METRICS", "0").lower() in ("1", "true", "yes")
+
+
+def page_key(url):
+    """``/web/index.php/pim/viewPersonalDetails/empNumber/7`` -> ``pim/viewPersonalDetails/empNumber/{id}``."""
+    path = urlsplit(url).path
+    path = path.split("/index.php/", 1)[-1]
+    return ID_SEGMENT_RE.sub("/{id}", path).strip("/") or "/"
+
+
+class MetricsCollector:
+    """Snapshots one browser's metrics; installed once per driver and reused across leases."""
+
+    def __init__(self, driver, aggregate):
+        self.driver = driver
+        self.aggregate = aggregate
+        self.snapshots = None
+        self._origin = time.monotonic()
+        self._durations = {}
+        driver.execute_cdp_cmd("Performance.enable", {"timeDomain": "timeTicks"})
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_JS})
+        execute = driver.execute
+
+        def navigation_execute(driver_command, params=None):
+            response = execute(driver_command, params)
+            if driver_command == "get":
+                self.snapshot("navigate")
+            return response
+
+        driver.execute = navigation_execute
+
+    @classmethod
+    def attach(cls, driver, aggregate):
+        collector = getattr(driver, "_page_metrics", None)
+        if collector is None:
+            collector = driver._page_metrics = cls(driver, aggregate)
+        return collector
+
+    def begin(self):
+        self.snapshots = []
+        self._origin = time.monotonic()
+
+    def end(self):
+        snapshots, self.snapshots = self.snapshots, None
+        return snapshots or []
+
+    def snapshot(self, label):
+        """Take and keep a snapshot while a test is running; None otherwise or when the page is not an http(s) page."""
+        if self.snapshots is None:
+            return None
+        try:
+            page = self.driver.execute_script(_SNAPSHOT_JS)
+            if not page["url"].startswith("http"):
+                return None
+            metrics = {m["name"]: m["value"] for m in self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+        except WebDriverException:
+            return None
+        snapshot = {"label": label, "page": page_key(page["url"]), "offset": round(time.monotonic() - self._origin, 3)}
+        if page["navigation"]:
+            snapshot["navigation"] = {k: round(v, 1) for k, v in page["navigation"].items()}
+        snapshot.update({name: int(metrics[cdp]) for cdp, name in CDP_METRICS.items() if cdp in metrics})
+        for cdp, name in CDP_DURATIONS.items():
+            if cdp in metrics:
+                snapshot[name] = round(max(0.0, metrics[cdp] - self._durations.get(cdp, 0.0)) * 1000, 1)
+                self._durations[cdp] = metrics[cdp]
+        snapshot["long_tasks"] = len(page["long_tasks_ms"])
+        snapshot["long_task_ms"] = round(sum(page["long_tasks_ms"]), 1)
+        snapshot["xhr"] = [[urlsplit(url).path, round(duration, 1)] for url, duration in page["xhr"]]
+        self.snapshots.append(snapshot)
+        self.aggregate.add(snapshot)
+        return snapshot
+
+
+class PageMetricsAggregate:
+    """Session-wide per-page figures built from every snapshot."""
+
+    def __init__(self):
+        self.pages = defaultdict(lambda: defaultdict(list))
+
+    def add(self, snapshot):
+        page = self.pages[snapshot["page"]]
+        navigation = snapshot.get("navigation")
+        if navigation:
+            for name, value in navigation.items():
+                page[name].append(value)
+        for name in ("heap_used_bytes", "dom_nodes", "long_task_ms"):
+            if name in snapshot:
+                page[name].append(snapshot[name])
+        page["xhr_ms"].extend(duration for _, duration in snapshot["xhr"])
+
+    def report(self):
+        return {
+            key: {name: {"count": len(values), "p50": round(percentile(values, 50), 1), "p95": round(percentile(values, 95), 1)}
+                  for name, values in figures.items() if values}
+            for key, figures in sorted(self.pages.items())
+        }
+
+    def summary_lines(self, n=15):
+        report = self.report()
+
+        def p50(figures, name, scale=1.0, unit=""):
+            return f"{figures[name]['p50'] / scale:.0f}{unit}" if name in figures else "-"
+
+        def load(key):
+            return report[key].get("load_ms", {}).get("p50", 0.0)
+
+        lines = [f"{'load':>7} {'DCL':>7} {'heap':>6} {'nodes':>6} {'long':>7} {'xhr':>7} {'#xhr':>5}  page (p50)"]
+        for key in sorted(report, key=load, reverse=True)[:n]:
+            figures = report[key]
+            lines.append(
+                f"{p50(figures, 'load_ms', unit='ms'):>7} {p50(figures, 'dom_content_loaded_ms', unit='ms'):>7}"
+                f" {p50(figures, 'heap_used_bytes', 1024 * 1024, 'MB'):>6} {p50(figures, 'dom_nodes'):>6}"
+                f" {p50(figures, 'long_task_ms', unit='ms'):>7} {p50(figures, 'xhr_ms', unit='ms'):>7}"
+                f" {figures.get('xhr_ms', {}).get('count', 0):>5}  {key}"
+            )
+        return lines
+
+    def dump(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
@@ -0,0 +1,42 @@
+"""Shared reader for Chrome's performance log.
+
+``driver.get_log("performance")`` hands out every entry exactly once, so two
+consumers reading it directly (the request blocker and the HAR recorder)
+would each see only part of the traffic. :class:`PerformanceLog` is the single
+reader per driver: consumers subscribe a callback, and whoever needs
+up-to-date data calls :meth:`PerformanceLog.pump`, which parses the pending
+entries and hands every CDP message (``{"method": ..., "params": ...}``) to
+all subscribers.
+
+The log is only recorded when the browser was launched with
+``goog:loggingPrefs`` (see ``support.browser.chrome_options``).
+"""
+import json
+
+
+class PerformanceLog:
+    def __init__(self, driver):
+        self.driver = driver
+        self.listeners = []
+
+    @classmethod
+    def of(cls, driver):
+        log = getattr(driver, "_performance_log", None)
+        if log is None:
+            log = driver._performance_log = cls(driver)
+        return log
+
+    def subscribe(self, listener):
+        """Add ``listener(message)``; subscribing the same callback again is a no-op."""
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def discard(self):
+        """Drop pending entries without dispatching them (e.g. those left by the previous test)."""
+        self.driver.get_log("performance")
+
+    def pump(self):
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            for listener in self.listeners:
+                listener(message)
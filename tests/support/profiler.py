@@ -0,0 +1,115 @@
+"""Opt-in WebDriver command profiler (``PROFILE_WEBDRIVER=1``).
+
+Every command sent to chromedriver is counted and timed, grouped by command
+name and by the locator it concerns. Find commands are keyed by their
+``using=value`` locator; later commands on the returned elements (click,
+send_keys, get text...) are charged to the locator that found them, so the
+cost of label-relative XPath helpers shows up as a whole. At session end the
+top-N commands and locators are printed and written to
+``tests/.cache/webdriver_profile[-<worker>].json``.
+"""
+import json
+import os
+import time
+from collections import defaultdict
+
+ELEMENT_KEY = "element-6066-11e4-a52f-4f1b5b0ef7a2"
+FIND_COMMANDS = ("findElement", "findElements", "findChildElement", "findChildElements")
+
+
+def profiling_enabled():
+    return os.getenv("PROFILE_WEBDRIVER", "0").lower() in ("1", "true", "yes")
+
+
+class _Stat:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    def as_dict(self):
+        return {"count": self.count, "total": round(self.total, 4), "max": round(self.max, 4)}
+
+
+class CommandProfiler:
+    def __init__(self, max_tracked_elements=50000):
+        self.by_command = defaultdict(_Stat)
+        self.by_locator = defaultdict(_Stat)
+        self.max_tracked_elements = max_tracked_elements
+        self._element_locators = {}
+
+    def attach(self, driver):
+        """Wrap ``driver.execute``; attaching the same driver twice is a no-op."""
+        if getattr(driver, "_command_profiler", None) is self:
+            return
+        execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                response = execute(driver_command, params)
+            finally:
+                elapsed = time.perf_counter() - start
+                locator = self._locator_for(driver_command, params)
+                self.by_command[driver_command].add(elapsed)
+                if locator:
+                    self.by_locator[locator].add(elapsed)
+            if driver_command in FIND_COMMANDS and locator:
+                self._remember_elements(response, locator)
+            return response
+
+        driver.execute = profiled_execute
+        driver._command_profiler = self
+
+    def _locator_for(self, command, params):
+        if not params:
+            return None
+        if command in FIND_COMMANDS:
+            return f"{params.get('using')}={params.get('value')}"
+        if command in ("executeScript", "executeAsyncScript", "w3cExecuteScript", "w3cExecuteScriptAsync"):
+            script = " ".join(str(params.get("script", "")).split())
+            return f"script={script[:80]}"
+        element_id = params.get("id")
+        if element_id is not None:
+            return self._element_locators.get(element_id, "element=<unknown>")
+        return None
+
+    def _remember_elements(self, response, locator):
+        if len(self._element_locators) >= self.max_tracked_elements:
+            self._element_locators.clear()
+        value = (response or {}).get("value")
+        elements = value if isinstance(value, list) else [value]
+        for element in elements:
+            if isinstance(element, dict) and ELEMENT_KEY in element:
+                self._element_locators[element[ELEMENT_KEY]] = locator
+
+    def top(self, table, n):
+        return sorted(table.items(), key=lambda kv: -kv[1].total)[:n]
+
+    def summary_lines(self, n=15):
+        total = sum(s.total for s in self.by_command.values())
+        count = sum(s.count for s in self.by_command.values())
+        lines = [f"{count} commands, {total:.2f}s in WebDriver round-trips"]
+        lines.append(f"top {n} commands by total time:")
+        for name, stat in self.top(self.by_command, n):
+            lines.append(f"  {stat.total:8.2f}s {stat.count:6d}x  max {stat.max:6.2f}s  {name}")
+        lines.append(f"top {n} locators by total time:")
+        for name, stat in self.top(self.by_locator, n):
+            lines.append(f"  {stat.total:8.2f}s {stat.count:6d}x  max {stat.max:6.2f}s  {name}")
+        return lines
+
+    def dump(self, path, n=50):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {
+            "commands": {k: v.as_dict() for k, v in self.top(self.by_command, n)},
+            "locators": {k: v.as_dict() for k, v in self.top(self.by_locator, n)},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
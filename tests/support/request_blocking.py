@@ -0,0 +1,186 @@
+"""Blocks third-party and non-essential requests in the test browsers.
+
+Analytics, web fonts and decorative images slow every page load and the
+waits behind it, yet no test asserts on them. The ``driver`` fixture hands
+the policy's deny patterns to CDP ``Network.setBlockedURLs`` (``*`` is the
+only wildcard) before each test:
+
+* ``REQUEST_BLOCKING=0`` turns blocking off (default on)
+* ``REQUEST_BLOCKING_DENY`` / ``REQUEST_BLOCKING_ALLOW`` add comma-separated
+  patterns; an allow pattern drops every deny pattern it covers
+* ``@pytest.mark.network(allow=[...], deny=[...], blocking=False)`` adjusts
+  the policy for one test
+
+Deny patterns that would match an upload, a download or an API call
+(``ESSENTIAL_URLS``) are never sent to the browser. Blocked requests are
+counted from Chrome's performance log; their size is taken from
+``tests/.cache/request_sizes.json``, which remembers the transfer size of
+every URL the browsers did load (e.g. in a run with blocking off).
+
+The counts go to the terminal summary and, with pytest-html, to the report:
+per test next to its result, and for the session in the report summary.
+"""
+import html
+import json
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from urllib.parse import urlsplit
+
+from support.perf_log import PerformanceLog
+
+DEFAULT_DENY = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*facebook.net*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+    "*gravatar.com*",
+    "*/web/images/*",
+)
+ESSENTIAL_URLS = (
+    "http://host/web/index.php/auth/login",
+    "http://host/web/index.php/api/v2/pim/employees",
+    "http://host/web/index.php/pim/viewAttachment/empNumber/1/attachId/1",
+    "http://host/web/index.php/pim/viewPhoto/empNumber/1",
+    "http://host/web/index.php/buzz/photo/1",
+    "http://host/web/dist/js/app.js",
+    "http://host/web/dist/css/app.css",
+)
+
+
+def blocking_enabled():
+    return os.getenv("REQUEST_BLOCKING", "1").lower() in ("1", "true", "yes")
+
+
+def _env_patterns(name):
+    return tuple(p.strip() for p in os.getenv(name, "").split(",") if p.strip())
+
+
+@dataclass(frozen=True)
+class BlockingPolicy:
+    deny: tuple = DEFAULT_DENY
+    allow: tuple = ()
+    enabled: bool = True
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            deny=DEFAULT_DENY + _env_patterns("REQUEST_BLOCKING_DENY"),
+            allow=_env_patterns("REQUEST_BLOCKING_ALLOW"),
+        )
+
+    def override(self, allow=(), deny=(), blocking=True):
+        """The policy for a test carrying ``@pytest.mark.network(...)``."""
+        return BlockingPolicy(self.deny + tuple(deny), self.allow + tuple(allow), self.enabled and blocking)
+
+    def patterns(self):
+        """Deny patterns to hand to ``Network.setBlockedURLs``."""
+        if not self.enabled:
+            return []
+        return [
+            pattern for pattern in dict.fromkeys(self.deny)
+            if not any(fnmatchcase(pattern, allowed) for allowed in self.allow)
+            and not any(fnmatchcase(url, pattern) for url in ESSENTIAL_URLS)
+        ]
+
+
+@dataclass
+class BlockingStats:
+    blocked: Counter = field(default_factory=Counter)
+    blocked_bytes: int = 0
+    unknown_size: int = 0
+    loaded: int = 0
+    loaded_bytes: int = 0
+
+    def summary_lines(self, top=5):
+        total = sum(self.blocked.values())
+        lines = [
+            f"blocked: {total} requests, ~{self.blocked_bytes / 1024:.0f} KiB saved"
+            + (f" ({self.unknown_size} of unknown size)" if self.unknown_size else ""),
+            f"loaded: {self.loaded} requests, {self.loaded_bytes / 1024:.0f} KiB",
+        ]
+        lines.extend(f"  {host}: {count}" for host, count in self.blocked.most_common(top))
+        return lines
+
+    def render_html(self, title="Request blocking", top=5):
+        """The counters as a small HTML table for the pytest-html report."""
+        rows = [
+            ("blocked", f"{sum(self.blocked.values())} requests, ~{self.blocked_bytes / 1024:.0f} KiB saved"
+             + (f" ({self.unknown_size} of unknown size)" if self.unknown_size else "")),
+            ("loaded", f"{self.loaded} requests, {self.loaded_bytes / 1024:.0f} KiB"),
+        ]
+        rows += [(host, f"{count} blocked") for host, count in self.blocked.most_common(top)]
+        return (
+            f"<div><strong>{html.escape(title)}</strong><table>"
+            + "".join(f"<tr><td>{html.escape(name)}</td><td>{html.escape(value)}</td></tr>" for name, value in rows)
+            + "</table></div>"
+        )
+
+
+class RequestBlocker:
+    """Applies a :class:`BlockingPolicy` to browsers and tallies what it blocked."""
+
+    def __init__(self, policy, sizes_path):
+        self.policy = policy
+        self.sizes_path = sizes_path
+        self.stats = BlockingStats()
+        self.test_stats = BlockingStats()
+        self._urls = {}
+        try:
+            with open(sizes_path, encoding="utf-8") as f:
+                self.sizes = json.load(f)
+        except (OSError, ValueError):
+            self.sizes = {}
+
+    def apply(self, driver, marker=None):
+        """Install the (possibly marker-adjusted) policy and drop performance log entries left by the last test."""
+        policy = self.policy.override(*marker.args, **marker.kwargs) if marker is not None else self.policy
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": policy.patterns()})
+        log = PerformanceLog.of(driver)
+        log.discard()
+        log.subscribe(self._on_message)
+        self._urls = {}
+        self.test_stats = BlockingStats()
+
+    def collect(self, driver):
+        """Count blocked and loaded requests from the performance log; returns the current test's counts."""
+        PerformanceLog.of(driver).pump()
+        return self.test_stats
+
+    def _on_message(self, message):
+        method, params = message.get("method"), message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            self._urls[params["requestId"]] = _size_key(params["request"]["url"])
+        elif method == "Network.loadingFinished" and params["requestId"] in self._urls:
+            url = self._urls.pop(params["requestId"])
+            size = int(params.get("encodedDataLength", 0))
+            self.sizes[url] = size
+            for stats in (self.stats, self.test_stats):
+                stats.loaded += 1
+                stats.loaded_bytes += size
+        elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+            url = self._urls.pop(params["requestId"], "")
+            for stats in (self.stats, self.test_stats):
+                stats.blocked[urlsplit(url).netloc or "?"] += 1
+                if url in self.sizes:
+                    stats.blocked_bytes += self.sizes[url]
+                else:
+                    stats.unknown_size += 1
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.sizes_path), exist_ok=True)
+        tmp_path = f"{self.sizes_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.sizes, f)
+        os.replace(tmp_path, self.sizes_path)
+
+
+def _size_key(url):
+    """Sizes are remembered per URL without the query string (cache busters)."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
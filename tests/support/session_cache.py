@@ -0,0 +1,142 @@
+"""On-disk cache of authenticated OrangeHRM session cookies.
+
+Logging in through the UI costs several seconds per test. The first test logs
+in once, the resulting cookies are written to ``tests/.cache/session.json``
+with an expiry, and later browsers get the cookies injected before they open
+the Dashboard. The UI login only runs again when the server rejects the
+cached session (the Dashboard request is redirected to the login page).
+
+Entries are keyed on the origin server, not on the URL the browsers use:
+behind the HTTP cache proxy (``HTTP_CACHE``) that URL gets a new port every
+session, while the session cookies belong to the server behind it.
+"""
+import json
+import os
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+LOGIN_PATH = "/web/index.php/auth/login"
+DASHBOARD_PATH = "/web/index.php/dashboard/index"
+DASHBOARD_HEADER = (By.XPATH, "//span/h6[text()='Dashboard']")
+USERNAME_INPUT = (By.NAME, "username")
+
+
+class SessionCache:
+    def __init__(self, path, ttl=1200, origin=None):
+        self.path = path
+        self.ttl = ttl
+        self.origin = origin
+        self.reused = 0
+        self.logins = 0
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _key(self, base_url, username):
+        return f"{self.origin or base_url}|{username}"
+
+    def load(self, base_url, username):
+        entry = self._read().get(self._key(base_url, username))
+        if not entry or entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry["cookies"]
+
+    def save(self, base_url, username, cookies):
+        now = time.time()
+        data = {key: entry for key, entry in self._read().items() if entry.get("expires_at", 0) > now}
+        data[self._key(base_url, username)] = {
+            "cookies": cookies,
+            "expires_at": now + self.ttl,
+        }
+        self._write(data)
+
+    def invalidate(self, base_url, username):
+        data = self._read()
+        if data.pop(self._key(base_url, username), None) is not None:
+            self._write(data)
+
+
+def ui_login(driver, base_url, credentials, timeout=20):
+    """Log in through the login form and wait for the Dashboard."""
+    wait = WebDriverWait(driver, timeout)
+    driver.get(base_url + LOGIN_PATH)
+    username_input = wait.until(EC.presence_of_element_located(USERNAME_INPUT))
+    password_input = driver.find_element(By.NAME, "password")
+    username_input.clear(); username_input.send_keys(credentials["username"])
+    password_input.clear(); password_input.send_keys(credentials["password"])
+    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+    wait.until(EC.presence_of_element_located(DASHBOARD_HEADER))
+
+
+def inject_cookies(driver, base_url, cookies):
+    """Install cached cookies without loading a page first when CDP is available."""
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [
+            {**_cdp_cookie(cookie), "url": base_url} for cookie in cookies
+        ]})
+    except Exception:
+        driver.get(base_url + LOGIN_PATH)
+        for cookie in cookies:
+            driver.add_cookie({k: v for k, v in cookie.items() if k != "sameSite"})
+
+
+def _cdp_cookie(cookie):
+    converted = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if cookie.get("expiry"):
+        converted["expires"] = cookie["expiry"]
+    return converted
+
+
+def open_dashboard(driver, base_url, timeout=20):
+    """Open the Dashboard; return False when the server sends us to the login page."""
+    driver.get(base_url + DASHBOARD_PATH)
+    found = WebDriverWait(driver, timeout).until(
+        EC.any_of(
+            EC.presence_of_element_located(DASHBOARD_HEADER),
+            EC.presence_of_element_located(USERNAME_INPUT),
+        )
+    )
+    return found.tag_name != "input"
+
+
+def login_with_cache(driver, base_url, credentials, cache, timeout=20):
+    """Reuse the cached session if the server accepts it, otherwise log in again.
+
+    Returns True when the cached session was reused.
+    """
+    username = credentials["username"]
+    cookies = cache.load(base_url, username)
+    if cookies:
+        inject_cookies(driver, base_url, cookies)
+        try:
+            if open_dashboard(driver, base_url, timeout):
+                cache.reused += 1
+                return True
+        except TimeoutException:
+            pass
+        cache.invalidate(base_url, username)
+    ui_login(driver, base_url, credentials, timeout)
+    cache.logins += 1
+    cache.save(base_url, username, driver.get_cookies())
+    return False
@@ -0,0 +1,57 @@
+"""Pytest plugin reporting fixed ``time.sleep`` calls made by test modules.
+
+Tests should wait on a condition from ``support.waits`` instead of sleeping.
+While a test runs, ``time.sleep`` is replaced by a wrapper that records every
+call made directly from a ``test_*.py`` file (library code such as
+``WebDriverWait`` polling is not affected). Offenders are listed in the
+terminal summary; with ``FORBID_SLEEP=1`` the offending test fails instead.
+"""
+import os
+import sys
+import time
+from collections import defaultdict
+
+import pytest
+
+sleeps_key = pytest.StashKey[dict]()
+
+
+def _forbidden():
+    return os.getenv("FORBID_SLEEP", "0").lower() in ("1", "true", "yes")
+
+
+def pytest_configure(config):
+    config.stash[sleeps_key] = defaultdict(list)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    real_sleep = time.sleep
+    offenders = item.config.stash[sleeps_key]
+
+    def guarded_sleep(seconds):
+        caller = sys._getframe(1)
+        filename = os.path.basename(caller.f_code.co_filename)
+        if filename.startswith("test_") and filename.endswith(".py"):
+            offenders[item.nodeid].append((f"{filename}:{caller.f_lineno}", seconds))
+            if _forbidden():
+                pytest.fail(f"time.sleep({seconds}) at {filename}:{caller.f_lineno}; use a condition from support.waits")
+        return real_sleep(seconds)
+
+    time.sleep = guarded_sleep
+    try:
+        yield
+    finally:
+        time.sleep = real_sleep
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    offenders = config.stash.get(sleeps_key, None)
+    if not offenders:
+        return
+    terminalreporter.section("fixed sleeps in tests")
+    for nodeid, calls in offenders.items():
+        total = sum(seconds for _, seconds in calls)
+        terminalreporter.write_line(f"{nodeid}: {len(calls)} sleeps, {total:.1f}s")
+        for where, seconds in calls:
+            terminalreporter.write_line(f"  {where}: {seconds}s")
@@ -0,0 +1,161 @@
+"""Step-level timing for the UI tests.
+
+Tests wrap each logical step in ``with step("Filling employee details"):``.
+Every step records its monotonic start/end, the number of WebDriver commands
+sent while it ran and its outcome. The records go to the duration store and
+are rendered as a flame-style breakdown in the pytest-html report. With
+``PAGE_METRICS=1`` the browser's metrics are snapshotted at both ends of the
+step and the closing snapshot is stored with it (see ``support.page_metrics``).
+With ``HAR_CAPTURE=1`` slow or failed steps also get a HAR file of their
+network requests (see ``support.har``).
+"""
+import html
+import time
+
+import pytest
+
+from support.duration_plugin import record_step, steps_key
+
+try:
+    import pytest_html
+except ImportError:  # pytest-html is optional for plain console runs
+    pytest_html = None
+
+
+class CommandCounter:
+    """Counts WebDriver commands by wrapping ``driver.execute``.
+
+    WebElement commands are routed through their parent driver's ``execute``,
+    so element clicks and ``send_keys`` are counted as well.
+    """
+
+    def __init__(self, driver):
+        self.count = 0
+        self._execute = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.count += 1
+            return self._execute(driver_command, params)
+
+        driver.execute = counting_execute
+
+
+def command_counter(driver):
+    """Return the driver's counter, installing it on first use."""
+    counter = getattr(driver, "_command_counter", None)
+    if counter is None:
+        counter = CommandCounter(driver)
+        driver._command_counter = counter
+    return counter
+
+
+class StepRecorder:
+    """Factory for the ``step`` context managers of one test."""
+
+    def __init__(self, item, driver):
+        self.item = item
+        self.driver = driver
+        self.counter = command_counter(driver)
+        self.number = 0
+        self.origin = time.monotonic()
+
+    def __call__(self, name):
+        self.number += 1
+        return _Step(self, self.number, name)
+
+
+class _Step:
+    def __init__(self, recorder, number, name):
+        self.recorder = recorder
+        self.number = number
+        self.name = name
+
+    def __enter__(self):
+        print(f"Step {self.number}: {self.name}...")
+        metrics = getattr(self.recorder.driver, "_page_metrics", None)
+        if metrics is not None:
+            metrics.snapshot(f"start: {self.name}")
+        har = getattr(self.recorder.driver, "_har_recorder", None)
+        if har is not None:
+            har.step_started()
+        self.start = time.monotonic()
+        self.commands_at_start = self.recorder.counter.count
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.monotonic()
+        duration = end - self.start
+        commands = self.recorder.counter.count - self.commands_at_start
+        if exc_type is None:
+            outcome = "passed"
+        elif issubclass(exc_type, pytest.skip.Exception):
+            outcome = "skipped"
+        else:
+            outcome = "failed"
+        mark = {"passed": "✓", "skipped": "-", "failed": "✗"}[outcome]
+        print(f"{mark} {self.name} ({duration:.2f}s, {commands} commands)")
+        extra = {}
+        metrics = getattr(self.recorder.driver, "_page_metrics", None)
+        snapshot = metrics.snapshot(f"end: {self.name}") if metrics is not None else None
+        if snapshot is not None:
+            extra["metrics"] = snapshot
+        har = getattr(self.recorder.driver, "_har_recorder", None)
+        har_path = har.step_finished(self.number, self.name, duration, outcome == "failed") if har is not None else None
+        if har_path is not None:
+            print(f"  Network waterfall: {har_path}")
+            extra["har"] = har_path
+        record_step(
+            self.recorder.item, self.name, duration, outcome,
+            offset=self.start - self.recorder.origin, commands=commands, **extra,
+        )
+        return False
+
+
+def render_breakdown(steps):
+    """HTML flame-style bar chart plus table for a test's steps."""
+    if not steps:
+        return ""
+    span = max(s["offset"] + s["duration"] for s in steps) or 1.0
+    colors = {"passed": "#66bb6a", "failed": "#ef5350", "skipped": "#bdbdbd"}
+    bars = []
+    rows = []
+    for s in steps:
+        left = 100.0 * s["offset"] / span
+        width = max(100.0 * s["duration"] / span, 0.3)
+        name = html.escape(s["name"])
+        bars.append(
+            f"<div title='{name}: {s['duration']:.2f}s' style='position:absolute;left:{left:.2f}%;"
+            f"width:{width:.2f}%;height:100%;background:{colors[s['outcome']]};border-right:1px solid #fff;"
+            f"overflow:hidden;white-space:nowrap;font-size:11px'>{name}</div>"
+        )
+        rows.append(
+            f"<tr><td>{name}</td><td>{s['duration']:.2f}s</td><td>{100.0 * s['duration'] / span:.0f}%</td>"
+            f"<td>{s['commands']}</td><td>{s['outcome']}</td></tr>"
+        )
+    return (
+        "<div><strong>Step breakdown</strong>"
+        "<div style='position:relative;height:20px;background:#eee;margin:4px 0'>"
+        + "".join(bars)
+        + "</div><table><tr><th>Step</th><th>Duration</th><th>Share</th><th>Commands</th><th>Outcome</th></tr>"
+        + "".join(rows)
+        + "</table></div>"
+    )
+
+
+@pytest.fixture
+def step(request, driver):
+    """Context-manager factory timing the steps of the current test."""
+    return StepRecorder(request.node, driver)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call" or pytest_html is None:
+        return
+    steps = [s for s in item.stash.get(steps_key, []) if "offset" in s]
+    if steps:
+        extras = getattr(report, "extras", [])
+        extras.append(pytest_html.extras.html(render_breakdown(steps)))
+        report.extras = extras
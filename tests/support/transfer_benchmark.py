@@ -0,0 +1,127 @@
+"""Phase timings for the file upload/download benchmark (``BENCHMARK=1``).
+
+``test_file_transfer_benchmark.py`` pushes generated files through each
+OrangeHRM file path and times every phase of every transfer::
+
+    with benchmark.transfer("attachment", "upload", asset.size, count) as timer:
+        with timer.phase("send_keys"):
+            ...
+
+At the end of the module the samples are grouped by (scenario, direction,
+size, count) and appended to ``tests/.cache/transfer_benchmark.jsonl``, one
+JSON line per group with per-phase percentiles and MB/s. Lines from the same
+run share the duration store's run id, so the file can be charted over time
+like ``durations.jsonl``.
+"""
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from support.durations import percentile
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "transfer_benchmark.jsonl")
+PERCENTILES = (50, 90, 95)
+
+
+def benchmark_enabled():
+    return os.getenv("BENCHMARK", "0").lower() in ("1", "true", "yes")
+
+
+def benchmark_counts():
+    """File counts to parametrise over, from BENCHMARK_FILE_COUNTS (default 1)."""
+    return [int(n) for n in os.getenv("BENCHMARK_FILE_COUNTS", "1").split(",") if n.strip()]
+
+
+@dataclass
+class TransferSample:
+    scenario: str
+    direction: str
+    size: int
+    count: int
+    phases: dict = field(default_factory=dict)
+
+    @property
+    def total(self):
+        return sum(self.phases.values())
+
+    @property
+    def mb_per_s(self):
+        return self.size / (1024 * 1024) / self.total if self.total else None
+
+
+class PhaseTimer:
+    def __init__(self, sample):
+        self.sample = sample
+
+    @contextmanager
+    def phase(self, name):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.sample.phases[name] = self.sample.phases.get(name, 0.0) + time.monotonic() - start
+
+    def record(self, name, seconds):
+        """A phase timed elsewhere (e.g. a download's CDP start/finish timestamps)."""
+        self.sample.phases[name] = self.sample.phases.get(name, 0.0) + seconds
+
+
+class TransferBenchmark:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.samples = []
+
+    @contextmanager
+    def transfer(self, scenario, direction, size, count=1):
+        """Time one file's transfer; the sample is kept only if the block completes."""
+        sample = TransferSample(scenario, direction, size, count)
+        yield PhaseTimer(sample)
+        self.samples.append(sample)
+
+    def report(self):
+        groups = defaultdict(list)
+        for sample in self.samples:
+            groups[(sample.scenario, sample.direction, sample.size, sample.count)].append(sample)
+        rows = []
+        for (scenario, direction, size, count), samples in sorted(groups.items()):
+            phase_names = list(dict.fromkeys(name for s in samples for name in s.phases))
+            rates = [s.mb_per_s for s in samples if s.mb_per_s]
+            rows.append({
+                "scenario": scenario,
+                "direction": direction,
+                "size": size,
+                "count": count,
+                "samples": len(samples),
+                "total_bytes": size * len(samples),
+                "mb_per_s": _summary(rates) if rates else None,
+                "phases": {name: _summary([s.phases[name] for s in samples if name in s.phases]) for name in phase_names},
+                "total": _summary([s.total for s in samples]),
+            })
+        return rows
+
+    def summary_lines(self):
+        lines = []
+        for row in self.report():
+            rate = f"{row['mb_per_s']['p50']:7.2f} MB/s" if row["mb_per_s"] else "      n/a"
+            phases = ", ".join(f"{name} {stats['p50']:.2f}s" for name, stats in row["phases"].items())
+            lines.append(f"{row['scenario']:>10} {row['direction']:<8} {row['size']:>9}B x{row['count']:<3} {rate}  p50: {phases}")
+        return lines
+
+    def append(self, run_id):
+        rows = self.report()
+        if not rows:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        now = time.time()
+        payload = "".join(json.dumps({"run": run_id, "ts": now, **row}, sort_keys=True) + "\n" for row in rows)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(payload)
+
+
+def _summary(values):
+    stats = {f"p{q}": round(percentile(values, q), 4) for q in PERCENTILES}
+    stats.update(min=round(min(values), 4), max=round(max(values), 4))
+    return stats
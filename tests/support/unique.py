@@ -0,0 +1,69 @@
+"""Collision-free identifiers for test data, safe under pytest-xdist.
+
+Timestamps collide as soon as two workers (or two ``run_all_tests.py``
+processes) create records in the same second. An id is built from three
+base-36 parts instead, nine characters in total:
+
+* worker - the pytest-xdist worker number (``gw3`` -> ``3``, modulo 36), or
+  a random character outside xdist
+* run - five random characters (``secrets``) drawn once per process
+* counter - increments with every id handed out by this process
+
+Ids never repeat within a process. Two processes only collide when they
+draw the same worker and run parts: 1 in 36^5 (about 60 million) for two
+xdist workers with the same number, whether in concurrent runs or earlier
+ones against the same server, and 1 in 36^6 (about 2 billion) for two
+processes outside xdist.
+
+OrangeHRM limits employee ids to 10 characters, which leaves room for a
+one-character prefix.
+"""
+import itertools
+import os
+import re
+import secrets
+import threading
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_counter = itertools.count()
+_lock = threading.Lock()
+
+
+def _base36(number, width):
+    chars = []
+    for _ in range(width):
+        number, digit = divmod(number, 36)
+        chars.append(DIGITS[digit])
+    return "".join(reversed(chars))
+
+
+def worker_index():
+    """pytest-xdist worker number, or None when not running under xdist."""
+    match = re.fullmatch(r"gw(\d+)", os.getenv("PYTEST_XDIST_WORKER", ""))
+    return int(match.group(1)) if match else None
+
+
+def worker_name():
+    """Name of this pytest process for per-process paths, or None for a lone process.
+
+    ``run_all_tests.py`` sets TEST_WORKER_ID for each module process it starts;
+    pytest-xdist sets PYTEST_XDIST_WORKER. Both are combined when both are set.
+    """
+    names = [name for name in (os.getenv("TEST_WORKER_ID"), os.getenv("PYTEST_XDIST_WORKER")) if name]
+    return "-".join(names) or None
+
+
+def _worker_char():
+    index = worker_index()
+    return DIGITS[index % 36] if index is not None else _RANDOM_WORKER
+
+
+_RANDOM_WORKER = secrets.choice(DIGITS)
+_RUN = _base36(secrets.randbelow(36 ** 5), 5)
+
+
+def unique_id(prefix=""):
+    """``prefix`` followed by a nine-character id; unique within the process, and across processes as described above."""
+    with _lock:
+        n = next(_counter)
+    return f"{prefix}{_worker_char()}{_RUN}{_base36(n, 3)}"
@@ -0,0 +1,66 @@
+"""Pytest plugin reporting time spent waiting on elements that never appeared.
+
+Two sources are counted: :func:`support.waits.probe` misses and every
+``WebDriverWait.until`` that ends in ``TimeoutException`` (including the
+ones a test catches and ignores). The totals per test and the most expensive
+locators are listed in the terminal summary.
+"""
+import time
+from collections import defaultdict
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+from support.waits import describe, ledger
+
+wasted_key = pytest.StashKey[dict]()
+
+
+def pytest_configure(config):
+    config.stash[wasted_key] = defaultdict(list)
+    original_until = WebDriverWait.until
+
+    def until(self, method, message=""):
+        start = time.monotonic()
+        try:
+            return original_until(self, method, message)
+        except TimeoutException:
+            ledger.record("timeout", describe(method), time.monotonic() - start)
+            raise
+
+    until.__wrapped__ = original_until
+    WebDriverWait.until = until
+
+
+def pytest_unconfigure(config):
+    original = getattr(WebDriverWait.until, "__wrapped__", None)
+    if original is not None:
+        WebDriverWait.until = original
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    ledger.drain()
+    yield
+    misses = ledger.drain()
+    if misses:
+        item.config.stash[wasted_key][item.nodeid].extend(misses)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    wasted = config.stash.get(wasted_key, None)
+    if not wasted:
+        return
+    terminalreporter.section("waiting on absent elements")
+    by_label = defaultdict(float)
+    grand_total = 0.0
+    for nodeid, misses in wasted.items():
+        total = sum(seconds for _, _, seconds in misses)
+        grand_total += total
+        terminalreporter.write_line(f"{nodeid}: {total:.2f}s over {len(misses)} misses")
+        for kind, label, seconds in misses:
+            by_label[f"[{kind}] {label}"] += seconds
+    terminalreporter.write_line(f"total: {grand_total:.2f}s; most expensive:")
+    for label, seconds in sorted(by_label.items(), key=lambda kv: -kv[1])[:10]:
+        terminalreporter.write_line(f"  {seconds:7.2f}s  {label}")
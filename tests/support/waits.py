@@ -0,0 +1,169 @@
+"""Named wait conditions for OrangeHRM's OXD components.
+
+The conditions follow the ``expected_conditions`` protocol, so they are used
+with the usual ``WebDriverWait(driver, timeout).until(...)``. They replace
+fixed ``time.sleep`` calls: each one states what the test is actually
+waiting for (a listbox opening, a toast, the form loader going away, an API
+call completing or the DOM settling).
+
+Implicit waits are off, so a plain ``find_element`` fails immediately when
+the element is absent. Optional elements are looked up with :func:`probe`,
+which returns ``None`` instead of raising and records how long the miss cost
+in :data:`ledger`.
+"""
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support.xhr_tracker import WAIT_JS, ApiResponse, endpoint_pattern
+
+LISTBOX_OPTION = (By.CSS_SELECTOR, "div[role='listbox'] div[role='option']")
+TOAST = (By.CSS_SELECTOR, ".oxd-toast-content")
+FORM_LOADER = (By.CSS_SELECTOR, ".oxd-form-loader")
+DROPDOWN_MENU = (By.CSS_SELECTOR, ".oxd-dropdown-menu")
+
+# Poll interval for WebDriverWait; the selenium default (0.5s) makes every
+# condition that is not already true cost half a second.
+POLL = 0.1
+
+
+class WaitLedger:
+    """Time spent waiting for elements that never appeared."""
+
+    def __init__(self):
+        self.misses = []
+
+    def record(self, kind, label, seconds):
+        self.misses.append((kind, label, seconds))
+
+    def drain(self):
+        misses, self.misses = self.misses, []
+        return misses
+
+
+ledger = WaitLedger()
+
+# Installs its observer once per document and then resolves as soon as the
+# DOM has been quiet for ``quiet`` ms (true) or ``cap`` ms have passed
+# (false), so a wait costs one round-trip instead of a polling loop.
+_DOM_QUIET_JS = """
+const quiet = arguments[0], cap = arguments[1], done = arguments[arguments.length - 1];
+if (!window.__domQuiet) {
+    const q = window.__domQuiet = {last: performance.now()};
+    new MutationObserver(() => { q.last = performance.now(); }).observe(
+        document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+const q = window.__domQuiet, start = performance.now();
+(function check() {
+    if (performance.now() - q.last >= quiet) return done(true);
+    if (performance.now() - start >= cap) return done(false);
+    setTimeout(check, 25);
+})();
+"""
+
+
+def listbox_open():
+    """An OXD select/autocomplete listbox is open and has a clickable option; returns the options."""
+    def _condition(driver):
+        options = driver.find_elements(*LISTBOX_OPTION)
+        try:
+            if options and options[0].is_displayed() and options[0].is_enabled():
+                return options
+        except StaleElementReferenceException:
+            pass
+        return False
+    return _condition
+
+
+def toast_shown():
+    return EC.visibility_of_element_located(TOAST)
+
+
+def form_loader_gone():
+    return EC.invisibility_of_element_located(FORM_LOADER)
+
+
+def dropdown_menu_open():
+    """The '...' context menu of a Buzz post/comment is visible."""
+    return EC.visibility_of_element_located(DROPDOWN_MENU)
+
+
+def api_response(path, method=None, since=None, cap_ms=5000, deadline=None):
+    """A request to the API ``path`` completed; returns its :class:`support.xhr_tracker.ApiResponse`.
+
+    Needs the XHR tracker (``support.xhr_tracker``) in the page. ``since`` is
+    a mark from ``XhrTracker.mark`` taken before the action, so that an
+    earlier call to the same endpoint does not satisfy the wait. Each check
+    blocks in the page for up to ``cap_ms``, cut short at ``deadline`` (a
+    ``time.monotonic()`` value) so it never outlasts the surrounding wait.
+    """
+    pattern = endpoint_pattern(path)
+
+    def _condition(driver):
+        cap = cap_ms if deadline is None else min(cap_ms, max(0, int((deadline - time.monotonic()) * 1000)))
+        try:
+            entry = driver.execute_async_script(WAIT_JS, pattern, method, since, cap)
+        except WebDriverException:
+            return False
+        return ApiResponse.from_entry(entry) if entry else False
+    _condition.__qualname__ = f"api_response {method or '*'} {path}"
+    return _condition
+
+
+def dom_quiet(quiet_ms=250, cap_ms=5000):
+    """No DOM mutation for ``quiet_ms`` milliseconds (animations finished, lists re-rendered)."""
+    def _condition(driver):
+        try:
+            return driver.execute_async_script(_DOM_QUIET_JS, quiet_ms, cap_ms)
+        except WebDriverException:
+            return False
+    return _condition
+
+
+def element_count(locator, expected, root=None):
+    """Exactly ``expected`` elements match ``locator`` (optionally inside ``root``)."""
+    def _condition(driver):
+        try:
+            return len((root or driver).find_elements(*locator)) == expected
+        except StaleElementReferenceException:
+            return False
+    return _condition
+
+
+def probe(root, by, value, timeout=0.0):
+    """Return the element matching ``(by, value)`` under ``root``, or None.
+
+    ``root`` is a driver or an element. With the default ``timeout`` of 0 the
+    lookup costs a single round-trip; pass a small timeout for elements that
+    appear shortly after an action.
+    """
+    start = time.monotonic()
+    try:
+        if timeout:
+            return WebDriverWait(root, timeout, poll_frequency=POLL).until(
+                EC.presence_of_element_located((by, value))
+            )
+        return root.find_element(by, value)
+    except (NoSuchElementException, TimeoutException):
+        ledger.record("probe", f"{by}={value}", time.monotonic() - start)
+        return None
+
+
+def describe(condition):
+    """Best-effort label for a wait condition (its locator when it has one)."""
+    for cell in getattr(condition, "__closure__", None) or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(contents, tuple) and len(contents) == 2 and isinstance(contents[0], str):
+            return f"{contents[0]}={contents[1]}"
+    return getattr(condition, "__qualname__", repr(condition)).split(".<locals>")[0]
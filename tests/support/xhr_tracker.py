@@ -0,0 +1,162 @@
+"""In-page log of XHR/fetch requests, for waiting on the API call itself.
+
+A toast or a table row only shows that the request behind it finished.
+Waiting for them costs DOM polling, and a toast that is already gone when
+the wait starts looks like a failure. :data:`TRACKER_JS` is installed on
+every new document through CDP ``Page.addScriptToEvaluateOnNewDocument``, so
+it runs before the page's scripts and sees every request the page makes.
+It hooks ``XMLHttpRequest`` and ``fetch`` and keeps the last
+:data:`KEEP` requests in ``window.__xhrLog``: method, URL, status, timings
+and, for JSON responses up to :data:`BODY_LIMIT` characters, the body.
+
+:func:`support.waits.api_response` (``BasePage.wait_for_api``) resolves once
+a request to an API path has completed, and hands back its JSON. Paths are
+relative to ``/api/v2/``, and ``{id}`` matches a numeric segment::
+
+    since = page.api_mark()
+    page.click(SUBMIT)
+    response = page.wait_for_api("pim/employees/{id}/job-details", "PUT", since=since)
+
+A mark taken with :meth:`XhrTracker.mark` restricts the wait to requests
+started after it, so an earlier call to the same endpoint does not count.
+"""
+import json
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+KEEP = 200
+BODY_LIMIT = 2_000_000
+
+TRACKER_JS = """
+(() => {
+    if (window.__xhrLog) return;
+    const log = window.__xhrLog = {doc: Math.random().toString(36).slice(2), seq: 0, inflight: 0, entries: []};
+    const start = (method, url) => {
+        let href = String(url);
+        try { href = new URL(href, location.href).href; } catch (e) {}
+        const entry = {seq: ++log.seq, method: String(method || 'GET').toUpperCase(), url: href,
+                       status: null, done: false, started: performance.now(), ended: null, body: null};
+        log.inflight++;
+        log.entries.push(entry);
+        if (log.entries.length > %(keep)d) log.entries.shift();
+        return entry;
+    };
+    const finish = (entry, status, type, text) => {
+        if (entry.done) return;
+        entry.status = status;
+        entry.ended = performance.now();
+        entry.done = true;
+        log.inflight = Math.max(0, log.inflight - 1);
+        if (type && type.includes('json') && text != null && text.length <= %(limit)d) entry.body = text;
+    };
+    const open = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__xhrRequest = [method, url];
+        return open.apply(this, arguments);
+    };
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        const [method, url] = this.__xhrRequest || ['GET', ''];
+        const entry = start(method, url);
+        this.addEventListener('loadend', () => {
+            let text = null;
+            try {
+                if (this.responseType === '' || this.responseType === 'text') text = this.responseText;
+                else if (this.responseType === 'json') text = JSON.stringify(this.response);
+            } catch (e) {}
+            finish(entry, this.status, this.getResponseHeader('content-type'), text);
+        });
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        const origFetch = window.fetch;
+        window.fetch = function (input, init) {
+            const url = typeof input === 'string' ? input : (input && input.url) || String(input);
+            const entry = start((init && init.method) || (input && input.method) || 'GET', url);
+            return origFetch.apply(this, arguments).then(res => {
+                const type = res.headers.get('content-type') || '';
+                if (type.includes('json')) {
+                    res.clone().text().then(text => finish(entry, res.status, type, text), () => finish(entry, res.status, type, null));
+                } else {
+                    finish(entry, res.status, type, null);
+                }
+                return res;
+            }, err => { finish(entry, 0, null, null); throw err; });
+        };
+    }
+})();
+""" % {"keep": KEEP, "limit": BODY_LIMIT}
+
+_MARK_JS = "const log = window.__xhrLog; return log ? {doc: log.doc, seq: log.seq} : null;"
+
+# Resolves with the first request to the endpoint started after ``since`` once
+# it has completed, or null after ``cap`` ms.
+WAIT_JS = """
+const pattern = new RegExp(arguments[0]), method = arguments[1], since = arguments[2], cap = arguments[3];
+const done = arguments[arguments.length - 1];
+const log = window.__xhrLog;
+if (!log) return done(null);
+const after = since && since.doc === log.doc ? since.seq : 0;
+const endpoint = url => {
+    let path = url;
+    try { path = new URL(url).pathname; } catch (e) {}
+    const i = path.indexOf('/api/v2/');
+    return i < 0 ? path : path.slice(i + 8);
+};
+const begin = performance.now();
+(function check() {
+    const entry = log.entries.find(e => e.seq > after && (!method || e.method === method) && pattern.test(endpoint(e.url)));
+    if (entry && entry.done) return done(entry);
+    if (performance.now() - begin >= cap) return done(null);
+    setTimeout(check, 25);
+})();
+"""
+
+
+def endpoint_pattern(path):
+    """Anchored regex source for an API path; ``{id}`` matches one numeric segment."""
+    parts = [re.escape(part) for part in path.strip("/").split("{id}")]
+    return "^" + r"\d+".join(parts) + "$"
+
+
+@dataclass
+class ApiResponse:
+    method: str
+    url: str
+    status: int
+    duration_ms: float
+    body: Optional[str] = None
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def json(self):
+        """The parsed response body; None when it was not JSON or over BODY_LIMIT."""
+        return json.loads(self.body) if self.body is not None else None
+
+    @classmethod
+    def from_entry(cls, entry):
+        return cls(entry["method"], entry["url"], int(entry["status"] or 0), round(entry["ended"] - entry["started"], 1), entry.get("body"))
+
+
+class XhrTracker:
+    """Keeps :data:`TRACKER_JS` installed on one browser; kept on the driver and reused across leases."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_JS})
+        # The current document predates the script; requests it already made are not seen.
+        driver.execute_script(TRACKER_JS)
+
+    @classmethod
+    def of(cls, driver):
+        tracker = getattr(driver, "_xhr_tracker", None)
+        if tracker is None:
+            tracker = driver._xhr_tracker = cls(driver)
+        return tracker
+
+    def mark(self):
+        """A position in the current document's log; pass it as ``since`` to skip earlier requests."""
+        return self.driver.execute_script(_MARK_JS)
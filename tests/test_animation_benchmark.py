@@ -0,0 +1,81 @@
+"""Dropdown open-to-clickable latency with and without animations (opt-in: BENCHMARK=1).
+
+Opens the Employment Status select on the PIM employee list
+BENCHMARK_DROPDOWN_OPENS times (default 20) with animations on and with the
+``support.animations`` script installed. Each sample runs from the click on
+the select until its first option is clickable (displayed and enabled: an
+option fading in from opacity 0 is not displayed yet). The two modes
+alternate in blocks of five opens, each block on a freshly loaded page.
+
+The figures belong to the server under test. With STANDIN=1 that is the
+stand-in, whose oxd.css copies the OXD animation timings; they are not
+measurements of the real OrangeHRM front end. Each row records which
+server it came from.
+
+p50/p95 rows are appended to ``tests/.cache/animation_benchmark.jsonl``.
+"""
+import json
+import os
+import time
+
+import pytest
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+
+from pages import EmployeeListPage
+from support import waits
+from support.animations import AnimationSwitch
+from support.durations import percentile
+from support.transfer_benchmark import benchmark_enabled
+from standin import standin_enabled
+
+pytestmark = pytest.mark.skipif(not benchmark_enabled(), reason="animation benchmark; set BENCHMARK=1 to run")
+
+RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "animation_benchmark.jsonl")
+MODES = {"animated": False, "still": True}
+BLOCK = 5
+# Finer than waits.POLL: the animation being measured lasts 150ms.
+SAMPLE_POLL = 0.005
+
+
+def _open_block(driver, page, still, count):
+    AnimationSwitch.of(driver).apply(still)
+    driver.refresh()
+    page.invalidate()
+    page.wait_ready()
+    assert driver.execute_script("return !!document.getElementById('__no-animations');") == still
+    latencies = []
+    for _ in range(count):
+        box = page.field("Employment Status", refresh=True)
+        start = time.perf_counter()
+        box.click()
+        WebDriverWait(driver, 10, poll_frequency=SAMPLE_POLL).until(waits.listbox_open())
+        latencies.append((time.perf_counter() - start) * 1000)
+        box.send_keys(Keys.ESCAPE)
+        WebDriverWait(driver, 10, poll_frequency=SAMPLE_POLL).until(lambda d: not d.find_elements(*waits.LISTBOX_OPTION))
+    return latencies
+
+
+def test_dropdown_open_latency(logged_in_driver):
+    opens = int(os.getenv("BENCHMARK_DROPDOWN_OPENS", "20"))
+    page = EmployeeListPage(logged_in_driver).navigate()
+    samples = {mode: [] for mode in MODES}
+    while any(len(values) < opens for values in samples.values()):
+        for mode, still in MODES.items():
+            count = min(BLOCK, opens - len(samples[mode]))
+            if count:
+                samples[mode] += _open_block(logged_in_driver, page, still, count)
+
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+    server = "standin" if standin_enabled() else "orangehrm"
+    with open(RESULTS, "a", encoding="utf-8") as f:
+        for mode, values in samples.items():
+            f.write(json.dumps({
+                "time": stamp, "headless": os.getenv("HEADLESS", "0"), "server": server, "mode": mode, "count": len(values),
+                "p50_ms": round(percentile(values, 50), 1), "p95_ms": round(percentile(values, 95), 1),
+            }) + "\n")
+
+    print(f"\ndropdown open -> option clickable (ms, {server})")
+    for mode, values in samples.items():
+        print(f"  {mode:<9} p50 {percentile(values, 50):6.1f}  p95 {percentile(values, 95):6.1f}  ({len(values)} opens)")
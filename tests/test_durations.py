@@ -0,0 +1,28 @@
+"""Regression detection of the duration store (no browser needed)."""
+from support.durations import DurationStore
+
+NODE = "test_pim_report.py::TestPimReport::test_define_report"
+
+
+def _run(run, steps, ts):
+    return [{"run": run, "ts": ts, "nodeid": NODE, "kind": "step", "name": name, "duration": duration} for name, duration in steps]
+
+
+class TestRegressions:
+    def test_repeated_step_name_is_compared_per_run(self, tmp_path):
+        store = DurationStore(str(tmp_path / "durations.jsonl"))
+        for n in range(6):
+            # The same step runs three times per test, as a step inside a loop does.
+            store.append(_run(f"r{n}", [("Adding display field", 1.0 + 0.01 * n)] * 3, ts=n))
+        store.append(_run("latest", [("Adding display field", 1.02)] * 3, ts=10))
+        assert store.regressions() == []
+
+    def test_slower_repeated_step_is_flagged(self, tmp_path):
+        store = DurationStore(str(tmp_path / "durations.jsonl"))
+        for n in range(6):
+            store.append(_run(f"r{n}", [("Adding display field", 1.0 + 0.01 * n)] * 3, ts=n))
+        store.append(_run("latest", [("Adding display field", 2.0)] * 3, ts=10))
+        [regression] = store.regressions()
+        assert regression.name == "Adding display field"
+        assert round(regression.duration, 2) == 6.0
+        assert 3.0 < regression.baseline_p50 < 3.2
@@ -0,0 +1,126 @@
+"""Upload/download throughput of the OrangeHRM file paths (opt-in: BENCHMARK=1).
+
+Every file input the suite uses gets generated files of each size in
+UPLOAD_SIZES (and, where a page takes several files, each count in
+BENCHMARK_FILE_COUNTS). Each transfer is timed per phase:
+
+* send_keys - handing the path to ``input[type='file']``
+* save_click - clicking Save / Post
+* toast - until the success toast shows (pages that stay put after saving)
+* row - until the record shows up: the attachment row, the Buzz post, or the
+  saved employee / candidate page
+* download - from clicking the link until CDP reports the download complete
+
+Results go to ``tests/.cache/transfer_benchmark.jsonl`` (see
+``support.transfer_benchmark``) and the terminal summary.
+"""
+import re
+
+import pytest
+
+from pages import AddEmployeePage, BuzzPage, PersonalDetailsPage, RecruitmentPage
+from support.transfer_benchmark import benchmark_counts, benchmark_enabled
+from support.unique import unique_id
+
+pytestmark = pytest.mark.skipif(not benchmark_enabled(), reason="file transfer benchmark; set BENCHMARK=1 to run")
+
+# OrangeHRM rejects profile photos over 1MB.
+PHOTO_LIMIT = 1024 * 1024
+TIMEOUT = 120
+
+
+def _record_id(driver):
+    """The numeric id at the end of the current URL (the record the form just created)."""
+    match = re.search(r"/(\d+)/?$", driver.current_url)
+    return int(match.group(1)) if match else None
+
+
+@pytest.fixture(params=benchmark_counts(), ids=lambda count: f"x{count}")
+def file_count(request):
+    return request.param
+
+
+class TestFileTransferBenchmark:
+    def test_attachment_upload_and_download(self, logged_in_driver, base_url, seed, assets, downloads, transfer_benchmark, upload_size, file_count):
+        employee = seed.employee(first_name=f"Bench{unique_id()}", last_name="Transfer")
+        attachments = PersonalDetailsPage(logged_in_driver, timeout=TIMEOUT).open(base_url, employee["empNumber"]).attachments
+        attachments.scroll_into_view()
+        files = [assets.create("pdf", upload_size, seed=n) for n in range(file_count)]
+
+        for n, asset in enumerate(files, start=1):
+            with transfer_benchmark.transfer("attachment", "upload", asset.size, file_count) as timer:
+                attachments.open_form()
+                with timer.phase("send_keys"):
+                    attachments.choose_file(asset.path)
+                with timer.phase("save_click"):
+                    attachments.submit()
+                with timer.phase("toast"):
+                    assert attachments.wait_toast(), f"no toast after saving attachment {n}"
+                with timer.phase("row"):
+                    assert attachments.wait_rows(n), f"attachment {n} not listed"
+
+        downloaded = set()
+        for n, asset in enumerate(files, start=1):
+            with transfer_benchmark.transfer("attachment", "download", asset.size, file_count) as timer:
+                with timer.phase("download"):
+                    attachments.link(n).click()
+                    download = downloads.wait(timeout=TIMEOUT)
+            downloaded.add(download.sha256())
+        assert downloaded == {asset.sha256 for asset in files}, "downloaded attachments differ from the uploads"
+
+    def test_employee_photo_upload(self, logged_in_driver, seed, assets, transfer_benchmark, upload_size):
+        if upload_size > PHOTO_LIMIT:
+            pytest.skip("OrangeHRM rejects profile photos over 1MB")
+        photo = assets.create("png", upload_size)
+        add_employee = AddEmployeePage(logged_in_driver, timeout=TIMEOUT).navigate()
+        employee_id = unique_id("B")
+        add_employee.fill_details(f"Bench{employee_id}", "Photo", employee_id)
+
+        with transfer_benchmark.transfer("photo", "upload", photo.size) as timer:
+            with timer.phase("send_keys"):
+                assert add_employee.upload_photo(photo.path), "photo file input not found"
+            with timer.phase("save_click"):
+                add_employee.submit()
+            with timer.phase("row"):
+                assert add_employee.wait_saved(), "employee with photo not saved"
+        emp_number = _record_id(logged_in_driver)
+        if emp_number is not None:
+            seed.created["employees"].append(emp_number)
+
+    def test_candidate_resume_upload(self, logged_in_driver, seed, assets, transfer_benchmark, upload_size):
+        vacancy = seed.vacancy()
+        resume = assets.create("pdf", upload_size)
+        add_candidate = RecruitmentPage(logged_in_driver, timeout=TIMEOUT).navigate().open_add_candidate()
+        suffix = unique_id()
+        add_candidate.fill(
+            f"Bench{suffix}", "Resume", "Transfer", f"bench.{suffix}@example.com",
+            "1234567890", "benchmark", "Resume upload benchmark.", vacancy=vacancy["name"],
+        )
+
+        with transfer_benchmark.transfer("resume", "upload", resume.size) as timer:
+            with timer.phase("send_keys"):
+                assert add_candidate.attach(resume.path), "resume file input not found"
+            with timer.phase("save_click"):
+                add_candidate.submit()
+            with timer.phase("row"):
+                add_candidate.wait_saved()
+        candidate_id = _record_id(logged_in_driver)
+        if candidate_id is not None:
+            seed.created["candidates"].append(candidate_id)
+
+    def test_buzz_image_upload(self, logged_in_driver, assets, transfer_benchmark, upload_size, file_count):
+        buzz = BuzzPage(logged_in_driver, timeout=TIMEOUT).navigate()
+        for n in range(file_count):
+            image = assets.create("jpeg", upload_size, seed=n)
+            message = f"Transfer benchmark {unique_id()}"
+            buzz.compose(message)
+            with transfer_benchmark.transfer("buzz", "upload", image.size, file_count) as timer:
+                with timer.phase("send_keys"):
+                    assert buzz.attach_image(image.path), "Buzz image input not found"
+                with timer.phase("save_click"):
+                    buzz.submit()
+                with timer.phase("toast"):
+                    assert buzz.wait_toast(), "no toast after posting"
+                with timer.phase("row"):
+                    post = buzz.post(message)
+            post.delete()
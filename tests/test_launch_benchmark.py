@@ -0,0 +1,84 @@
+"""Cold launch and first-paint times per launch profile (opt-in: BENCHMARK=1).
+
+Every launch profile in ``support.launch_profile.PROFILES`` is started
+BENCHMARK_LAUNCHES times (default 5), alternating between profiles so that
+machine noise hits both evenly. Each profile first gets one unrecorded
+warm-up launch, which also builds the fast profile's template. Per launch:
+
+* launch - from ``launch_chrome`` until the driver is usable
+* first_paint / first_contentful_paint - the paint timings of the login page
+* login_ready - from ``driver.get`` until the username field is present
+
+p50/p95 rows are appended to ``tests/.cache/launch_benchmark.jsonl``.
+"""
+import json
+import os
+import time
+from collections import defaultdict
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support.browser import launch_chrome, quit_chrome
+from support.durations import percentile
+from support.launch_profile import PROFILES
+from support.transfer_benchmark import benchmark_enabled
+
+pytestmark = pytest.mark.skipif(not benchmark_enabled(), reason="launch benchmark; set BENCHMARK=1 to run")
+
+RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "launch_benchmark.jsonl")
+PAINT_JS = "return Object.fromEntries(performance.getEntriesByType('paint').map(e => [e.name, e.startTime]));"
+
+
+def _launch_once(profile, driver_path, download_dir, base_url):
+    start = time.perf_counter()
+    driver = launch_chrome(download_dir, driver_path, profile=profile)
+    launched = time.perf_counter()
+    try:
+        driver.get(f"{base_url}/web/index.php/auth/login")
+        WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.NAME, "username")))
+        ready = time.perf_counter()
+        paints = driver.execute_script(PAINT_JS)
+    finally:
+        quit_chrome(driver)
+    return {
+        "launch": (launched - start) * 1000,
+        "first_paint": paints.get("first-paint", float("nan")),
+        "first_contentful_paint": paints.get("first-contentful-paint", float("nan")),
+        "login_ready": (ready - launched) * 1000,
+    }
+
+
+def test_launch_profiles(chromedriver, base_url, tmp_path):
+    launches = int(os.getenv("BENCHMARK_LAUNCHES", "5"))
+    for profile in PROFILES:
+        _launch_once(profile, chromedriver.path, str(tmp_path / "warmup"), base_url)
+
+    samples = {profile: defaultdict(list) for profile in PROFILES}
+    for n in range(launches):
+        for profile in PROFILES:
+            for name, value in _launch_once(profile, chromedriver.path, str(tmp_path / str(n)), base_url).items():
+                if value == value:  # no paint entry -> NaN, left out
+                    samples[profile][name].append(value)
+
+    rows = [
+        {"profile": profile, "metric": name, "count": len(values),
+         "p50_ms": round(percentile(values, 50), 1), "p95_ms": round(percentile(values, 95), 1)}
+        for profile, metrics in samples.items() for name, values in metrics.items()
+    ]
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+    with open(RESULTS, "a", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps({"time": stamp, "headless": os.getenv("HEADLESS", "0"), **row}) + "\n")
+
+    print(f"\n{'metric':<24}" + "".join(f"{profile:>16}" for profile in PROFILES) + "  (p50 / p95 ms)")
+    for name in samples[PROFILES[0]]:
+        cells = []
+        for profile in PROFILES:
+            values = samples[profile].get(name, [])
+            cells.append(f"{percentile(values, 50):.0f} / {percentile(values, 95):.0f}" if values else "-")
+        print(f"{name:<24}" + "".join(f"{cell:>16}" for cell in cells))
+    assert all(samples[profile]["launch"] for profile in PROFILES)